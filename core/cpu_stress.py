@@ -13,6 +13,8 @@ What makes this different from every other benchmark:
   MANDELBROT TURBINE — randomises the viewport and escape parameters each
                        pass. The branchy, data-dependent loop defeats branch
                        predictors in a way regular matrix work never does.
+                       Tiles iterate only their still-live points, so the
+                       score is pixel-iterations/s, not allocator churn.
 
   RECURSIVE TENSOR FOLD — builds a binary tree of numpy arrays and folds
                        them with alternating einsum contractions. Pointer-
@@ -20,118 +22,345 @@ What makes this different from every other benchmark:
 
   PRIME SIEVE RACE  — each worker sieves a unique number range with a
                        segmented Eratosthenes, then XORs results into the
-                       shared arena to force cache-line invalidation.
+                       shared arena to force cache-line invalidation. The
+                       NumPy engine caches base primes and strikes odd-only
+                       segments with strided slices; the original pure-Python
+                       kernel runs alongside as the "interpreter" variant.
 
   FFT               — 1M-point complex FFT feeding results into the arena.
+
+Workers live in a WorkerPool: spawned, pinned and warmed once, then handed
+one timed window per phase over their pipes, so process start-up, NumPy
+import and buffer allocation stay outside every measurement.
 """
 
 import math
 import multiprocessing as mp
 import multiprocessing.shared_memory as shm
+import itertools
 import os
-import struct
+import threading
 import time
+from abc import ABC, abstractmethod
+from multiprocessing import resource_tracker
 from multiprocessing.connection import Connection
 
 import numpy as np
 
+from core import placement
+from core.profiler import StackSampler
+from core.histogram import LatencyHistogram
+from core.steady_state import SteadyStateMonitor
+
 
 # Shared memory arena — forces cross-core cache coherency traffic
 # Uses shared_memory (picklable) instead of mmap so it survives spawn on macOS.
+#
+# Each worker attaches once and keeps a uint32 memoryview over the arena for
+# its whole lifetime, so the per-op cost is a load/xor/store on a shared cache
+# line rather than shm_open + mmap + munmap. Where each worker's slots land is
+# chosen by the contention topology:
+#
+#   shared         — every worker rotates over the same 64-byte line.
+#   false_sharing  — each worker owns one word, neighbours share a line.
+#   padded         — each worker owns a line, 128 bytes apart (defeats the
+#                    adjacent-line prefetcher pairing two workers).
+#   numa           — each worker owns a page, first touched by that worker so
+#                    the kernel places it on the worker's local node. This is
+#                    node-local first touch, not explicit binding: it only
+#                    lands locally when workers are pinned (see placement).
+
+ARENA_BYTES = 4096  # one page; the minimum arena size
+CACHE_LINE  = 64
+
+TOPOLOGIES = ("shared", "false_sharing", "padded", "numa")
+
+_LINE_WORDS = CACHE_LINE // 4
+_PAD_WORDS  = 2 * _LINE_WORDS
+_PAGE_WORDS = ARENA_BYTES // 4
+
+# (arena name, worker index, topology) — plain tuple so it pickles under spawn.
+ArenaSpec = tuple[str, int, str]
+
+
+def _arena_bytes(topology: str, workers: int) -> int:
+    if topology == "padded":
+        needed = workers * _PAD_WORDS * 4
+    elif topology == "numa":
+        needed = workers * ARENA_BYTES
+    else:
+        needed = ARENA_BYTES
+    return max(ARENA_BYTES, -(-needed // ARENA_BYTES) * ARENA_BYTES)
+
+
+def _slot_layout(topology: str, index: int) -> tuple[int, int]:
+    """Return (first word, number of words rotated over) for one worker."""
+    if topology == "shared":
+        return 0, _LINE_WORDS
+    if topology == "false_sharing":
+        return index % _LINE_WORDS, 1
+    if topology == "padded":
+        return index * _PAD_WORDS, _LINE_WORDS
+    if topology == "numa":
+        return index * _PAGE_WORDS, _LINE_WORDS
+    raise ValueError(f"unknown arena topology: {topology!r}")
+
+
+class _Arena:
+    """A worker's lifetime attachment to the shared arena."""
+
+    def __init__(self, spec: ArenaSpec) -> None:
+        name, index, topology = spec
+        self._mem = shm.SharedMemory(name=name)
+        self._words = self._mem.buf.cast("I")
+        self._base, self._span = _slot_layout(topology, index)
+        self._op = 0
+
+    def xor(self, value: int) -> None:
+        """XOR *value* into this worker's next slot."""
+        i = self._base + self._op % self._span
+        self._words[i] ^= value & 0xFFFFFFFF
+        self._op += 1
+
+    def close(self) -> None:
+        # The view must be released before the mapping can be closed.
+        self._words.release()
+        self._mem.close()
+
+
+# Run control block — one per timed window. Word 0 is the stop flag the
+# parent raises to end the window early. Each worker then owns a region
+# starting on its own cache line:
+#
+#   word 0        running op count, stored after every op
+#   word 1        number of samples ever written to the ring
+#   words 8..     ring of (ns since the worker's start, op count) pairs,
+#                 appended every SAMPLE_INTERVAL_S
+#
+# The parent only reads: it drains new ring entries about once a second, so
+# a worker never blocks on, or pickles anything for, its time series.
+
+SAMPLE_INTERVAL_S = 0.25
+RING_SLOTS        = 64    # 16 s of samples between drains
+
+_CTL_STRIDE  = CACHE_LINE // 8
+_CTL_REGION  = _CTL_STRIDE + 2 * RING_SLOTS
+
+# (control block name, worker index)
+ControlSpec = tuple[str, int]
+
+
+def _ctl_region(index: int) -> int:
+    return _CTL_STRIDE + index * _CTL_REGION
+
+
+class _RunControl:
+    """Parent side of a run control block."""
+
+    def __init__(self, processes: int) -> None:
+        self._processes = processes
+        self._mem = shm.SharedMemory(create=True, size=(_CTL_STRIDE + processes * _CTL_REGION) * 8)
+        self._words = self._mem.buf.cast("Q")
+        self._words[0] = 0
+        self._seen = [0] * processes
+        self._last_t = [0] * processes
+
+    @property
+    def name(self) -> str:
+        return self._mem.name
+
+    def total(self) -> int:
+        """Ops completed so far, summed over all workers."""
+        words = self._words
+        return sum(words[_ctl_region(i)] for i in range(self._processes))
+
+    def drain(self) -> list[list[tuple[int, int]]]:
+        """Per worker, the (ns, ops) samples written since the last drain."""
+        words = self._words
+        out: list[list[tuple[int, int]]] = []
+        for i in range(self._processes):
+            base = _ctl_region(i)
+            head = words[base + 1]
+            first = max(self._seen[i], head - RING_SLOTS)
+            samples: list[tuple[int, int]] = []
+            for k in range(first, head):
+                slot = base + _CTL_STRIDE + 2 * (k % RING_SLOTS)
+                t, ops = words[slot], words[slot + 1]
+                # Stores are not ordered across processes on every CPU;
+                # a torn or stale entry shows up as time going backwards.
+                if t > self._last_t[i]:
+                    samples.append((t, ops))
+                    self._last_t[i] = t
+            self._seen[i] = head
+            out.append(samples)
+        return out
+
+    def halt(self) -> None:
+        self._words[0] = 1
 
-ARENA_BYTES = 4096  # one page; every worker hammers it
+    def close(self) -> None:
+        self._words.release()
+        self._mem.close()
+        self._mem.unlink()
 
 
-def _arena_xor(name: str, slot: int, value: int) -> None:
-    """XOR a 4-byte slot in the named shared arena."""
-    mem    = shm.SharedMemory(name=name)
-    offset = (slot % (ARENA_BYTES // 4)) * 4
-    current = struct.unpack_from("I", mem.buf, offset)[0]
-    struct.pack_into("I", mem.buf, offset, (current ^ value) & 0xFFFFFFFF)
-    mem.close()
+def _bucket_series(samples: list[tuple[int, int]], interval_ns: int, series: list[float]) -> None:
+    """Add one worker's ops/s, spread over fixed buckets, into *series* (in place).
+
+    Each sample-to-sample interval contributes its rate to every bucket it
+    overlaps, weighted by the overlap, so a slow op spanning several
+    buckets is spread across them rather than landing as one spike.
+    """
+    prev_t, prev_ops = 0, 0
+    for t, ops in samples:
+        if t <= prev_t:
+            continue
+        rate = (ops - prev_ops) / ((t - prev_t) / 1e9)
+        for b in range(prev_t // interval_ns, (t - 1) // interval_ns + 1):
+            overlap = min(t, (b + 1) * interval_ns) - max(prev_t, b * interval_ns)
+            if b >= len(series):
+                series.extend([0.0] * (b + 1 - len(series)))
+            series[b] += rate * overlap / interval_ns
+        prev_t, prev_ops = t, ops
+
+
+# Workloads
+#
+# Each workload is an object built once per pool process — that is where
+# NumPy gets imported and the big buffers get allocated — and then stepped
+# inside the timed window for as many phases as the pool is asked to run.
+# step() is one op; it must XOR something into the arena.
+
+class _Workload(ABC):
+    kind = "unknown"
+
+    def reset(self) -> None:
+        """Clear per-run counters before a new timed window."""
+
+    @abstractmethod
+    def step(self, arena: _Arena) -> None:
+        """One op; XORs its result into *arena*."""
+
+    def stats(self) -> dict:
+        """Extra per-run fields merged into the worker's report."""
+        return {}
 
 
 # Worker 1 — Chaos Matrix (BLAS + arena writes)
 
-def _chaos_matrix_worker(duration: float, conn: Connection, arena_name: str) -> None:
-    size = 1024
-    a = np.random.rand(size, size).astype("float32")
-    b = np.random.rand(size, size).astype("float32")
-    ops = 0
-    end = time.perf_counter() + duration
+class _ChaosMatrix(_Workload):
+    kind = "chaos_matrix"
 
-    try:
-        while time.perf_counter() < end:
-            c = np.dot(a, b)
-            _arena_xor(arena_name, ops % 64, int(c[0, 0] * 1e6) & 0xFFFFFFFF)
-            # Rotate inputs so the CPU cannot cache the answer.
-            a = c[:size, :size]
-            b = np.roll(b, 1, axis=0)
-            ops += 1
-    except Exception as exc:
-        conn.send({"error": str(exc), "type": "chaos_matrix", "ops": ops})
-    else:
-        conn.send({"ops": ops, "type": "chaos_matrix"})
-    finally:
-        conn.close()
+    def __init__(self) -> None:
+        size = 1024
+        self._a = np.random.rand(size, size).astype("float32")
+        self._b = np.random.rand(size, size).astype("float32")
+
+    def step(self, arena: _Arena) -> None:
+        c = np.dot(self._a, self._b)
+        arena.xor(int(c[0, 0] * 1e6))
+        # Rotate inputs so the CPU cannot cache the answer. Renormalise too:
+        # the state now outlives a phase, and repeated products overflow to inf.
+        c *= 1.0 / float(c.max())
+        self._a = c
+        self._b = np.roll(self._b, 1, axis=0)
 
 
 # Worker 2 — Entropy Mill (RNG + AES-NI / hardware entropy path)
 
-def _entropy_mill_worker(duration: float, conn: Connection, arena_name: str) -> None:
-    ops = 0
+class _EntropyMill(_Workload):
+    kind = "entropy_mill"
     chunk = 65536
-    end = time.perf_counter() + duration
 
-    try:
-        while time.perf_counter() < end:
-            raw = os.urandom(chunk)
-            arr = np.frombuffer(raw, dtype=np.uint8).astype(np.uint32)
-            checksum = int(np.bitwise_xor.reduce(arr))
-            _arena_xor(arena_name, (ops + 32) % 64, checksum)
-            ops += 1
-    except Exception as exc:
-        conn.send({"error": str(exc), "type": "entropy_mill", "ops": ops})
-    else:
-        conn.send({"ops": ops, "type": "entropy_mill"})
-    finally:
-        conn.close()
+    def step(self, arena: _Arena) -> None:
+        raw = os.urandom(self.chunk)
+        arr = np.frombuffer(raw, dtype=np.uint8).astype(np.uint32)
+        arena.xor(int(np.bitwise_xor.reduce(arr)))
 
 
 # Worker 3 — Mandelbrot Turbine (branch-heavy, data-dependent)
+#
+# The frame is walked in cache-sized tiles. Inside a tile only still-live
+# points are iterated: real and imaginary parts sit in separate float64
+# arrays, every update is an in-place ufunc into preallocated scratch, and
+# escape is a squared-magnitude test. When points escape, the live set is
+# compacted, so the work per iteration shrinks as the tile resolves.
 
-def _mandelbrot_worker(duration: float, conn: Connection, arena_name: str) -> None:
-    ops = 0
+MANDEL_TILE = 128  # 128x128 points x 8 B ≈ 128 KB per array; the tile's set fits L2
+
+
+def _mandelbrot_tile(cr: np.ndarray, ci: np.ndarray, max_iter: int, scratch: tuple) -> int:
+    """Iterate one tile of c values; return its pixel-iterations (= sum of escape counts)."""
+    n = cr.size
+    zr2_buf, zi2_buf, mag_buf, live_buf = scratch
+    zr = np.zeros(n)
+    zi = np.zeros(n)
+    pixel_iters = 0
+
+    for _ in range(max_iter):
+        zr2 = np.multiply(zr, zr, out=zr2_buf[:n])
+        zi2 = np.multiply(zi, zi, out=zi2_buf[:n])
+        mag = np.add(zr2, zi2, out=mag_buf[:n])
+        live = np.less_equal(mag, 4.0, out=live_buf[:n])
+        alive = int(np.count_nonzero(live))
+        if alive < n:
+            if not alive:
+                break
+            zr, zi, cr, ci = zr[live], zi[live], cr[live], ci[live]
+            zr2, zi2 = zr2[live], zi2[live]
+            n = alive
+        pixel_iters += n
+        # z = z² + c, written back in place: zi first (it needs the old zr).
+        np.multiply(zr, zi, out=zi)
+        np.multiply(zi, 2.0, out=zi)
+        np.add(zi, ci, out=zi)
+        np.subtract(zr2, zi2, out=zr)
+        np.add(zr, cr, out=zr)
+
+    return pixel_iters
+
+
+def _mandelbrot_frame(cx: float, cy: float, scale: float, width: int, height: int, max_iter: int, scratch: tuple) -> int:
+    x = np.linspace(cx, cx + scale, width, dtype=np.float64)
+    y = np.linspace(cy, cy + scale, height, dtype=np.float64)
+    pixel_iters = 0
+
+    for r0 in range(0, height, MANDEL_TILE):
+        ys = y[r0 : r0 + MANDEL_TILE]
+        for c0 in range(0, width, MANDEL_TILE):
+            xs = x[c0 : c0 + MANDEL_TILE]
+            cr = np.tile(xs, ys.size)
+            ci = np.repeat(ys, xs.size)
+            pixel_iters += _mandelbrot_tile(cr, ci, max_iter, scratch)
+
+    return pixel_iters
+
+
+class _Mandelbrot(_Workload):
+    kind = "mandelbrot"
     width, height = 512, 512
     max_iter = 256
-    end = time.perf_counter() + duration
-    rng = np.random.default_rng()
 
-    try:
-        while time.perf_counter() < end:
-            cx = rng.uniform(-2.5, 1.0)
-            cy = rng.uniform(-1.25, 1.25)
-            scale = rng.uniform(0.001, 0.5)
-
-            x = np.linspace(cx, cx + scale, width, dtype=np.float64)
-            y = np.linspace(cy, cy + scale, height, dtype=np.float64)
-            C = x[np.newaxis, :] + 1j * y[:, np.newaxis]
-            Z = np.zeros_like(C)
-            M = np.zeros(C.shape, dtype=np.int32)
-
-            for i in range(max_iter):
-                mask = np.abs(Z) <= 2.0
-                Z[mask] = Z[mask] ** 2 + C[mask]
-                M[mask] += 1
-
-            _arena_xor(arena_name, ops % 64, int(M.sum()) & 0xFFFFFFFF)
-            ops += 1
-    except Exception as exc:
-        conn.send({"error": str(exc), "type": "mandelbrot", "ops": ops})
-    else:
-        conn.send({"ops": ops, "type": "mandelbrot"})
-    finally:
-        conn.close()
+    def __init__(self) -> None:
+        points = MANDEL_TILE * MANDEL_TILE
+        self._scratch = (np.empty(points), np.empty(points), np.empty(points), np.empty(points, dtype=np.bool_))
+        self._rng = np.random.default_rng()
+        self._pixel_iters = 0
+
+    def reset(self) -> None:
+        self._pixel_iters = 0
+
+    def step(self, arena: _Arena) -> None:
+        cx = self._rng.uniform(-2.5, 1.0)
+        cy = self._rng.uniform(-1.25, 1.25)
+        scale = self._rng.uniform(0.001, 0.5)
+
+        frame_iters = _mandelbrot_frame(cx, cy, scale, self.width, self.height, self.max_iter, self._scratch)
+        self._pixel_iters += frame_iters
+        arena.xor(frame_iters)
+
+    def stats(self) -> dict:
+        return {"pixel_iters": self._pixel_iters}
 
 
 # Worker 4 — Recursive Tensor Fold (pointer-chasing heap stress)
@@ -152,27 +381,26 @@ def _fold_tree(node) -> np.ndarray:
     return left + right[: left.shape[0], : left.shape[1]]
 
 
-def _tensor_fold_worker(duration: float, conn: Connection, arena_name: str) -> None:
-    ops = 0
-    end = time.perf_counter() + duration
+class _TensorFold(_Workload):
+    kind = "tensor_fold"
 
-    try:
-        while time.perf_counter() < end:
-            tree = _build_tree(depth=3, size=64)
-            result = _fold_tree(tree)
-            _arena_xor(arena_name, (ops + 16) % 64, int(abs(result[0, 0]) * 1e6) & 0xFFFFFFFF)
-            ops += 1
-    except Exception as exc:
-        conn.send({"error": str(exc), "type": "tensor_fold", "ops": ops})
-    else:
-        conn.send({"ops": ops, "type": "tensor_fold"})
-    finally:
-        conn.close()
+    def step(self, arena: _Arena) -> None:
+        tree = _build_tree(depth=3, size=64)
+        result = _fold_tree(tree)
+        arena.xor(int(abs(result[0, 0]) * 1e6))
 
 
 # Worker 5 — Segmented Sieve Race (integer ALU + cache-line invalidation)
+#
+# Two engines race the same windows. The NumPy engine is the real ALU
+# workload; the interpreter kernel is the original pure-Python sieve, kept
+# under its own name because what it measures is CPython bytecode dispatch.
+
+SIEVE_SEGMENT = 1 << 18  # odd candidates per window: 256 KB of flags, L2-sized
+
 
 def _segmented_sieve(low: int, high: int) -> int:
+    """Interpreter kernel: count primes in [low, high] with pure-Python loops."""
     limit = int(math.isqrt(high)) + 1
     small_primes: list[int] = []
     sieve = bytearray([1]) * limit
@@ -195,134 +423,832 @@ def _segmented_sieve(low: int, high: int) -> int:
     return sum(segment)
 
 
-def _sieve_race_worker(duration: float, conn: Connection, arena_name: str) -> None:
-    ops = 0
-    found = 0
-    base = (os.getpid() % 1000) * 10 ** 6 + 10 ** 7
+class _SieveEngine:
+    """Odd-only segmented sieve with base primes cached across windows.
+
+    Slot i of the segment stands for the odd number lo + 2i, so even
+    numbers are never stored or marked. Composites are struck with one
+    strided slice assignment per base prime.
+    """
+
+    def __init__(self, segment: int = SIEVE_SEGMENT) -> None:
+        self._segment = np.empty(segment, dtype=np.bool_)
+        self._base_primes = np.empty(0, dtype=np.int64)  # odd primes only
+        self._base_limit = 1
+
+    def _ensure_base(self, limit: int) -> None:
+        if limit <= self._base_limit:
+            return
+        # Grow geometrically so a drifting window re-sieves the base rarely.
+        limit = max(limit, 2 * self._base_limit)
+        flags = np.ones(limit + 1, dtype=np.bool_)
+        flags[:2] = False
+        flags[4::2] = False
+        for p in range(3, math.isqrt(limit) + 1, 2):
+            if flags[p]:
+                flags[p * p :: 2 * p] = False
+        self._base_primes = np.flatnonzero(flags)[1:]  # drop 2
+        self._base_limit = limit
+
+    def count(self, low: int, high: int) -> int:
+        """Count primes in [low, high]; the window must fit one segment."""
+        lo = low | 1
+        if high < lo:
+            return int(low <= 2 <= high)
+        n = (high - lo) // 2 + 1
+        if n > len(self._segment):
+            raise ValueError(f"window of {n} odd candidates exceeds segment size {len(self._segment)}")
+
+        self._ensure_base(math.isqrt(high))
+        seg = self._segment[:n]
+        seg.fill(True)
+        for p in self._base_primes.tolist():
+            pp = p * p
+            if pp > high:
+                break
+            start = max(pp, -(-lo // p) * p)
+            if not start & 1:
+                start += p
+            seg[(start - lo) // 2 :: p] = False
+        if lo == 1:
+            seg[0] = False
+        return int(np.count_nonzero(seg)) + int(low <= 2 <= high)
+
+
+class _Sieve(_Workload):
     window = 50_000
-    end = time.perf_counter() + duration
 
-    try:
-        low = base
-        while time.perf_counter() < end:
-            count = _segmented_sieve(low, low + window)
-            found += count
-            _arena_xor(arena_name, ops % 64, count & 0xFFFFFFFF)
-            low += window
-            ops += 1
-    except Exception as exc:
-        conn.send({"error": str(exc), "type": "sieve_race", "ops": ops, "found": found})
-    else:
-        conn.send({"ops": ops, "found": found, "type": "sieve_race"})
-    finally:
-        conn.close()
+    def __init__(self) -> None:
+        self._low = (os.getpid() % 1000) * 10 ** 6 + 10 ** 7
+        self._found = 0
+
+    @abstractmethod
+    def count(self, low: int, high: int) -> int:
+        """Primes in [low, high]."""
+
+    def reset(self) -> None:
+        self._found = 0
+
+    def step(self, arena: _Arena) -> None:
+        primes = self.count(self._low, self._low + self.window - 1)
+        self._found += primes
+        arena.xor(primes)
+        self._low += self.window
+
+    def stats(self) -> dict:
+        return {"found": self._found}
+
+
+class _SieveRace(_Sieve):
+    kind = "sieve_race"
+    window = 2 * SIEVE_SEGMENT
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._engine = _SieveEngine()
+
+    def count(self, low: int, high: int) -> int:
+        return self._engine.count(low, high)
+
+
+class _SieveInterpreter(_Sieve):
+    kind = "sieve_interpreter"
+
+    def count(self, low: int, high: int) -> int:
+        return _segmented_sieve(low, high)
 
 
 # Worker 6 — FFT (feeds into arena)
 
-def _fft_worker(duration: float, conn: Connection, arena_name: str) -> None:
-    buf = np.random.rand(1 << 20).astype("complex64")
+class _FFT(_Workload):
+    kind = "fft"
+
+    def __init__(self) -> None:
+        self._buf = np.random.rand(1 << 20).astype("complex64")
+
+    def step(self, arena: _Arena) -> None:
+        result = np.fft.fft(self._buf)
+        arena.xor(int(abs(result[0]) * 1e6))
+
+
+# Coherency probe — nothing but arena traffic, used to price the topology
+
+class _ArenaProbe(_Workload):
+    kind = "arena_probe"
+    batch = 1024  # writes per step, so the loop is mostly stores, not clock reads
+
+    def __init__(self) -> None:
+        self._writes = 0
+
+    def reset(self) -> None:
+        self._writes = 0
+
+    def step(self, arena: _Arena) -> None:
+        writes = self._writes
+        for i in range(writes, writes + self.batch):
+            arena.xor(i)
+        self._writes = writes + self.batch
+
+    def stats(self) -> dict:
+        return {"writes": self._writes}
+
+
+# Workload registry
+
+_WORKERS = [
+    (_ChaosMatrix,       "Chaos Matrix"),
+    (_EntropyMill,       "Entropy Mill"),
+    (_Mandelbrot,        "Mandelbrot Turbine"),
+    (_TensorFold,        "Recursive Tensor Fold"),
+    (_SieveRace,         "Prime Sieve Race"),
+    (_FFT,               "FFT"),
+    (_SieveInterpreter,  "Prime Sieve Race (interpreter)"),
+]
+
+_SUBTEST_NAMES = [name for _, name in _WORKERS]
+
+
+# Pool processes
+
+def _timed_run(workload: _Workload, duration: float, arena: _Arena, control: ControlSpec) -> dict:
     ops = 0
-    end = time.perf_counter() + duration
+    hist = LatencyHistogram()
+    error: str | None = None
+    workload.reset()
+
+    ctl_name, index = control
+    ctl_mem = shm.SharedMemory(name=ctl_name)
+    ctl = ctl_mem.buf.cast("Q")
+    slot = _ctl_region(index)
+    ring = slot + _CTL_STRIDE
+    head = 0
+    interval = int(SAMPLE_INTERVAL_S * 1e9)
+
+    started = time.perf_counter_ns()
+    end = started + int(duration * 1e9)
+    next_sample = started + interval
 
     try:
-        while time.perf_counter() < end:
-            result = np.fft.fft(buf)
-            _arena_xor(arena_name, (ops + 48) % 64, int(abs(result[0]) * 1e6) & 0xFFFFFFFF)
+        t0 = started
+        while t0 < end:
+            workload.step(arena)
             ops += 1
+            ctl[slot] = ops
+            t1 = time.perf_counter_ns()
+            hist.record(t1 - t0)
+            t0 = t1
+            if t1 >= next_sample:
+                k = ring + 2 * (head % RING_SLOTS)
+                ctl[k] = t1 - started
+                ctl[k + 1] = ops
+                head += 1
+                ctl[slot + 1] = head
+                next_sample += interval * ((t1 - next_sample) // interval + 1)
+            if ctl[0]:
+                break
     except Exception as exc:
-        conn.send({"error": str(exc), "type": "fft", "ops": ops})
-    else:
-        conn.send({"ops": ops, "type": "fft"})
+        error = str(exc)
     finally:
-        conn.close()
+        # Close the series with the partial interval since the last sample.
+        k = ring + 2 * (head % RING_SLOTS)
+        ctl[k] = time.perf_counter_ns() - started
+        ctl[k + 1] = ops
+        ctl[slot + 1] = head + 1
+        ctl.release()
+        ctl_mem.close()
 
+    msg = {
+        "ops": ops,
+        "type": workload.kind,
+        "elapsed_s": (time.perf_counter_ns() - started) / 1e9,
+        "latency": hist,
+        **workload.stats(),
+    }
+    if error is not None:
+        msg["error"] = error
+    return msg
 
-# Workload registry
 
-_WORKERS = [
-    (_chaos_matrix_worker, "Chaos Matrix"),
-    (_entropy_mill_worker, "Entropy Mill"),
-    (_mandelbrot_worker,   "Mandelbrot Turbine"),
-    (_tensor_fold_worker,  "Recursive Tensor Fold"),
-    (_sieve_race_worker,   "Prime Sieve Race"),
-    (_fft_worker,          "FFT"),
-]
+def _serve(cpu: int | None, warm: type, conn: Connection) -> None:
+    """Pool process: pin, build the warm workload, then run phases on command.
 
-_SUBTEST_NAMES = [name for _, name in _WORKERS]
+    Protocol over the duplex pipe, per run: parent sends
+    ("run", id, workload class, duration, arena spec, control spec,
+    profile interval); the worker builds or
+    reuses the workload, attaches the arena and answers ("ready", id); the
+    parent sends ("go", id) once every worker is ready; the worker runs the
+    timed window and sends its result dict tagged with "run": id. With a
+    non-zero profile interval the window is stack-sampled and the profile
+    rides along under "profile".
+    """
+    placement.pin(cpu)
+    workloads: dict[type, _Workload] = {}
+    try:
+        workloads[warm] = warm()
+    except Exception:
+        pass  # surfaces as an error on the first run that needs it
+    conn.send(("warm", os.getpid()))
 
+    while True:
+        try:
+            cmd = conn.recv()
+        except EOFError:
+            break
+        if cmd[0] == "exit":
+            break
 
-# CPUStress
+        _, run_id, cls, duration, spec, control, profile_s = cmd
+        workload: _Workload | None = None
+        arena: _Arena | None = None
+        error: str | None = None
+        try:
+            workload = workloads.get(cls) or workloads.setdefault(cls, cls())
+            arena = _Arena(spec)
+        except Exception as exc:
+            error = str(exc)
 
-class CPUStress:
-    def __init__(self) -> None:
+        conn.send(("ready", run_id))
+        conn.recv()  # ("go", run_id)
+
+        if error is None:
+            sampler = StackSampler(profile_s) if profile_s > 0 else None
+            if sampler is not None:
+                sampler.start()
+            try:
+                msg = _timed_run(workload, duration, arena, control)
+            finally:
+                arena.close()
+                if sampler is not None:
+                    profile = sampler.stop()
+            if sampler is not None:
+                msg["profile"] = profile
+        else:
+            if arena is not None:
+                arena.close()
+            msg = {"error": error, "type": cls.kind, "ops": 0}
+        msg["run"] = run_id
+        conn.send(msg)
+
+    conn.close()
+
+
+class WorkerPool:
+    """Stress processes spawned and warmed once, then reused by every phase.
+
+    start() spawns one process per slot (default: one per logical core),
+    pins it, and waits until each has imported NumPy and built its warm
+    workload. run() dispatches a timed window over the pipes behind a
+    ready/go barrier, so spawn, import and allocation never land inside a
+    measurement and all workers start the clock together.
+
+    A non-zero *profile_interval* (seconds) makes every worker stack-sample
+    its timed windows; see core.profiler.
+    """
+
+    def __init__(
+        self,
+        processes: int | None = None,
+        policy: str = "none",
+        cpus: list[int] | None = None,
+        profile_interval: float = 0.0,
+    ) -> None:
+        placement.plan(policy, 0, cpus)  # validate before anything is spawned
+        self._size = processes or mp.cpu_count()
+        self._profile_interval = profile_interval
+        self._policy = policy
+        self._cpus = cpus
+        self._assigned: list[int | None] = []
         self._processes: list[mp.Process] = []
         self._conns: list[Connection] = []
-        self._arena: shm.SharedMemory | None = None
-        self._started_at: float = 0.0
-        self._duration: float = 0.0
+        self._runs = itertools.count(1)
 
-    def start(self, duration: float = 60) -> None:
-        self._duration = duration
-        self._started_at = time.perf_counter()
-        self._arena = shm.SharedMemory(create=True, size=ARENA_BYTES)
-        cpu_count = mp.cpu_count()
-
-        for i in range(cpu_count):
-            worker_fn, _ = _WORKERS[i % len(_WORKERS)]
-            parent, child = mp.Pipe(duplex=False)
-            p = mp.Process(
-                target=worker_fn,
-                args=(duration, child, self._arena.name),
-                daemon=True,
-            )
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def start(self) -> None:
+        if self._processes:
+            return
+        self._assigned = placement.plan(self._policy, self._size, self._cpus)
+        # Workers attach arenas created later; make them share the parent's
+        # resource tracker instead of each starting one that "cleans up"
+        # (unlinks) those arenas again when the worker exits.
+        resource_tracker.ensure_running()
+
+        for i in range(self._size):
+            warm, _ = _WORKERS[i % len(_WORKERS)]
+            parent, child = mp.Pipe()
+            p = mp.Process(target=_serve, args=(self._assigned[i], warm, child), daemon=True)
             p.start()
             child.close()
             self._processes.append(p)
             self._conns.append(parent)
 
-    def stop(self) -> None:
+        # Warm-up barrier: return only once every worker is ready to run.
+        for i, (p, conn) in enumerate(zip(self._processes, self._conns)):
+            try:
+                conn.recv()
+            except EOFError:
+                p.join(timeout=1)
+                cpu = self._assigned[i]
+                self.close()
+                raise RuntimeError(
+                    f"worker {i} ({'cpu ' + str(cpu) if cpu is not None else 'unpinned'}) "
+                    f"exited during warm-up (exit code {p.exitcode})"
+                ) from None
+
+    def _await(self, conn: Connection, run_id: int, timeout: float):
+        """Next message for *run_id* on *conn*, skipping stale ones; None on timeout."""
+        deadline = time.perf_counter() + timeout
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0 or not conn.poll(remaining):
+                return None
+            try:
+                msg = conn.recv()
+            except EOFError:
+                return None
+            tag = msg.get("run") if isinstance(msg, dict) else msg[1]
+            if tag == run_id:
+                return msg
+
+    def run(
+        self,
+        workloads: list[type],
+        processes: int,
+        duration: float,
+        arena_name: str,
+        topology: str,
+        control: _RunControl,
+    ) -> int:
+        """Start a timed window on the first *processes* workers; returns its run id."""
+        if processes > self._size:
+            raise ValueError(f"pool has {self._size} workers, {processes} requested")
+        run_id = next(self._runs)
+        conns = self._conns[:processes]
+
+        for i, conn in enumerate(conns):
+            cls = workloads[i % len(workloads)]
+            conn.send(("run", run_id, cls, duration, (arena_name, i, topology), (control.name, i), self._profile_interval))
+        for conn in conns:
+            if self._await(conn, run_id, timeout=60) is None:
+                raise RuntimeError("pool worker did not become ready")
+        for conn in conns:
+            conn.send(("go", run_id))
+        return run_id
+
+    def collect(self, run_id: int, processes: int, timeout: float) -> list[dict]:
+        results: list[dict] = []
+        deadline = time.perf_counter() + timeout
+        for conn in self._conns[:processes]:
+            msg = self._await(conn, run_id, max(deadline - time.perf_counter(), 0.0))
+            results.append(msg if msg is not None else {"error": "worker did not report", "ops": 0})
+        return results
+
+    def describe(self, processes: int) -> dict:
+        return placement.describe(self._policy, self._assigned[:processes])
+
+    def close(self) -> None:
+        for conn in self._conns:
+            try:
+                conn.send(("exit",))
+            except (BrokenPipeError, OSError):
+                pass
         for p in self._processes:
             p.join(timeout=2)
             if p.is_alive():
                 p.terminate()
                 p.join(timeout=1)
+        for conn in self._conns:
+            conn.close()
+        self._processes = []
+        self._conns = []
+
+
+# CPUStress
+
+class CPUStress:
+    def __init__(
+        self,
+        topology: str = "shared",
+        policy: str = "none",
+        cpus: list[int] | None = None,
+        pool: WorkerPool | None = None,
+        adaptive: bool = False,
+        max_extension: float = 2.0,
+    ) -> None:
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"unknown arena topology: {topology!r} (expected one of {TOPOLOGIES})")
+        placement.plan(policy, 0, cpus)  # validate before anything is spawned
+        self._topology = topology
+        self._policy = policy
+        self._cpus = cpus
+        self._pool = pool
+        self._owns_pool = False
+        self._adaptive = adaptive
+        self._max_extension = max_extension
+        self._monitor: SteadyStateMonitor | None = None
+        self._control: _RunControl | None = None
+        self._kinds: list[str] = []
+        self._samples: list[list[tuple[int, int]]] = []
+        self._series_lock = threading.Lock()
+        self._drain_stop = threading.Event()
+        self._drainer: threading.Thread | None = None
+        self._run_id: int | None = None
+        self._processes_used = 0
+        self._placement: dict = {}
+        self._messages: list[dict] | None = None
+        self._arena: shm.SharedMemory | None = None
+        self._coherency: dict | None = None
+        self._subtests: list[str] = _SUBTEST_NAMES
+        self._started_at: float = 0.0
+        self._duration: float = 0.0
+
+    def _ensure_pool(self) -> WorkerPool:
+        """The shared pool if one was given, else a private one for this stress."""
+        if self._pool is None:
+            self._pool = WorkerPool(policy=self._policy, cpus=self._cpus)
+            self._owns_pool = True
+        self._pool.start()
+        return self._pool
+
+    def start(self, duration: float = 60, processes: int | None = None, workloads: list | None = None) -> None:
+        """Run *processes* pool workers (default: the whole pool) for *duration* seconds.
+
+        Workers are dealt round-robin from *workloads*, a subset of the
+        registry entries (default: all of them). In adaptive mode *duration*
+        is nominal: the run ends once throughput is steady, or at
+        *max_extension* times *duration* if it never settles.
+        """
+        pool = self._ensure_pool()
+        workloads = workloads or _WORKERS
+        self._subtests = [name for _, name in workloads]
+        self._processes_used = processes or pool.size
+        self._placement = pool.describe(self._processes_used)
+        self._messages = None
+        self._arena = shm.SharedMemory(create=True, size=_arena_bytes(self._topology, self._processes_used))
+        self._control = _RunControl(self._processes_used)
+        self._kinds = [workloads[i % len(workloads)][0].kind for i in range(self._processes_used)]
+        self._samples = [[] for _ in range(self._processes_used)]
+        cap = duration * self._max_extension if self._adaptive else duration
+        self._run_id = pool.run(
+            [cls for cls, _ in workloads], self._processes_used, cap, self._arena.name, self._topology, self._control,
+        )
+        self._duration = duration
+        self._started_at = time.perf_counter()
+        if self._adaptive:
+            self._monitor = SteadyStateMonitor(self._control.total, duration, cap, on_finish=self._control.halt)
+            self._monitor.start()
+        self._drain_stop.clear()
+        self._drainer = threading.Thread(target=self._drain_loop, daemon=True)
+        self._drainer.start()
+
+    def _drain(self) -> None:
+        with self._series_lock:
+            if self._control is None:
+                return
+            for samples, new in zip(self._samples, self._control.drain()):
+                samples.extend(new)
+
+    def _drain_loop(self) -> None:
+        # Rings hold RING_SLOTS * SAMPLE_INTERVAL_S of history; drain well inside that.
+        while not self._drain_stop.wait(1.0):
+            self._drain()
+
+    def live_rates(self) -> dict[str, float]:
+        """Latest ops/s per workload, from each worker's two newest samples."""
+        self._drain()
+        rates: dict[str, float] = {}
+        with self._series_lock:
+            for kind, samples in zip(self._kinds, self._samples):
+                if not samples:
+                    continue
+                (t0, ops0), (t1, ops1) = ([(0, 0)] + samples)[-2:]
+                rates[kind] = rates.get(kind, 0.0) + (ops1 - ops0) / ((t1 - t0) / 1e9)
+        return rates
+
+    def worker_profiles(self) -> list[dict]:
+        """Stack profiles the workers sent back (empty unless the pool profiles)."""
+        self._collect(timeout=2)
+        return [r["profile"] for r in self._messages or [] if "profile" in r]
+
+    def _timeseries(self) -> dict:
+        interval_ns = int(SAMPLE_INTERVAL_S * 1e9)
+        series: dict[str, list[float]] = {}
+        with self._series_lock:
+            for kind, samples in zip(self._kinds, self._samples):
+                _bucket_series(samples, interval_ns, series.setdefault(kind, []))
+        length = max((len(v) for v in series.values()), default=0)
+        return {
+            "interval_s": SAMPLE_INTERVAL_S,
+            "ops_s": {k: [round(x, 1) for x in v + [0.0] * (length - len(v))] for k, v in series.items()},
+        }
+
+    @property
+    def finished(self) -> bool:
+        if self._monitor is not None:
+            return self._monitor.finished
+        return time.perf_counter() - self._started_at >= self._duration
+
+    def _collect(self, timeout: float) -> None:
+        if self._messages is None and self._run_id is not None and self._pool is not None:
+            self._messages = self._pool.collect(self._run_id, self._processes_used, timeout)
+
+    def stop(self) -> None:
+        if self._monitor is not None:
+            self._monitor.stop()
+        # Each worker finishes the op it is in; allow for a slow last op.
+        if self._control is not None:
+            self._control.halt()
+        self._collect(timeout=30)
+        self._drain_stop.set()
+        if self._drainer is not None:
+            self._drainer.join(timeout=2)
+            self._drainer = None
+        self._drain()
+        if self._control is not None:
+            with self._series_lock:
+                self._control.close()
+                self._control = None
         if self._arena:
             self._arena.close()
             self._arena.unlink()
+            self._arena = None
+        if self._owns_pool and self._pool is not None:
+            self._pool.close()
+            self._pool = None
+            self._owns_pool = False
+
+    def measure_coherency(self, duration: float = 2.0, contended: str | None = None, baseline: str = "padded") -> dict:
+        """Price cache-line contention: probe throughput under *contended* vs *baseline*.
+
+        Runs an arena-only probe on every pool worker for *duration* seconds
+        in each topology, back to back. The cost is the fraction of baseline
+        throughput lost when the workers are made to share lines. Rates use
+        each worker's measured window, not the nominal *duration*.
+
+        *contended* defaults to this run's arena topology, or "shared" when
+        that is the baseline itself. "numa" places each worker's page by
+        node-local first touch, so it only differs from "padded" when the
+        pool is pinned across NUMA nodes.
+
+        With fewer than two workers nothing shares a line, so the probe
+        isn't run and coherency_cost_pct is None.
+        """
+        if contended is None:
+            contended = self._topology if self._topology != baseline else "shared"
+        pool = self._ensure_pool()
+        workers = pool.size
+        if workers < 2:
+            self._coherency = {
+                "contended":          contended,
+                "baseline":           baseline,
+                "coherency_cost_pct": None,
+                "processes":          workers,
+                "note":               "needs at least two workers",
+            }
+            return self._coherency
+        rates: dict[str, float] = {}
+
+        for topology in (contended, baseline):
+            _slot_layout(topology, 0)  # validate before dispatching anything
+            arena = shm.SharedMemory(create=True, size=_arena_bytes(topology, workers))
+            control = _RunControl(workers)
+            try:
+                run_id = pool.run([_ArenaProbe], workers, duration, arena.name, topology, control)
+                results = pool.collect(run_id, workers, timeout=duration + 30)
+            finally:
+                control.close()
+                arena.close()
+                arena.unlink()
+            # Workers run side by side, so their own rates add up.
+            rates[topology] = sum(
+                r.get("writes", 0) / r["elapsed_s"] for r in results if r.get("elapsed_s", 0) > 0
+            )
+
+        contended_rate = rates[contended]
+        baseline_rate  = rates[baseline]
+        cost = (1 - contended_rate / baseline_rate) * 100 if baseline_rate > 0 else 0.0
+        self._coherency = {
+            "contended":          contended,
+            "baseline":           baseline,
+            "contended_ops_s":    round(contended_rate, 1),
+            "baseline_ops_s":     round(baseline_rate, 1),
+            "coherency_cost_pct": round(cost, 2),
+            "processes":          workers,
+        }
+        return self._coherency
 
     def result(self) -> dict:
+        self._collect(timeout=2)
         breakdown: dict[str, int] = {}
+        latency: dict[str, LatencyHistogram] = {}
+        merged = LatencyHistogram()
+        sieve: dict[str, dict] = {}
+        pixel_iters = 0
+        pixel_rate = 0.0
         errors: list[str] = []
 
-        for conn in self._conns:
-            try:
-                if conn.poll(timeout=2):
-                    r = conn.recv()
-                    if "error" in r:
-                        errors.append(r["error"])
-                    t = r.get("type", "unknown")
-                    count = r.get("ops", 0) + r.get("found", 0)
-                    breakdown[t] = breakdown.get(t, 0) + count
-            except EOFError:
-                pass
-            finally:
-                conn.close()
+        for r in self._messages or []:
+            if "error" in r:
+                errors.append(r["error"])
+            t = r.get("type", "unknown")
+            breakdown[t] = breakdown.get(t, 0) + r.get("ops", 0)
+            if "found" in r:
+                # Primes are reported as a rate, not folded into ops —
+                # the NumPy engine would otherwise swamp every other workload.
+                entry = sieve.setdefault(t, {"primes": 0, "primes_per_s": 0.0})
+                entry["primes"] += r["found"]
+                entry["primes_per_s"] += r["found"] / max(r.get("elapsed_s", 0.0), 1e-9)
+            if "pixel_iters" in r:
+                pixel_iters += r["pixel_iters"]
+                pixel_rate  += r["pixel_iters"] / max(r.get("elapsed_s", 0.0), 1e-9)
+            hist = r.get("latency")
+            if hist is not None:
+                latency.setdefault(t, LatencyHistogram()).merge(hist)
+                merged.merge(hist)
 
-        return {
+        out = {
             "breakdown": breakdown,
             "total_ops": sum(breakdown.values()),
-            "processes_used": len(self._processes),
+            "processes_used": self._processes_used,
+            "processes_per_type": {kind: self._kinds.count(kind) for kind in dict.fromkeys(self._kinds)},
+            "arena_topology": self._topology,
+            "placement": self._placement,
+            "sieve": {
+                t: {"primes": e["primes"], "primes_per_s": round(e["primes_per_s"], 1)}
+                for t, e in sieve.items()
+            },
+            "mandelbrot": {
+                "pixel_iters":       pixel_iters,
+                "pixel_iters_per_s": round(pixel_rate, 1),
+            },
+            "latency": {
+                **{t: h.summary() for t, h in latency.items()},
+                "all": merged.summary(),
+            },
             "errors": errors or None,
         }
+        if self._coherency is not None:
+            out["coherency"] = self._coherency
+        if self._monitor is not None:
+            out["steady_state"] = self._monitor.summary()
+        out["timeseries"] = self._timeseries()
+        return out
 
     @property
     def current_subtest(self) -> str:
-        if self._duration <= 0:
-            return _SUBTEST_NAMES[0]
-        elapsed = time.perf_counter() - self._started_at
-        idx = min(
-            int(elapsed / self._duration * len(_SUBTEST_NAMES)),
-            len(_SUBTEST_NAMES) - 1,
-        )
-        return _SUBTEST_NAMES[idx]
+        # Every workload runs at once; live_rates() has the per-workload view.
+        if len(self._subtests) == 1:
+            return f"{self._subtests[0]} × {self._processes_used}"
+        return f"{len(self._subtests)} workloads × {self._processes_used} processes"
+
+
+# Core-scaling sweep
+
+def _core_counts() -> tuple[int, int]:
+    """(physical, logical) core counts; physical falls back to logical."""
+    logical = mp.cpu_count()
+    try:
+        import psutil
+        physical = psutil.cpu_count(logical=False) or logical
+    except Exception:
+        physical = logical
+    return physical, logical
+
+
+def _scaling_steps(physical: int, logical: int) -> list[int]:
+    """1, 2, 4, ... up to *logical*, always including the physical and logical counts."""
+    counts = {1, physical, logical}
+    n = 2
+    while n < logical:
+        counts.add(n)
+        n *= 2
+    return sorted(counts)
+
+
+class CPUScalingSweep:
+    """Runs each workload alone at 1, 2, 4, ... N processes, one step at a time.
+
+    Throughput per step is processes / mean op latency, which ignores the
+    partial op every worker is still running when its step ends. Parallel
+    efficiency at n processes is throughput(n) / (n * throughput(1)). Each
+    step's length is what's left of the phase over the steps still to run,
+    so dispatch and collection overhead shortens later steps rather than
+    pushing the last ones past the phase.
+    """
+
+    def __init__(
+        self,
+        topology: str = "shared",
+        policy: str = "none",
+        cpus: list[int] | None = None,
+        pool: WorkerPool | None = None,
+    ) -> None:
+        placement.plan(policy, 0, cpus)
+        self._topology = topology
+        self._policy = policy
+        self._cpus = cpus
+        self._pool = pool
+        self._owns_pool = False
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._physical, self._logical = _core_counts()
+        self._counts = _scaling_steps(self._physical, self._logical)
+        if pool is not None:
+            self._counts = [n for n in self._counts if n <= pool.size]
+        self._rates: dict[str, list[tuple[int, float]]] = {}
+        self._current = "Core Scaling Sweep"
+        self._stress: CPUStress | None = None
+        self._profiles: list[dict] = []
+        self._placement: dict = {}
+
+    def start(self, duration: float = 60) -> None:
+        if self._pool is None:
+            self._pool = WorkerPool(self._logical, self._policy, self._cpus)
+            self._owns_pool = True
+        self._pool.start()
+        # A step at n processes runs on the first n pool workers, so the
+        # largest step's assignment covers every step.
+        self._placement = self._pool.describe(max(self._counts, default=0))
+        self._stop.clear()
+        self._rates = {}
+        self._profiles = []
+        self._thread = threading.Thread(target=self._run, args=(duration,), daemon=True)
+        self._thread.start()
+
+    def _run(self, duration: float) -> None:
+        deadline = time.perf_counter() + duration
+        steps = [(entry, n) for entry in _WORKERS for n in self._counts]
+        for i, (entry, n) in enumerate(steps):
+            if self._stop.is_set():
+                return
+            step_s = max((deadline - time.perf_counter()) / (len(steps) - i), 0.5)
+            self._current = f"{entry[1]} × {n}"
+            stress = CPUStress(self._topology, pool=self._pool)
+            stress.start(duration=step_s, processes=n, workloads=[entry])
+            self._stress = stress
+            self._stop.wait(step_s)
+            stress.stop()
+            self._stress = None
+            self._profiles.extend(stress.worker_profiles())
+            r = stress.result()
+            for kind, lat in r["latency"].items():
+                if kind != "all" and lat.get("mean_ms"):
+                    self._rates.setdefault(kind, []).append((n, n * 1000 / lat["mean_ms"]))
+
+    @property
+    def finished(self) -> bool:
+        return self._thread is not None and not self._thread.is_alive()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=40)
+        if self._owns_pool and self._pool is not None:
+            self._pool.close()
+            self._pool = None
+            self._owns_pool = False
+
+    def result(self) -> dict:
+        curves: dict[str, list[dict]] = {}
+        efficiency_at_max: dict[str, float] = {}
+
+        for kind, points in self._rates.items():
+            single = next((rate for n, rate in points if n == 1), 0.0)
+            curve = []
+            for n, rate in points:
+                eff = rate / (n * single) if single > 0 else 0.0
+                curve.append({
+                    "processes":  n,
+                    "ops_s":      round(rate, 3),
+                    "speedup":    round(rate / single, 3) if single > 0 else 0.0,
+                    "efficiency": round(eff, 3),
+                })
+            curves[kind] = curve
+            efficiency_at_max[kind] = max(curve, key=lambda p: p["processes"])["efficiency"]
+
+        # With one count measured, efficiency is 1.0 by definition, not a result.
+        measured = sorted({n for points in self._rates.values() for n, _ in points})
+        mean = sum(efficiency_at_max.values()) / len(efficiency_at_max) if efficiency_at_max else 0.0
+        return {
+            "placement":         self._placement,
+            "physical_cores":    self._physical,
+            "logical_cores":     self._logical,
+            "process_counts":    self._counts,
+            "measured_counts":   measured,
+            "curves":            curves,
+            "efficiency_at_max": efficiency_at_max,
+            "mean_efficiency":   round(mean, 3) if len(measured) >= 2 else None,
+        }
+
+    def worker_profiles(self) -> list[dict]:
+        return self._profiles
+
+    def live_rates(self) -> dict[str, float]:
+        stress = self._stress
+        return stress.live_rates() if stress is not None else {}
+
+    @property
+    def current_subtest(self) -> str:
+        return self._current
@@ -0,0 +1,147 @@
+"""Energy metering: joules per phase and work per joule.
+
+An energy source reports cumulative joules per domain ("cpu" for the
+package, plus "dram" and "gpu" where known) through read(). EnergyMeter
+reads it when each phase starts and ends, so a phase's energy is an
+exact counter delta rather than an integral of sampled watts.
+
+  RaplEnergy         — Linux powercap counters (package-N → cpu,
+                       dram → dram); wraparound is folded in on every read
+  PowermetricsEnergy — macOS: power from the telemetry powermetrics
+                       stream times each sample's elapsed time
+  FakeEnergy         — constant watts, for tests and machines without
+                       counters
+
+efficiency() turns the phase energies and phase results into ops/J for
+each CPU workload, MB/J for I/O and passes/J for the GPU. CPU workloads
+share one package, so each workload is charged the phase energy times
+its share of the worker processes.
+"""
+
+import time
+
+from core.linux_sensors import rapl_zones
+
+FAKE_WATTS = 50.0
+
+
+class RaplEnergy:
+    name = "rapl"
+
+    def __init__(self, root: str = "/") -> None:
+        self._zones = rapl_zones(root)
+        self._total_uj: list[int] = [0] * len(self._zones)
+
+    @property
+    def available(self) -> bool:
+        return bool(self._zones)
+
+    def read(self) -> dict[str, float]:
+        out: dict[str, float] = {}
+        for i, zone in enumerate(self._zones):
+            delta = zone.delta()
+            if delta is not None:
+                self._total_uj[i] += delta[0]
+            domain = "cpu" if zone.domain == "package" else zone.domain
+            out[domain] = out.get(domain, 0.0) + self._total_uj[i] / 1e6
+        return out
+
+
+class PowermetricsEnergy:
+    name = "powermetrics"
+
+    def __init__(self, stream) -> None:
+        self._stream = stream
+
+    @property
+    def available(self) -> bool:
+        return self._stream is not None
+
+    def read(self) -> dict[str, float]:
+        return self._stream.energy_j()
+
+
+class FakeEnergy:
+    name = "fake"
+    available = True
+
+    def __init__(self, watts: float = FAKE_WATTS, gpu_watts: float | None = None) -> None:
+        self._watts = watts
+        self._gpu_watts = gpu_watts
+        self._t0 = time.perf_counter()
+
+    def read(self) -> dict[str, float]:
+        elapsed = time.perf_counter() - self._t0
+        out = {"cpu": self._watts * elapsed}
+        if self._gpu_watts is not None:
+            out["gpu"] = self._gpu_watts * elapsed
+        return out
+
+
+class EnergyMeter:
+    def __init__(self, source) -> None:
+        self.source = source
+        self.phases: dict[str, dict] = {}
+        self._open: tuple[str, float, dict[str, float]] | None = None
+
+    def begin(self, phase: str) -> None:
+        self._open = (phase, time.perf_counter(), self.source.read())
+
+    def end(self) -> None:
+        if self._open is None:
+            return
+        phase, t0, before = self._open
+        after = self.source.read()
+        seconds = max(time.perf_counter() - t0, 1e-9)
+        joules = {d: round(after[d] - before.get(d, 0.0), 3) for d in after}
+        self.phases[phase] = {
+            "seconds": round(seconds, 3),
+            "joules":  joules,
+            "avg_w":   {d: round(j / seconds, 2) for d, j in joules.items()},
+        }
+        self._open = None
+
+
+def _per_joule(amount: float, joules: float | None) -> float | None:
+    return round(amount / joules, 4) if joules and joules > 0 else None
+
+
+def _cpu_efficiency(cpu: dict, joules: float | None) -> dict:
+    shares = cpu.get("processes_per_type") or {}
+    workers = sum(shares.values())
+    workloads = {}
+    for kind, ops in (cpu.get("breakdown") or {}).items():
+        share = shares.get(kind, 0) / workers if workers else 0
+        workloads[kind] = _per_joule(ops, joules * share if joules else None)
+    return {"ops_per_j": _per_joule(cpu.get("total_ops", 0), joules), "workloads": workloads}
+
+
+def _io_mb(io: dict) -> float:
+    if io.get("devices"):
+        return sum(_io_mb(d) for d in io["devices"].values())
+    return (io.get("read_mb_s", 0.0) + io.get("write_mb_s", 0.0)) * io.get("duration_s", 0.0)
+
+
+def efficiency(results: dict, phases: dict[str, dict]) -> dict:
+    """Work per joule for each phase that has both results and energy."""
+    def cpu_j(phase: str) -> float | None:
+        return phases.get(phase, {}).get("joules", {}).get("cpu")
+
+    out: dict[str, dict] = {}
+    if "cpu" in results and "cpu" in phases:
+        out["cpu"] = _cpu_efficiency(results["cpu"], cpu_j("cpu"))
+    if "io" in results and "io" in phases:
+        out["io"] = {"mb_per_j": _per_joule(_io_mb(results["io"]), cpu_j("io"))}
+    if "mixed" in results and "mixed" in phases:
+        mixed = results["mixed"]
+        joules = phases["mixed"]["joules"]
+        out["mixed"] = {
+            "cpu": _cpu_efficiency(mixed.get("cpu", {}), joules.get("cpu")),
+            "io":  {"mb_per_j": _per_joule(_io_mb(mixed.get("io", {})), joules.get("cpu"))},
+        }
+        gpu = mixed.get("gpu", {})
+        if "passes" in gpu:
+            # Charge the GPU's own energy where the source knows it, else the package.
+            domain = "gpu" if "gpu" in joules else "cpu"
+            out["gpu"] = {"passes_per_j": _per_joule(gpu["passes"], joules.get(domain)), "domain": domain}
+    return out
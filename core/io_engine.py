@@ -0,0 +1,232 @@
+"""Queue-depth I/O engine: a fio-style job matrix over pread/pwrite.
+
+The I/O stress threads each keep one request in flight, so however fast
+the device is they only ever see queue depth 1. NVMe drives need many
+outstanding requests before their internal parallelism shows.
+
+Each job here is one (pattern, depth) pair. It runs *depth* issuer
+threads against one preallocated file, and each issuer loops on a
+blocking os.preadv / os.pwrite at an aligned offset. The calls release
+the GIL, so *depth* threads keep *depth* requests outstanding. Issuer
+threads come from one pool that every job reuses.
+
+  randread / randwrite — uniformly random block-aligned offsets
+  seqread  / seqwrite  — issuers share one cursor, so together they
+                         stream the file front to back
+
+Every op is timed into a per-issuer LatencyHistogram, and the
+histograms are merged when the job ends. The result is IOPS, MB/s and
+the latency distribution per pattern and depth.
+
+The file is written in start(), before the phase clock starts, and
+opened with O_DIRECT (F_NOCACHE on macOS) through page-aligned mmap
+buffers, so the numbers are the device's and not the page cache's.
+Where neither is available, readahead is switched off with
+POSIX_FADV_RANDOM, the cache is dropped before each job and the result
+is marked "cached": true. When the phase is too short for every job to
+get MIN_JOB_S, the deepest queue depths are dropped from the matrix
+(then trailing patterns) rather than overrunning the budget.
+"""
+
+import itertools
+import mmap
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from core.histogram import LatencyHistogram
+from core.io_stress import drop_cache, open_uncached, preallocate
+
+PATTERNS     = ("randread", "randwrite", "seqread", "seqwrite")
+QUEUE_DEPTHS = (1, 4, 32, 128)
+BLOCK        = 4 * 1024            # 4 KB — the usual IOPS block size
+FILE_SIZE_MB = 256
+MIN_JOB_S    = 0.5
+
+
+def _issue(fd: int, pattern: str, blocks: int, cursor, deadline: float, stop: threading.Event) -> tuple[int, LatencyHistogram]:
+    """One issuer: keep a single request outstanding until *deadline*."""
+    hist = LatencyHistogram()
+    rng = random.Random()
+    reading = pattern.endswith("read")
+    sequential = pattern.startswith("seq")
+    # Anonymous mmaps are page-aligned, as O_DIRECT requires.
+    buf = mmap.mmap(-1, BLOCK)
+    payload = mmap.mmap(-1, BLOCK)
+    payload.write(os.urandom(BLOCK))
+    perf_ns = time.perf_counter_ns
+    ops = 0
+
+    while not stop.is_set() and time.perf_counter() < deadline:
+        block = next(cursor) % blocks if sequential else rng.randrange(blocks)
+        offset = block * BLOCK
+        t0 = perf_ns()
+        if reading:
+            os.preadv(fd, [buf], offset)
+        else:
+            os.pwrite(fd, payload, offset)
+        hist.record(perf_ns() - t0)
+        ops += 1
+
+    buf.close()
+    payload.close()
+    return ops, hist
+
+
+def _fit(patterns: tuple[str, ...], depths: tuple[int, ...], duration: float) -> tuple[tuple[str, ...], tuple[int, ...]]:
+    """Trim the matrix until every job gets at least MIN_JOB_S of *duration*."""
+    while len(patterns) * len(depths) * MIN_JOB_S > duration and len(depths) > 1:
+        depths = depths[:-1]
+    while len(patterns) * len(depths) * MIN_JOB_S > duration and len(patterns) > 1:
+        patterns = patterns[:-1]
+    return patterns, depths
+
+
+class QueueDepthMatrix:
+    """Runs every (pattern, depth) job in turn, splitting the phase evenly."""
+
+    def __init__(
+        self,
+        depths: tuple[int, ...] = QUEUE_DEPTHS,
+        patterns: tuple[str, ...] = PATTERNS,
+        file_size_mb: int = FILE_SIZE_MB,
+        directory: str | None = None,
+    ) -> None:
+        unknown = [p for p in patterns if p not in PATTERNS]
+        if unknown:
+            raise ValueError(f"unknown I/O pattern(s): {unknown} (expected a subset of {PATTERNS})")
+        if not depths or min(depths) < 1:
+            raise ValueError(f"queue depths must be positive, got {depths!r}")
+        self._depths = tuple(depths)
+        self._patterns = tuple(patterns)
+        self._file_size = file_size_mb * 1024 * 1024
+        self._directory = directory
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._tempdir: str | None = None
+        self._fd: int | None = None
+        self._jobs: dict[str, dict[str, dict]] = {}
+        self._current = "Queue Depth Matrix"
+        self._started_at = 0.0
+        self._duration = 0.0
+        self._open_mode = "buffered"
+        self._skipped: list[str] = []
+
+    @property
+    def _cached(self) -> bool:
+        return self._open_mode not in ("direct", "nocache")
+
+    def prepare(self) -> None:
+        """Write and open the target file; start() does this itself if needed."""
+        if self._fd is not None:
+            return
+        self._tempdir = tempfile.mkdtemp(prefix="chronos_qd_", dir=self._directory)
+        path = Path(self._tempdir) / "qd.bin"
+        preallocate(path, self._file_size)
+        self._fd, self._open_mode = open_uncached(path, os.O_RDWR)
+        if self._cached and hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(self._fd, 0, 0, os.POSIX_FADV_RANDOM)
+
+    def start(self, duration: float = 60) -> None:
+        self._stop.clear()
+        self._jobs = {}
+        self._duration = duration
+        # The file is written before the clock starts; it is setup, not a job.
+        self.prepare()
+        fd, self._fd = self._fd, None
+
+        patterns, depths = _fit(self._patterns, self._depths, duration)
+        self._skipped = [f"{p}@qd{d}" for p in self._patterns for d in self._depths if p not in patterns or d not in depths]
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, args=(fd, patterns, depths, duration), daemon=True)
+        self._thread.start()
+
+    def _run(self, fd: int, patterns: tuple[str, ...], depths: tuple[int, ...], duration: float) -> None:
+        blocks = self._file_size // BLOCK
+        jobs = [(p, d) for p in patterns for d in depths]
+        try:
+            with ThreadPoolExecutor(max_workers=max(depths)) as pool:
+                for i, (pattern, depth) in enumerate(jobs):
+                    if self._stop.is_set():
+                        break
+                    remaining = duration - (time.perf_counter() - self._started_at)
+                    job_s = remaining / (len(jobs) - i)
+                    if job_s <= 0:
+                        break
+                    self._current = f"{pattern} @ QD{depth}"
+                    if self._cached:
+                        drop_cache(fd)
+                    job = self._run_job(pool, fd, pattern, depth, blocks, job_s)
+                    # Copy-on-write, so live_rates() never sees a dict mid-insert.
+                    self._jobs = {**self._jobs, pattern: {**self._jobs.get(pattern, {}), f"qd{depth}": job}}
+        finally:
+            os.close(fd)
+
+    def _run_job(self, pool: ThreadPoolExecutor, fd: int, pattern: str, depth: int, blocks: int, job_s: float) -> dict:
+        cursor = itertools.count()
+        start = time.perf_counter()
+        deadline = start + job_s
+        futures = [pool.submit(_issue, fd, pattern, blocks, cursor, deadline, self._stop) for _ in range(depth)]
+
+        ops = 0
+        hist = LatencyHistogram()
+        for f in futures:
+            n, h = f.result()
+            ops += n
+            hist.merge(h)
+        if pattern.endswith("write"):
+            os.fsync(fd)
+        elapsed = max(time.perf_counter() - start, 1e-9)
+
+        return {
+            "iops":    round(ops / elapsed, 1),
+            "mb_s":    round(ops * BLOCK / 1024 / 1024 / elapsed, 2),
+            "ops":     ops,
+            "latency": hist.summary(scale=1e-3, unit="us"),
+        }
+
+    @property
+    def finished(self) -> bool:
+        return self._thread is not None and not self._thread.is_alive()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=10)
+        if self._fd is not None:
+            # Prepared but never started.
+            os.close(self._fd)
+            self._fd = None
+        if self._tempdir:
+            shutil.rmtree(self._tempdir, ignore_errors=True)
+            self._tempdir = None
+
+    def live_rates(self) -> dict[str, float]:
+        """IOPS of each finished job (the running one appears when it ends)."""
+        jobs = self._jobs
+        return {
+            f"{pattern} {depth}": job["iops"]
+            for pattern, by_depth in jobs.items()
+            for depth, job in by_depth.items()
+        }
+
+    def result(self) -> dict:
+        return {
+            "backend":      "threads",
+            "open_mode":    self._open_mode,
+            "cached":       self._cached,
+            "skipped":      self._skipped,
+            "block_kb":     BLOCK // 1024,
+            "file_mb":      self._file_size // 1024 // 1024,
+            "queue_depths": list(self._depths),
+            "jobs":         self._jobs,
+        }
+
+    @property
+    def current_subtest(self) -> str:
+        return self._current
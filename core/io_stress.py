@@ -1,13 +1,17 @@
 """I/O stress: hammers the disk subsystem with patterns no benchmark uses.
 
-Four concurrent workers, each targeting a different failure mode:
+Five concurrent workers, each targeting a different failure mode:
 
-  SEQUENTIAL FLOOD   — writes a single 1 GB file in large blocks, then reads
-                       it back. Measures raw sustained throughput.
+  SEQUENTIAL FLOOD   — writes a single large file in 4 MB blocks, then reads
+                       it back. Measures raw sustained throughput. The file
+                       is sized from RAM (1/8, 512 MB – 4 GB, at most half
+                       the free space). In "direct" mode it bypasses the
+                       page cache, so the read-back comes from the device
+                       rather than from memory.
 
-  RANDOM SEEK STORM  — opens the same file and issues thousands of small
-                       random-offset reads/writes. Kills SSD write amplification
-                       and spins up latency on HDDs.
+  RANDOM SEEK STORM  — issues thousands of small random-offset reads/writes
+                       against its own preallocated file. Kills SSD write
+                       amplification and spins up latency on HDDs.
 
   METADATA CHURN     — creates and deletes thousands of tiny files per second.
                        Stresses the filesystem's directory entry cache and inode
@@ -16,8 +20,30 @@ Four concurrent workers, each targeting a different failure mode:
   FSYNC GAUNTLET     — writes 4 KB blocks and calls fsync() after every write.
                        Forces the drive's write cache to flush each time.
                        Most SSDs throttle hard under this; most benchmarks skip it.
+
+  MMAP TOUCH         — maps its own file and alternates sequential passes
+                       (read faults, MADV_SEQUENTIAL) with random passes
+                       (half reads, half page dirtying, MADV_RANDOM), with
+                       msync every N dirtied pages. The cache is dropped
+                       between passes so faults go to the device. Reports
+                       page-fault rate and effective throughput.
+
+With processes > 1, IOStress runs N worker processes, each running the
+whole suite in its own subdirectory on its own files. The report then
+gives aggregate throughput across workers plus each worker's own result,
+which shows how the device scales and where the filesystem contends.
+
+MultiDeviceIO runs one IOStress per target directory, either concurrently
+or one after another, and reports each volume separately.
+
+Random reads, random writes, fsyncs, and metadata creates and unlinks are
+each timed into a LatencyHistogram. result() reports their distribution
+(p50/p90/p99/p99.9, in µs), since a cache flush is a latency cost more
+than a throughput one.
 """
 
+import mmap
+import multiprocessing as mp
 import os
 import random
 import shutil
@@ -27,147 +53,713 @@ import threading
 import time
 from pathlib import Path
 
+import psutil
+
+from core.histogram import LatencyHistogram
+from core.steady_state import SteadyStateMonitor
+
 
 BLOCK_LARGE  = 4 * 1024 * 1024   # 4 MB — sequential flood
 BLOCK_SMALL  = 4 * 1024          # 4 KB — fsync gauntlet + random seeks
-FILE_SIZE_MB = 512
+FILE_SIZE_MB = 512               # flood file floor; scaled up with RAM
+FILE_MAX_MB  = 4096
 
+# buffered — plain writes/reads through the page cache
+# direct   — O_DIRECT with page-aligned buffers; where the platform or
+#            filesystem refuses it, F_NOCACHE (macOS), else fsync +
+#            posix_fadvise(DONTNEED) before the read-back
+FLOOD_MODES = ("buffered", "direct")
+
+# How MultiDeviceIO schedules its per-directory runs.
+DEVICE_MODES = ("concurrent", "sequential")
+
+# Small-op workers publish their counts every this many ops.
+_FLUSH_EVERY = 256
+
+# Random writes cycle through this many distinct 4 KB blocks of one
+# preallocated random buffer instead of calling os.urandom per write.
+_PAYLOAD_BLOCKS = 256
+
+MMAP_FILE_MB = 256              # mmap worker file, capped by the flood size
+RANDOM_FILE_MB = 256            # random seek storm file, capped by the flood size
+MSYNC_EVERY  = 256              # default dirtied pages between msyncs
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _flood_bytes(base: Path) -> int:
+    """Flood file size: 1/8 of RAM within [FILE_SIZE_MB, FILE_MAX_MB], at most half the free space."""
+    mb = 1024 * 1024
+    size = min(max(psutil.virtual_memory().total // 8, FILE_SIZE_MB * mb), FILE_MAX_MB * mb)
+    size = min(size, shutil.disk_usage(base).free // 2)
+    return max(size // BLOCK_LARGE, 1) * BLOCK_LARGE
+
+
+def _device_info(directory: str | None) -> dict:
+    """The directory and the mounted device / filesystem it lives on."""
+    path = os.path.realpath(directory or tempfile.gettempdir())
+    best = None
+    for part in psutil.disk_partitions(all=True):
+        mount = part.mountpoint
+        inside = path == mount or path.startswith(mount.rstrip(os.sep) + os.sep)
+        if inside and (best is None or len(mount) > len(best.mountpoint)):
+            best = part
+    return {
+        "path":       path,
+        "device":     best.device if best else None,
+        "mountpoint": best.mountpoint if best else None,
+        "fstype":     best.fstype if best else None,
+    }
+
+
+def drop_cache(fd: int) -> None:
+    """Evict *fd*'s pages from the page cache, where posix_fadvise exists."""
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def preallocate(path: Path, size: int) -> None:
+    """Reserve *size* bytes (posix_fallocate where available), then fill them with random data.
+
+    The fill is needed because reads of allocated-but-unwritten extents
+    return zeros without touching the device. The cache is dropped at the
+    end so first reads go to the disk.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(fd, 0, size)
+        chunk = os.urandom(BLOCK_LARGE)
+        for offset in range(0, size - BLOCK_LARGE + 1, BLOCK_LARGE):
+            os.pwrite(fd, chunk, offset)
+        os.fsync(fd)
+        drop_cache(fd)
+    finally:
+        os.close(fd)
+
+
+def open_uncached(path: Path, flags: int) -> tuple[int, str]:
+    """Open *path* bypassing the page cache as far as this platform allows.
+
+    Returns the fd and the mode that was actually obtained: "direct"
+    (O_DIRECT), "nocache" (macOS F_NOCACHE), "fadvise" (cached, dropped
+    explicitly after writing) or "buffered" when nothing is available.
+    """
+    if hasattr(os, "O_DIRECT"):
+        try:
+            return os.open(path, flags | os.O_DIRECT, 0o644), "direct"
+        except OSError:
+            pass  # tmpfs and some network filesystems reject O_DIRECT
+    fd = os.open(path, flags, 0o644)
+    if fcntl is not None and hasattr(fcntl, "F_NOCACHE"):
+        fcntl.fcntl(fd, fcntl.F_NOCACHE, 1)
+        return fd, "nocache"
+    return fd, "fadvise" if hasattr(os, "posix_fadvise") else "buffered"
+
+
+class _Counters:
+    """One worker's running totals.
+
+    Only the owning thread writes, so no lock is needed. Readers (the
+    steady-state monitor, result()) sum across workers and may see a
+    count that is up to one flush behind.
+    """
+
+    __slots__ = (
+        "write_bytes", "read_bytes", "fsyncs", "metadata_ops", "random_ops",
+        "mmap_bytes", "msyncs", "major_faults", "minor_faults", "latency",
+    )
 
-class IOStress:
     def __init__(self) -> None:
+        self.write_bytes = 0
+        self.read_bytes = 0
+        self.fsyncs = 0
+        self.metadata_ops = 0
+        self.random_ops = 0
+        self.mmap_bytes = 0
+        self.msyncs = 0
+        self.major_faults = 0
+        self.minor_faults = 0
+        self.latency: dict[str, LatencyHistogram] = {}
+
+    def histogram(self, op: str) -> LatencyHistogram:
+        return self.latency.setdefault(op, LatencyHistogram())
+
+
+def _fault_counts() -> tuple[int, int] | None:
+    """(major, minor) page faults of the calling thread, or the process where per-thread isn't available."""
+    if resource is None:
+        return None
+    usage = resource.getrusage(getattr(resource, "RUSAGE_THREAD", resource.RUSAGE_SELF))
+    return usage.ru_majflt, usage.ru_minflt
+
+
+def _madvise(mm: mmap.mmap, name: str) -> None:
+    advice = getattr(mmap, name, None)
+    if advice is not None and hasattr(mm, "madvise"):
+        mm.madvise(advice)
+
+
+def _io_process(options: dict, duration, go, stop, progress, slot: int, conn) -> None:
+    """One multi-process I/O worker: the full suite on its own files.
+
+    The worker prepares its files, reports ready and waits for *go*, so
+    no worker's setup lands in another's measured window. *duration* is a
+    shared value the parent fills in just before *go*.
+    """
+    io = IOStress(**options)
+    io.prepare()
+    conn.send(None)
+    go.wait()
+    io.start(duration.value)
+    while not io.finished and not stop.is_set():
+        progress[slot] = io._bytes_moved()
+        time.sleep(0.1)
+    io.stop()
+    progress[slot] = io._bytes_moved()
+    conn.send(io._snapshot())
+    conn.close()
+
+
+class IOStress:
+    """The I/O suite. *directory* is where the scratch directory goes
+    (default: the system temp dir); *flood_mb* fixes the flood file size
+    instead of scaling it with RAM.
+    """
+
+    def __init__(
+        self,
+        adaptive: bool = False,
+        max_extension: float = 2.0,
+        flood_mode: str = "buffered",
+        msync_every: int = MSYNC_EVERY,
+        processes: int = 1,
+        directory: str | None = None,
+        flood_mb: int | None = None,
+    ) -> None:
+        if flood_mode not in FLOOD_MODES:
+            raise ValueError(f"unknown flood mode: {flood_mode!r} (expected one of {FLOOD_MODES})")
+        if msync_every < 1:
+            raise ValueError(f"msync_every must be at least 1, got {msync_every}")
+        if processes < 1:
+            raise ValueError(f"processes must be at least 1, got {processes}")
+        self._processes = processes
+        self._directory = directory
+        self._flood_mb = flood_mb
+        self._children: list[tuple[mp.Process, object]] = []
+        self._child_stop = None
+        self._child_go = None
+        self._child_duration = None
+        self._progress = None
+        self._workers: list[dict] = []
+        self._msync_every = msync_every
+        self._mmap_size = 0
+        self._flood_mode = flood_mode
+        self._flood_used = flood_mode
+        self._flood_size = 0
+        self._adaptive = adaptive
+        self._max_extension = max_extension
+        self._monitor: SteadyStateMonitor | None = None
+        self._duration: float = 0.0
         self._stop = threading.Event()
         self._threads: list[threading.Thread] = []
-        self._lock = threading.Lock()
-        self._metrics: dict = {
-            "write_bytes": 0,
-            "read_bytes": 0,
-            "fsyncs": 0,
-            "metadata_ops": 0,
-            "random_ops": 0,
-            "duration_s": 0.0,
-        }
+        self._counters: list[_Counters] = []
+        self._elapsed: float = 0.0
         self._tempdir: str | None = None
         self._start_time: float = 0.0
+        self._stopped_at: float | None = None
+        self._random_size: int = 0
+
+    def _total(self, key: str) -> int:
+        return sum(getattr(c, key) for c in self._counters)
 
-    def _add(self, key: str, value: int) -> None:
-        with self._lock:
-            self._metrics[key] += value
+    def _bytes_moved(self) -> int:
+        if self._progress is not None:
+            return sum(self._progress)
+        return sum(c.read_bytes + c.write_bytes for c in self._counters)
 
-    def _sequential_flood(self, path: Path, duration: float) -> None:
+    def _open_flood(self, path: Path, flags: int) -> int:
+        if self._flood_mode == "buffered":
+            return os.open(path, flags, 0o644)
+        fd, self._flood_used = open_uncached(path, flags)
+        return fd
+
+    def _sequential_flood(self, c: _Counters, path: Path, duration: float) -> None:
         end = time.perf_counter() + duration
-        block = os.urandom(BLOCK_LARGE)  # random bytes — defeats compression on NVMe
-        blocks_per_file = (FILE_SIZE_MB * 1024 * 1024) // BLOCK_LARGE
+        # mmap memory is page-aligned, which O_DIRECT requires of the buffer.
+        block = mmap.mmap(-1, BLOCK_LARGE)
+        block.write(os.urandom(BLOCK_LARGE))  # random bytes — defeats compression on NVMe
+        blocks_per_file = self._flood_size // BLOCK_LARGE
 
-        while time.perf_counter() < end and not self._stop.is_set():
-            with path.open("wb") as f:
-                for _ in range(blocks_per_file):
-                    f.write(block)
-                    self._add("write_bytes", BLOCK_LARGE)
-
-            with path.open("rb") as f:
-                while chunk := f.read(BLOCK_LARGE):
-                    self._add("read_bytes", len(chunk))
-
-    def _random_seek_storm(self, path: Path, duration: float) -> None:
-        # Needs a pre-existing file — wait briefly if sequential hasn't written yet.
-        deadline = time.perf_counter() + 5.0
-        while not path.exists() and time.perf_counter() < deadline:
-            time.sleep(0.1)
-        if not path.exists():
-            return
+        def running() -> bool:
+            return time.perf_counter() < end and not self._stop.is_set()
+
+        try:
+            while running():
+                fd = self._open_flood(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+                try:
+                    for _ in range(blocks_per_file):
+                        if not running():
+                            break
+                        c.write_bytes += os.write(fd, block)
+                    if self._flood_used != "buffered":
+                        os.fsync(fd)
+                    if self._flood_used == "fadvise":
+                        drop_cache(fd)
+                finally:
+                    os.close(fd)
+
+                fd = self._open_flood(path, os.O_RDONLY)
+                try:
+                    while running() and (n := os.readv(fd, [block])):
+                        c.read_bytes += n
+                finally:
+                    os.close(fd)
+        finally:
+            block.close()
 
-        file_size = path.stat().st_size
+    def _random_seek_storm(self, c: _Counters, base: Path, duration: float) -> None:
+        path = base / "random_target.bin"
+        file_size = self._random_size
         end = time.perf_counter() + duration
         rng = random.Random()
+        payload = memoryview(os.urandom(BLOCK_SMALL * _PAYLOAD_BLOCKS))
+        buf = bytearray(BLOCK_SMALL)
+        write_lat = c.histogram("random_write")
+        read_lat = c.histogram("random_read")
+        perf_ns = time.perf_counter_ns
+        written = read = ops = 0
 
-        with path.open("r+b") as f:
+        fd = os.open(path, os.O_RDWR)
+        try:
             while time.perf_counter() < end and not self._stop.is_set():
                 offset = rng.randint(0, max(0, file_size - BLOCK_SMALL))
-                f.seek(offset)
                 if rng.random() < 0.5:
-                    f.write(os.urandom(BLOCK_SMALL))
-                    self._add("write_bytes", BLOCK_SMALL)
+                    i = ops % _PAYLOAD_BLOCKS * BLOCK_SMALL
+                    t0 = perf_ns()
+                    written += os.pwrite(fd, payload[i:i + BLOCK_SMALL], offset)
+                    write_lat.record(perf_ns() - t0)
                 else:
-                    data = f.read(BLOCK_SMALL)
-                    self._add("read_bytes", len(data))
-                self._add("random_ops", 1)
+                    t0 = perf_ns()
+                    read += os.preadv(fd, [buf], offset)
+                    read_lat.record(perf_ns() - t0)
+                ops += 1
+                if ops % _FLUSH_EVERY == 0:
+                    c.write_bytes, c.read_bytes, c.random_ops = written, read, ops
+        finally:
+            os.close(fd)
+            c.write_bytes, c.read_bytes, c.random_ops = written, read, ops
 
-    def _metadata_churn(self, base: Path, duration: float) -> None:
+    def _metadata_churn(self, c: _Counters, base: Path, duration: float) -> None:
         churn_dir = base / "meta_churn"
         churn_dir.mkdir(exist_ok=True)
         end = time.perf_counter() + duration
+        create_lat = c.histogram("create")
+        unlink_lat = c.histogram("unlink")
+        perf_ns = time.perf_counter_ns
         idx = 0
 
         while time.perf_counter() < end and not self._stop.is_set():
             batch: list[Path] = []
             for _ in range(256):
                 p = churn_dir / f"{idx}.tmp"
+                t0 = perf_ns()
                 p.write_bytes(struct.pack("Q", idx))  # 8-byte file
+                create_lat.record(perf_ns() - t0)
                 batch.append(p)
                 idx += 1
             for p in batch:
+                t0 = perf_ns()
                 try:
                     p.unlink()
                 except FileNotFoundError:
                     pass
-            self._add("metadata_ops", len(batch) * 2)  # create + delete
+                unlink_lat.record(perf_ns() - t0)
+            c.metadata_ops += len(batch) * 2  # create + delete
 
-    def _fsync_gauntlet(self, base: Path, duration: float) -> None:
+    def _fsync_gauntlet(self, c: _Counters, base: Path, duration: float) -> None:
         path = base / "fsync_target.bin"
         end = time.perf_counter() + duration
         block = os.urandom(BLOCK_SMALL)
+        fsync_lat = c.histogram("fsync")
+        perf_ns = time.perf_counter_ns
 
         with path.open("wb") as f:
             while time.perf_counter() < end and not self._stop.is_set():
                 f.write(block)
                 f.flush()
+                t0 = perf_ns()
                 os.fsync(f.fileno())
-                self._add("write_bytes", BLOCK_SMALL)
-                self._add("fsyncs", 1)
+                fsync_lat.record(perf_ns() - t0)
+                c.write_bytes += BLOCK_SMALL
+                c.fsyncs += 1
 
         try:
             path.unlink()
         except FileNotFoundError:
             pass
 
+    def _mmap_touch(self, c: _Counters, base: Path, duration: float) -> None:
+        path = base / "mmap_target.bin"
+        size = self._mmap_size
+        pages = size // mmap.PAGESIZE
+        end = time.perf_counter() + duration
+        rng = random.Random()
+        msync_lat = c.histogram("msync")
+        perf_ns = time.perf_counter_ns
+
+        fd = os.open(path, os.O_RDWR)
+        try:
+            mm = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+
+        faults0 = _fault_counts()
+        touched = dirty = 0
+        sequential = True
+
+        def publish() -> None:
+            c.mmap_bytes = touched * mmap.PAGESIZE
+            now = _fault_counts()
+            if now is not None:
+                c.major_faults = now[0] - faults0[0]
+                c.minor_faults = now[1] - faults0[1]
+
+        def msync() -> None:
+            t0 = perf_ns()
+            mm.flush()
+            msync_lat.record(perf_ns() - t0)
+            c.msyncs += 1
+
+        try:
+            while time.perf_counter() < end and not self._stop.is_set():
+                _madvise(mm, "MADV_SEQUENTIAL" if sequential else "MADV_RANDOM")
+                for i in range(pages):
+                    if i % _FLUSH_EVERY == 0:
+                        publish()
+                        if time.perf_counter() >= end or self._stop.is_set():
+                            break
+                    if sequential:
+                        mm[i * mmap.PAGESIZE]          # read fault
+                    else:
+                        off = rng.randrange(pages) * mmap.PAGESIZE
+                        if i & 1:
+                            mm[off] = i & 0xFF          # dirty the page
+                            dirty += 1
+                            if dirty % self._msync_every == 0:
+                                msync()
+                        else:
+                            mm[off]
+                    touched += 1
+
+                # Write back, then drop both the mapping and the page cache so
+                # the next pass faults from the device again.
+                msync()
+                _madvise(mm, "MADV_DONTNEED")
+                if hasattr(os, "posix_fadvise"):
+                    with path.open("rb") as f:
+                        drop_cache(f.fileno())
+                sequential = not sequential
+        finally:
+            publish()
+            mm.close()
+
     def start(self, duration: float = 60) -> None:
+        """Run the five I/O workers (in each of *processes*) for *duration* seconds.
+
+        In adaptive mode *duration* is nominal: the phase ends once combined
+        read+write throughput is steady, or at *max_extension* times
+        *duration* if it never settles.
+        """
         self._stop.clear()
+        self._duration = duration
+        self._flood_used = self._flood_mode
+        self.prepare()
+        base = Path(self._tempdir)
+        if self._adaptive:
+            duration *= self._max_extension
+
+        # Everything above is setup; the measured window starts here.
         self._start_time = time.perf_counter()
-        self._tempdir = tempfile.mkdtemp(prefix="chronos_io_")
+        self._stopped_at = None
+        if self._adaptive:
+            self._monitor = SteadyStateMonitor(
+                self._bytes_moved,
+                self._duration,
+                duration,
+                on_finish=self._stop.set,
+            )
+        if self._processes > 1:
+            self._child_duration.value = duration
+            self._child_go.set()
+        else:
+            self._start_threads(base, duration)
+        if self._monitor is not None:
+            self._monitor.start()
+
+    def prepare(self) -> None:
+        """Create the scratch directory and write the files the workers read.
+
+        Preallocation writes and fsyncs up to RANDOM_FILE_MB + MMAP_FILE_MB
+        per worker, so it must happen before any window opens. With
+        processes > 1 this spawns the workers and returns once each has
+        its files. start() calls it when the caller hasn't; a caller that
+        meters the phase calls it first, so setup isn't metered either.
+        """
+        if self._tempdir is not None:
+            return
+        self._tempdir = tempfile.mkdtemp(prefix="chronos_io_", dir=self._directory)
         base = Path(self._tempdir)
-        flood_path = base / "flood.bin"
+        if self._processes > 1:
+            self._start_processes(base)
+            return
+        self._flood_size = self._flood_mb * 1024 * 1024 if self._flood_mb else _flood_bytes(base)
+        self._flood_size = max(self._flood_size // BLOCK_LARGE, 1) * BLOCK_LARGE
+        self._mmap_size = min(MMAP_FILE_MB * 1024 * 1024, self._flood_size)
+        self._random_size = min(RANDOM_FILE_MB * 1024 * 1024, self._flood_size)
+        preallocate(base / "random_target.bin", self._random_size)
+        preallocate(base / "mmap_target.bin", self._mmap_size)
 
-        workers = [
-            threading.Thread(target=self._sequential_flood,  args=(flood_path, duration), daemon=True),
-            threading.Thread(target=self._random_seek_storm, args=(flood_path, duration), daemon=True),
-            threading.Thread(target=self._metadata_churn,    args=(base, duration),       daemon=True),
-            threading.Thread(target=self._fsync_gauntlet,    args=(base, duration),       daemon=True),
-        ]
+    def _start_threads(self, base: Path, duration: float) -> None:
+        self._progress = None
 
-        self._threads = workers
-        for t in workers:
+        jobs = [
+            (self._sequential_flood,  base / "flood.bin"),
+            (self._random_seek_storm, base),
+            (self._metadata_churn,    base),
+            (self._fsync_gauntlet,    base),
+            (self._mmap_touch,        base),
+        ]
+        self._counters = [_Counters() for _ in jobs]
+        self._threads = [
+            threading.Thread(target=fn, args=(c, target, duration), daemon=True)
+            for (fn, target), c in zip(jobs, self._counters)
+        ]
+        for t in self._threads:
             t.start()
 
-    def stop(self) -> None:
+    def _start_processes(self, base: Path) -> None:
+        # The RAM-scaled flood budget is shared between the workers, so N
+        # workers don't write N times as much.
+        flood_mb = self._flood_mb or max(_flood_bytes(base) // self._processes // (1024 * 1024), BLOCK_LARGE // (1024 * 1024))
+        options = {
+            "flood_mode":  self._flood_mode,
+            "msync_every": self._msync_every,
+            "flood_mb":    flood_mb,
+        }
+        self._counters = []
+        self._workers = []
+        self._child_stop = mp.Event()
+        self._child_go = mp.Event()
+        self._child_duration = mp.Value("d", 0.0, lock=False)
+        self._progress = mp.Array("Q", self._processes, lock=False)
+        self._children = []
+        for i in range(self._processes):
+            worker_dir = base / f"worker{i}"
+            worker_dir.mkdir()
+            recv, send = mp.Pipe(duplex=False)
+            proc = mp.Process(
+                target=_io_process,
+                args=({**options, "directory": str(worker_dir)}, self._child_duration, self._child_go, self._child_stop, self._progress, i, send),
+                daemon=True,
+            )
+            proc.start()
+            send.close()
+            self._children.append((proc, recv))
+        # Wait until every worker has its files; one that died during setup
+        # is reported by _collect_processes.
+        for _, recv in self._children:
+            try:
+                recv.recv()
+            except EOFError:
+                pass
+
+    def _collect_processes(self) -> None:
+        self._child_stop.set()
+        self._child_go.set()  # releases workers stopped before start(); they finish at once
+        for i, (proc, recv) in enumerate(self._children):
+            try:
+                snap = recv.recv() if recv.poll(30) else None
+            except EOFError:
+                snap = None
+            proc.join(timeout=5)
+            if snap is None:
+                self._workers.append({"worker": i, "error": f"worker exited ({proc.exitcode}) without a result"})
+                continue
+            self._counters.extend(snap["counters"])
+            self._flood_used = snap["flood_mode"]
+            self._flood_size = snap["flood_size"]
+            self._mmap_size = snap["mmap_size"]
+            self._workers.append({"worker": i, **snap["result"]})
+        self._children = []
+
+    def _snapshot(self) -> dict:
+        """What a worker process sends back: raw counters plus its own result."""
+        return {
+            "counters":   self._counters,
+            "flood_mode": self._flood_used,
+            "flood_size": self._flood_size,
+            "mmap_size":  self._mmap_size,
+            "result":     self.result(),
+        }
+
+    @property
+    def finished(self) -> bool:
+        if self._monitor is not None:
+            return self._monitor.finished
+        return time.perf_counter() - self._start_time >= self._duration
+
+    def _halt(self) -> None:
+        """Tell every worker to stop and close the measured window; doesn't wait."""
+        if self._monitor is not None:
+            self._monitor.stop()
         self._stop.set()
+        if self._stopped_at is None:
+            self._stopped_at = time.perf_counter()
+
+    def stop(self) -> None:
+        self._halt()
         for t in self._threads:
             t.join(timeout=3)
-        self._metrics["duration_s"] = time.perf_counter() - self._start_time
+        if self._children:
+            self._collect_processes()
+        self._elapsed = self._stopped_at - self._start_time
         if self._tempdir:
             try:
                 shutil.rmtree(self._tempdir)
             except Exception:
                 pass
+            self._tempdir = None
 
-    def result(self) -> dict:
-        dur = max(self._metrics["duration_s"], 1.0)
-        rb  = self._metrics["read_bytes"]
-        wb  = self._metrics["write_bytes"]
+    def _latency(self) -> dict[str, dict]:
+        merged: dict[str, LatencyHistogram] = {}
+        for c in self._counters:
+            for op, hist in c.latency.items():
+                merged.setdefault(op, LatencyHistogram()).merge(hist)
+        return {op: hist.summary(scale=1e-3, unit="us") for op, hist in merged.items()}
+
+    def _mmap_result(self, dur: float) -> dict:
         return {
+            "mb_s":               round(self._total("mmap_bytes") / 1024 / 1024 / dur, 2),
+            "major_faults_per_s": round(self._total("major_faults") / dur, 1),
+            "minor_faults_per_s": round(self._total("minor_faults") / dur, 1),
+            "msyncs":             self._total("msyncs"),
+            "msync_every":        self._msync_every,
+            "file_mb":            self._mmap_size // 1024 // 1024,
+            # RUSAGE_THREAD is Linux-only; elsewhere faults are process-wide
+            "fault_scope":        "thread" if hasattr(resource, "RUSAGE_THREAD") else "process",
+        }
+
+    def result(self) -> dict:
+        dur = max(self._elapsed, 1.0)
+        rb  = self._total("read_bytes")
+        wb  = self._total("write_bytes")
+        out = {
             "read_mb_s":    round(rb / 1024 / 1024 / dur, 2),
             "write_mb_s":   round(wb / 1024 / 1024 / dur, 2),
-            "fsyncs":       self._metrics["fsyncs"],
-            "metadata_ops": self._metrics["metadata_ops"],
-            "random_ops":   self._metrics["random_ops"],
+            "fsyncs":       self._total("fsyncs"),
+            "metadata_ops": self._total("metadata_ops"),
+            "random_ops":   self._total("random_ops"),
             "duration_s":   round(dur, 3),
+            "flood_mode":   self._flood_used,
+            "flood_file_mb": self._flood_size // 1024 // 1024,
+            "mmap":         self._mmap_result(dur),
+            "latency":      self._latency(),
+            "target":       _device_info(self._directory),
         }
+        if self._processes > 1:
+            out["processes"] = self._processes
+            out["workers"] = self._workers
+        if self._monitor is not None:
+            out["steady_state"] = self._monitor.summary()
+        return out
+
+
+class MultiDeviceIO:
+    """IOStress against several target directories (typically one per volume).
+
+    "concurrent" runs every directory for the whole phase at once, which
+    loads the volumes (and any shared controller or bus) together.
+    "sequential" gives each directory an equal slice of the phase in turn,
+    so each volume is measured alone. Either way every volume's files are
+    prepared before the first window opens, so no volume's setup is timed
+    or charged to the phase.
+    """
+
+    def __init__(self, directories: list[str], mode: str = "concurrent", **options) -> None:
+        if mode not in DEVICE_MODES:
+            raise ValueError(f"unknown device mode: {mode!r} (expected one of {DEVICE_MODES})")
+        if not directories:
+            raise ValueError("MultiDeviceIO needs at least one directory")
+        missing = [d for d in directories if not os.path.isdir(d)]
+        if missing:
+            raise ValueError(f"I/O target directories do not exist: {missing}")
+        self._directories = list(directories)
+        self._mode = mode
+        self._runs = [IOStress(directory=d, **options) for d in directories]
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._current = "I/O Stress"
+
+    def prepare(self) -> None:
+        for run in self._runs:
+            run.prepare()
+
+    def start(self, duration: float = 60) -> None:
+        self._stop.clear()
+        self.prepare()
+        if self._mode == "concurrent":
+            self._current = f"I/O Stress × {len(self._runs)} devices"
+            for run in self._runs:
+                run.start(duration)
+        else:
+            self._thread = threading.Thread(target=self._run_sequential, args=(duration / len(self._runs),), daemon=True)
+            self._thread.start()
+
+    def _run_sequential(self, slice_s: float) -> None:
+        for directory, run in zip(self._directories, self._runs):
+            if self._stop.is_set():
+                break
+            self._current = f"I/O Stress — {directory}"
+            run.start(slice_s)
+            while not run.finished and not self._stop.is_set():
+                time.sleep(0.1)
+            run.stop()
+
+    @property
+    def finished(self) -> bool:
+        if self._mode == "concurrent":
+            return all(run.finished for run in self._runs)
+        return self._thread is not None and not self._thread.is_alive()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._mode == "concurrent":
+            # Close every volume's window before joining any, so they stop together.
+            for run in self._runs:
+                run._halt()
+            for run in self._runs:
+                run.stop()
+        elif self._thread:
+            self._thread.join(timeout=30)
+
+    def result(self) -> dict:
+        devices = {d: run.result() for d, run in zip(self._directories, self._runs)}
+        out = {"mode": self._mode, "devices": devices}
+        if self._mode == "concurrent":
+            # Volumes ran side by side, so their throughput adds up.
+            out["read_mb_s"] = round(sum(r["read_mb_s"] for r in devices.values()), 2)
+            out["write_mb_s"] = round(sum(r["write_mb_s"] for r in devices.values()), 2)
+        return out
+
+    @property
+    def current_subtest(self) -> str:
+        return self._current
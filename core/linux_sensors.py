@@ -0,0 +1,226 @@
+"""Linux sensors straight from sysfs and procfs, cheap enough for 10–100 Hz.
+
+psutil re-opens and re-parses its sources on every call and has nothing
+for RAPL power. This module discovers every file it needs once, keeps
+each one open, and re-reads it with os.pread(fd, n, 0). sysfs and procfs
+regenerate a file's contents on every read at offset 0, so one sample
+costs one syscall per file and no path lookups.
+
+  temperatures — hwmon (coretemp / k10temp / zenpower package sensors),
+                 else thermal_zone*; °C, hottest sensor wins
+  power        — RAPL energy counters under /sys/class/powercap, turned
+                 into package and DRAM watts from successive deltas
+  frequency    — per-core cpufreq/scaling_cur_freq, MHz
+  utilisation  — per-core busy % from /proc/stat jiffy deltas
+  GPU          — amdgpu hwmon (temp, power) and gpu_busy_percent
+
+Files that don't exist or can't be opened (RAPL energy_uj is root-only on
+many distributions) are skipped, and their fields stay None. *root*
+exists for tests: point it at a copied or synthetic tree.
+"""
+
+import glob
+import os
+import re
+import time
+
+_CPU_HWMON     = {"coretemp", "k10temp", "zenpower", "cpu_thermal"}
+_CPU_LABELS    = {"Package id 0", "Tctl", "Tdie"}
+_CPU_ZONES     = ("x86_pkg_temp", "cpu", "soc")
+_GPU_HWMON     = {"amdgpu"}
+_READ_SIZE     = 4096
+_PROC_STAT_MAX = 1 << 20
+
+
+def _read_text(path: str) -> str | None:
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _open(path: str) -> int | None:
+    try:
+        return os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+
+
+def _pread_int(fd: int) -> int | None:
+    try:
+        return int(os.pread(fd, _READ_SIZE, 0))
+    except (OSError, ValueError):
+        return None
+
+
+def _natural(path: str) -> list:
+    return [int(t) if t.isdigit() else t for t in re.split(r"(\d+)", path)]
+
+
+class RaplZone:
+    """One powercap zone ("package" or "dram"): its energy counter and the last reading."""
+
+    def __init__(self, domain: str, fd: int, wrap_uj: int) -> None:
+        self.domain = domain
+        self.fd = fd
+        self.wrap_uj = wrap_uj
+        self.last_uj: int | None = None
+        self.last_t = 0.0
+
+    def delta(self) -> tuple[int, float] | None:
+        """(µJ, seconds) since the previous good read; None on the first or a failed one."""
+        now_t = time.perf_counter()
+        now_uj = _pread_int(self.fd)
+        if now_uj is None:
+            return None
+        last_uj, last_t = self.last_uj, self.last_t
+        self.last_uj, self.last_t = now_uj, now_t
+        if last_uj is None:
+            return None
+        delta = now_uj - last_uj
+        if delta < 0:
+            delta += self.wrap_uj  # counter wrapped
+        return delta, now_t - last_t
+
+    def watts(self) -> float | None:
+        delta = self.delta()
+        if delta is None or delta[1] <= 0:
+            return None
+        return delta[0] / 1e6 / delta[1]
+
+
+def rapl_zones(root: str = "/") -> list[RaplZone]:
+    """Every readable package and DRAM zone under *root*'s powercap tree, in natural order."""
+    zones = []
+    for zone in sorted(glob.glob(os.path.join(root, "sys/class/powercap/intel-rapl:*")), key=_natural):
+        name = _read_text(os.path.join(zone, "name")) or ""
+        if not (name.startswith("package") or name == "dram"):
+            continue
+        fd = _open(os.path.join(zone, "energy_uj"))
+        if fd is None:
+            continue  # absent, or root-only
+        wrap = int(_read_text(os.path.join(zone, "max_energy_range_uj")) or 2 ** 32)
+        zones.append(RaplZone("dram" if name == "dram" else "package", fd, wrap))
+    return zones
+
+
+class LinuxSensors:
+    def __init__(self, root: str = "/") -> None:
+        self._root = root
+        self._fds: list[int] = []
+        self._cpu_temps = self._cpu_temp_fds()
+        self._gpu_temp, self._gpu_power, self._gpu_busy = self._gpu_fds()
+        self._package, self._dram = self._rapl_zones()
+        self._freqs = self._keep(sorted(
+            glob.glob(self._path("sys/devices/system/cpu/cpu[0-9]*/cpufreq/scaling_cur_freq")), key=_natural,
+        ))
+        self._stat = _open(self._path("proc/stat"))
+        if self._stat is not None:
+            self._fds.append(self._stat)
+        self._last_stat: list[tuple[int, int]] | None = None
+
+    @property
+    def available(self) -> bool:
+        return bool(self._fds)
+
+    def _path(self, rel: str) -> str:
+        return os.path.join(self._root, rel)
+
+    def _keep(self, paths: list[str]) -> list[int]:
+        fds = [fd for fd in map(_open, paths) if fd is not None]
+        self._fds.extend(fds)
+        return fds
+
+    def _cpu_temp_fds(self) -> list[int]:
+        preferred, others = [], []
+        for hwmon in sorted(glob.glob(self._path("sys/class/hwmon/hwmon*"))):
+            if _read_text(os.path.join(hwmon, "name")) not in _CPU_HWMON:
+                continue
+            for temp in sorted(glob.glob(os.path.join(hwmon, "temp*_input")), key=_natural):
+                label = _read_text(temp.replace("_input", "_label"))
+                (preferred if label in _CPU_LABELS else others).append(temp)
+        if preferred or others:
+            return self._keep(preferred or others)
+
+        zones = sorted(glob.glob(self._path("sys/class/thermal/thermal_zone*")), key=_natural)
+        cpu_zones = [z for z in zones if (_read_text(os.path.join(z, "type")) or "").startswith(_CPU_ZONES)]
+        return self._keep([os.path.join(z, "temp") for z in cpu_zones or zones])
+
+    def _gpu_fds(self) -> tuple[int | None, int | None, int | None]:
+        for hwmon in sorted(glob.glob(self._path("sys/class/hwmon/hwmon*"))):
+            if _read_text(os.path.join(hwmon, "name")) not in _GPU_HWMON:
+                continue
+            power = next((p for p in ("power1_average", "power1_input") if os.path.exists(os.path.join(hwmon, p))), None)
+            fds = self._keep([os.path.join(hwmon, "temp1_input")])
+            temp = fds[0] if fds else None
+            fds = self._keep([os.path.join(hwmon, power)]) if power else []
+            watts = fds[0] if fds else None
+            fds = self._keep([os.path.join(hwmon, "device", "gpu_busy_percent")])
+            busy = fds[0] if fds else None
+            return temp, watts, busy
+        return None, None, None
+
+    def _rapl_zones(self) -> tuple[list[RaplZone], list[RaplZone]]:
+        zones = rapl_zones(self._root)
+        self._fds.extend(z.fd for z in zones)
+        return [z for z in zones if z.domain == "package"], [z for z in zones if z.domain == "dram"]
+
+    def _utilisation(self) -> tuple[float | None, list[float]]:
+        """Busy % overall and per core since the previous call."""
+        if self._stat is None:
+            return None, []
+        try:
+            text = os.pread(self._stat, _PROC_STAT_MAX, 0).decode("ascii", errors="ignore")
+        except OSError:
+            return None, []
+        now: list[tuple[int, int]] = []
+        for line in text.splitlines():
+            if not line.startswith("cpu"):
+                break
+            fields = [int(v) for v in line.split()[1:]]
+            idle = fields[3] + (fields[4] if len(fields) > 4 else 0)  # idle + iowait
+            now.append((sum(fields), idle))
+
+        last, self._last_stat = self._last_stat, now
+        if last is None or len(last) != len(now):
+            return None, []
+        busy = []
+        for (total, idle), (total0, idle0) in zip(now, last):
+            dt = total - total0
+            busy.append(round((1 - (idle - idle0) / dt) * 100, 1) if dt > 0 else 0.0)
+        return busy[0], busy[1:]
+
+    @staticmethod
+    def _sum_watts(zones: list[RaplZone]) -> float | None:
+        watts = [w for w in (z.watts() for z in zones) if w is not None]
+        return round(sum(watts), 2) if watts else None
+
+    def sample(self) -> dict:
+        """One reading of everything that was found; missing sources are None / []."""
+        temps = [t for t in map(_pread_int, self._cpu_temps) if t is not None]
+        freqs = [f for f in map(_pread_int, self._freqs) if f is not None]
+        total, cores = self._utilisation()
+        gpu_temp  = _pread_int(self._gpu_temp)  if self._gpu_temp  is not None else None
+        gpu_power = _pread_int(self._gpu_power) if self._gpu_power is not None else None
+        gpu_busy  = _pread_int(self._gpu_busy)  if self._gpu_busy  is not None else None
+        return {
+            "cpu_percent":   total,
+            "core_percent":  cores,
+            "cpu_freq":      round(sum(freqs) / len(freqs) / 1000) if freqs else None,
+            "core_freq_mhz": [round(f / 1000) for f in freqs],
+            "cpu_temp":      max(temps) / 1000 if temps else None,
+            "cpu_power_w":   self._sum_watts(self._package),
+            "dram_power_w":  self._sum_watts(self._dram),
+            "gpu_percent":   gpu_busy,
+            "gpu_temp":      gpu_temp / 1000 if gpu_temp is not None else None,
+            "gpu_power_w":   round(gpu_power / 1e6, 2) if gpu_power is not None else None,
+        }
+
+    def close(self) -> None:
+        for fd in self._fds:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._fds = []
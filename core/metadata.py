@@ -0,0 +1,343 @@
+"""Metadata engine: where dentry and inode caching break down at scale.
+
+IOStress's metadata churn creates and deletes a few hundred tiny files
+in one flat directory, which every filesystem caches comfortably. This
+runs a sequence of jobs, each splitting the phase evenly, with *threads*
+churners in parallel (and optionally in *processes* processes):
+
+  churn     — create + unlink tiny files, each churner in its own directory
+  fanout    — build a width × depth directory tree with a file in every
+              leaf, then tear it down bottom-up (mkdir/create/unlink/rmdir)
+  populate  — fill one shared directory towards *entries* files (100k by
+              default), all churners creating into it at once — across
+              processes too, each process under its own name prefix
+  stat      — random os.stat() over the populated directory
+  rename    — random renames inside the populated directory
+  readdir   — full listings of the populated directory
+
+Every operation is timed into a LatencyHistogram per op type. The result
+gives ops/s per op type for each job and the merged latency distribution.
+"""
+
+import multiprocessing as mp
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from core.histogram import LatencyHistogram
+
+JOBS    = ("churn", "fanout", "populate", "stat", "rename", "readdir")
+ENTRIES = 100_000
+FANOUT  = (8, 3)                 # width, depth → 8 + 64 + 512 directories
+THREADS = 4
+
+_CHURN_BATCH = 256
+_PAYLOAD     = b"chronos\n"      # 8-byte file body
+
+
+class _Churner:
+    """One churner thread's state: its op histograms and its share of the big directory."""
+
+    def __init__(self, index: int, prefix: str = "") -> None:
+        self.index = index
+        self.prefix = prefix
+        self.latency: dict[str, LatencyHistogram] = {}
+        self.names: list[str] = []
+
+    def timed(self, op: str, fn, *args):
+        hist = self.latency.get(op)
+        if hist is None:
+            hist = self.latency[op] = LatencyHistogram()
+        t0 = time.perf_counter_ns()
+        out = fn(*args)
+        hist.record(time.perf_counter_ns() - t0)
+        return out
+
+
+def _create(path: str) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, _PAYLOAD)
+    finally:
+        os.close(fd)
+
+
+def _count_entries(path: str) -> int:
+    with os.scandir(path) as it:
+        return sum(1 for _ in it)
+
+
+def _churn(w: _Churner, base: Path, deadline: float, stop: threading.Event) -> None:
+    own = base / f"churn{w.index}"
+    own.mkdir(exist_ok=True)
+    idx = 0
+    while time.perf_counter() < deadline and not stop.is_set():
+        batch = [str(own / f"{idx + i}.tmp") for i in range(_CHURN_BATCH)]
+        idx += _CHURN_BATCH
+        for p in batch:
+            w.timed("create", _create, p)
+        for p in batch:
+            w.timed("unlink", os.unlink, p)
+
+
+def _fanout(w: _Churner, base: Path, deadline: float, stop: threading.Event, width: int, depth: int) -> None:
+    root = base / f"tree{w.index}"
+    while time.perf_counter() < deadline and not stop.is_set():
+        w.timed("mkdir", os.mkdir, root)
+        level = [str(root)]
+        dirs: list[list[str]] = []
+        for _ in range(depth):
+            level = [os.path.join(parent, f"d{i}") for parent in level for i in range(width)]
+            for d in level:
+                w.timed("mkdir", os.mkdir, d)
+            dirs.append(level)
+        leaves = [os.path.join(d, "f") for d in level]
+        for f in leaves:
+            w.timed("create", _create, f)
+        for f in leaves:
+            w.timed("unlink", os.unlink, f)
+        for level in reversed(dirs):
+            for d in level:
+                w.timed("rmdir", os.rmdir, d)
+        w.timed("rmdir", os.rmdir, root)
+
+
+def _populate(w: _Churner, big: Path, deadline: float, stop: threading.Event, quota: int) -> None:
+    while len(w.names) < quota and time.perf_counter() < deadline and not stop.is_set():
+        name = f"{w.prefix}e{w.index}_{len(w.names)}"
+        w.timed("create", _create, str(big / name))
+        w.names.append(name)
+
+
+def _stat(w: _Churner, big: Path, deadline: float, stop: threading.Event) -> None:
+    if not w.names:
+        return
+    rng = random.Random()
+    while time.perf_counter() < deadline and not stop.is_set():
+        w.timed("stat", os.stat, str(big / rng.choice(w.names)))
+
+
+def _rename(w: _Churner, big: Path, deadline: float, stop: threading.Event) -> None:
+    # Each churner only renames its own entries, so names never collide.
+    if not w.names:
+        return
+    rng = random.Random()
+    while time.perf_counter() < deadline and not stop.is_set():
+        i = rng.randrange(len(w.names))
+        old = w.names[i]
+        new = old[:-2] if old.endswith(".r") else old + ".r"
+        w.timed("rename", os.rename, str(big / old), str(big / new))
+        w.names[i] = new
+
+
+def _readdir(w: _Churner, big: Path, deadline: float, stop: threading.Event) -> int:
+    entries = 0
+    while time.perf_counter() < deadline and not stop.is_set():
+        entries += w.timed("readdir", _count_entries, str(big))
+    return entries
+
+
+def _meta_process(options: dict, big: str, worker: int, duration: float, stop, conn) -> None:
+    """One worker process of a multi-process run: the full job sequence.
+
+    churn and fanout run in the process's own directory; populate, stat,
+    rename and readdir share *big* with every other process, this one's
+    entries named under its own prefix.
+    """
+    engine = MetadataStress(**options)
+    engine._big = Path(big)
+    engine._prefix = f"p{worker}_"
+    engine.start(duration)
+    while not engine.finished and not stop.is_set():
+        time.sleep(0.1)
+    engine.stop()
+    conn.send((engine._jobs, engine._histograms(), engine._entries))
+    conn.close()
+
+
+class MetadataStress:
+    def __init__(
+        self,
+        threads: int = THREADS,
+        processes: int = 1,
+        entries: int = ENTRIES,
+        fanout: tuple[int, int] = FANOUT,
+        jobs: tuple[str, ...] = JOBS,
+        directory: str | None = None,
+    ) -> None:
+        unknown = [j for j in jobs if j not in JOBS]
+        if unknown:
+            raise ValueError(f"unknown metadata job(s): {unknown} (expected a subset of {JOBS})")
+        if threads < 1 or processes < 1:
+            raise ValueError(f"threads and processes must be at least 1, got {threads} / {processes}")
+        if len(fanout) != 2 or min(fanout) < 1:
+            raise ValueError(f"fanout must be (width, depth) with both >= 1, got {fanout!r}")
+        self._threads = threads
+        self._processes = processes
+        self._quota = max(entries // (threads * processes), 1)
+        self._fanout = tuple(fanout)
+        self._job_names = tuple(jobs)
+        self._directory = directory
+        self._big: Path | None = None     # shared big directory (multi-process children)
+        self._prefix = ""
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._tempdir: str | None = None
+        self._churners: list[_Churner] = []
+        self._jobs: dict[str, dict] = {}
+        self._entries = 0
+        self._merged: dict[str, LatencyHistogram] = {}
+        self._current = "Metadata Engine"
+
+    def start(self, duration: float = 60) -> None:
+        self._stop.clear()
+        self._jobs = {}
+        self._merged = {}
+        self._entries = 0
+        self._tempdir = tempfile.mkdtemp(prefix="chronos_meta_", dir=self._directory)
+        if self._processes > 1:
+            # Fork from the calling thread, not from a helper thread.
+            self._thread = threading.Thread(target=self._collect, args=self._spawn(Path(self._tempdir), duration), daemon=True)
+        else:
+            self._thread = threading.Thread(target=self._run, args=(Path(self._tempdir), duration), daemon=True)
+        self._thread.start()
+
+    def _run(self, base: Path, duration: float) -> None:
+        big = self._big
+        if big is None:
+            big = base / "big"
+            big.mkdir()
+        self._churners = [_Churner(i, self._prefix) for i in range(self._threads)]
+        end = time.perf_counter() + duration
+        width, depth = self._fanout
+        bodies = {
+            "churn":    lambda w, dl: _churn(w, base, dl, self._stop),
+            "fanout":   lambda w, dl: _fanout(w, base, dl, self._stop, width, depth),
+            "populate": lambda w, dl: _populate(w, big, dl, self._stop, self._quota),
+            "stat":     lambda w, dl: _stat(w, big, dl, self._stop),
+            "rename":   lambda w, dl: _rename(w, big, dl, self._stop),
+            "readdir":  lambda w, dl: _readdir(w, big, dl, self._stop),
+        }
+
+        with ThreadPoolExecutor(max_workers=self._threads) as pool:
+            for i, job in enumerate(self._job_names):
+                if self._stop.is_set():
+                    break
+                self._current = f"Metadata: {job}"
+                remaining = end - time.perf_counter()
+                deadline = time.perf_counter() + max(remaining / (len(self._job_names) - i), 0.5)
+                before = {op: h.count for op, h in self._histograms().items()}
+                start = time.perf_counter()
+                results = list(pool.map(lambda w: bodies[job](w, deadline), self._churners))
+                elapsed = max(time.perf_counter() - start, 1e-9)
+
+                after = self._histograms()
+                ops = {op: h.count - before.get(op, 0) for op, h in after.items() if h.count > before.get(op, 0)}
+                entry = {
+                    "elapsed_s": round(elapsed, 3),
+                    "ops_per_s": {op: round(n / elapsed, 1) for op, n in ops.items()},
+                }
+                if job == "readdir":
+                    entry["entries_per_s"] = round(sum(results) / elapsed, 1)
+                if job == "populate":
+                    self._entries = sum(len(w.names) for w in self._churners)
+                    entry["entries"] = self._entries
+                # Copy-on-write: live_rates() iterates _jobs from another thread.
+                self._jobs = {**self._jobs, job: entry}
+
+    def _spawn(self, base: Path, duration: float) -> tuple[list, object]:
+        stop = mp.Event()
+        big = base / "big"
+        big.mkdir()
+        options = {
+            "threads": self._threads,
+            "entries": self._quota * self._threads,
+            "fanout":  self._fanout,
+            "jobs":    self._job_names,
+        }
+        children = []
+        for i in range(self._processes):
+            worker_dir = base / f"worker{i}"
+            worker_dir.mkdir()
+            recv, send = mp.Pipe(duplex=False)
+            proc = mp.Process(target=_meta_process, args=({**options, "directory": str(worker_dir)}, str(big), i, duration, stop, send), daemon=True)
+            proc.start()
+            send.close()
+            children.append((proc, recv))
+        return children, stop
+
+    def _collect(self, children: list, stop) -> None:
+        self._current = f"Metadata × {self._processes} processes"
+        # Wait on the pipes rather than the processes: a child can't exit
+        # until its (larger than a pipe buffer) result has been read.
+        while not all(recv.poll() for _, recv in children) and not self._stop.is_set():
+            time.sleep(0.1)
+        stop.set()
+
+        merged: dict[str, dict] = {}
+        for proc, recv in children:
+            try:
+                jobs, hists, entries = recv.recv() if recv.poll(30) else ({}, {}, 0)
+            except EOFError:
+                jobs, hists, entries = {}, {}, 0
+            proc.join(timeout=5)
+            self._entries += entries
+            for op, hist in hists.items():
+                self._merged.setdefault(op, LatencyHistogram()).merge(hist)
+            # Processes ran side by side, so their rates add up.
+            for job, data in jobs.items():
+                into = merged.setdefault(job, {"elapsed_s": 0.0, "ops_per_s": {}})
+                into["elapsed_s"] = max(into["elapsed_s"], data["elapsed_s"])
+                for op, rate in data["ops_per_s"].items():
+                    into["ops_per_s"][op] = round(into["ops_per_s"].get(op, 0.0) + rate, 1)
+                for key in ("entries_per_s", "entries"):
+                    if key in data:
+                        into[key] = round(into.get(key, 0) + data[key], 1)
+        self._jobs = merged
+
+    def _histograms(self) -> dict[str, LatencyHistogram]:
+        if self._processes > 1:
+            return self._merged
+        merged: dict[str, LatencyHistogram] = {}
+        for w in self._churners:
+            for op, hist in list(w.latency.items()):
+                merged.setdefault(op, LatencyHistogram()).merge(hist)
+        return merged
+
+    @property
+    def finished(self) -> bool:
+        return self._thread is not None and not self._thread.is_alive()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=30)
+        if self._tempdir:
+            shutil.rmtree(self._tempdir, ignore_errors=True)
+
+    def live_rates(self) -> dict[str, float]:
+        """ops/s of each finished job, per op type."""
+        return {
+            f"{job} {op}": rate
+            for job, data in self._jobs.items()
+            for op, rate in data["ops_per_s"].items()
+        }
+
+    def result(self) -> dict:
+        return {
+            "threads":   self._threads,
+            "processes": self._processes,
+            "fanout":    {"width": self._fanout[0], "depth": self._fanout[1]},
+            "entries":   self._entries,
+            "jobs":      self._jobs,
+            "latency":   {op: h.summary(scale=1e-3, unit="us") for op, h in self._histograms().items()},
+        }
+
+    @property
+    def current_subtest(self) -> str:
+        return self._current
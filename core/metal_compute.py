@@ -2,40 +2,119 @@
 
 Uses PyTorch MPS on macOS, CUDA where available, falls back to NumPy.
 Note: GPU access is via PyTorch's MPS/CUDA backends, not raw Metal shaders.
+
+Importing this module does not import torch. The backend is probed once,
+on the first gpu_available() / run, and the answer is cached on disk
+keyed by torch version and machine, so later launches answer from the
+cache and only a run that actually uses the GPU pays for importing torch.
 '''
 
+import importlib.metadata
+import importlib.util
+import json
+import os
+import platform
+import sys
 import time
+from pathlib import Path
+
 import numpy as np
 
 # Device detection
 
-gpu_available = False
-backend = "numpy"
-device = None
+_CACHE_PATH = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "chronosbench" / "gpu_backend.json"
+
+backend: str | None = None   # "mps" / "cuda" / "cpu" / "numpy" once probed
+device = None                # torch.device, set when torch is actually loaded
 torch = None
 
-try:
+
+def _torch_version() -> str | None:
+    if importlib.util.find_spec("torch") is None:
+        return None
+    try:
+        return importlib.metadata.version("torch")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _cache_key(version: str) -> dict:
+    return {"torch": version, "platform": sys.platform, "machine": platform.machine(), "python": sys.executable}
+
+
+def _read_cache(key: dict) -> str | None:
+    try:
+        cached = json.loads(_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return None
+    return cached.get("backend") if cached.get("key") == key else None
+
+
+def _write_cache(key: dict, found: str) -> None:
+    try:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _CACHE_PATH.write_text(json.dumps({"key": key, "backend": found}))
+    except OSError:
+        pass  # the cache is an optimisation; a read-only home is fine
+
+
+def _load_torch() -> str:
+    """Import torch, pick the device, and return the backend name."""
+    global torch, device
+
     import torch as _torch
 
     if hasattr(_torch.backends, "mps") and _torch.backends.mps.is_available():
-        device = _torch.device("mps")
-        gpu_available = True
-        backend = "mps"
+        found = "mps"
     elif _torch.cuda.is_available():
-        device = _torch.device("cuda")
-        gpu_available = True
-        backend = "cuda"
+        found = "cuda"
     else:
-        device = _torch.device("cpu")
-        backend = "cpu"
-
+        found = "cpu"
+    device = _torch.device(found)
     torch = _torch
+    return found
 
-except ImportError:
-    pass
 
-# Keep metal_available as a public alias so existing callers don't break.
-metal_available = gpu_available
+def probe(use_cache: bool = True) -> str:
+    """Backend name, probing at most once per process.
+
+    With *use_cache* a result persisted by an earlier launch is trusted
+    without importing torch; torch is loaded later, on first GPU use.
+    """
+    global backend
+    if backend is not None:
+        return backend
+
+    version = _torch_version()
+    if version is None:
+        backend = "numpy"
+        return backend
+
+    key = _cache_key(version)
+    cached = _read_cache(key) if use_cache else None
+    if cached is not None:
+        backend = cached
+        return backend
+
+    try:
+        backend = _load_torch()
+    except Exception:
+        backend = "numpy"
+    _write_cache(key, backend)
+    return backend
+
+
+def gpu_available() -> bool:
+    """Whether an MPS or CUDA device is usable. Cheap after the first call."""
+    return probe() in ("mps", "cuda")
+
+
+def __getattr__(name: str):
+    # metal_available used to be a module-level bool. It is resolved on
+    # first access, so importing this module still doesn't probe.
+    if name == "metal_available":
+        return gpu_available()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Internal state
 
@@ -130,12 +209,29 @@ def _run_gpu(duration: float) -> None:
 
 # Public API
 
+def _ensure_device() -> bool:
+    """Load torch for a cached GPU backend; re-probe if the cache was stale."""
+    global backend
+    if torch is not None:
+        return backend in ("mps", "cuda")
+    try:
+        found = _load_torch()
+    except Exception:
+        found = "numpy"
+    if found != backend:
+        backend = found
+        version = _torch_version()
+        if version is not None:
+            _write_cache(_cache_key(version), found)
+    return found in ("mps", "cuda")
+
+
 def run_metal_particle(duration: float = 30) -> None:
     """Run the GPU (or NumPy fallback) stress workload for *duration* seconds."""
-    if not gpu_available or torch is None:
-        _run_numpy(duration)
-    else:
+    if gpu_available() and _ensure_device():
         _run_gpu(duration)
+    else:
+        _run_numpy(duration)
 
 
 def get_last_metal_result() -> dict:
@@ -10,39 +10,39 @@ import threading
 import time
 
 from core import cpu_stress, io_stress
-
-try:
-    from core.metal_compute import (
-        get_last_metal_result,
-        gpu_available,
-        run_metal_particle,
-    )
-except Exception:
-    gpu_available = False
-
-    def run_metal_particle(d: float) -> None:
-        time.sleep(d)
-
-    def get_last_metal_result() -> dict:
-        return {"note": "gpu not available"}
+from core.metal_compute import get_last_metal_result, gpu_available, run_metal_particle
 
 
 class MixedLoad:
-    def __init__(self) -> None:
-        self._cpu = cpu_stress.CPUStress()
-        self._io  = io_stress.IOStress()
+    def __init__(
+        self,
+        policy: str = "none",
+        cpus: list[int] | None = None,
+        pool: cpu_stress.WorkerPool | None = None,
+        topology: str = "shared",
+        io: "io_stress.IOStress | io_stress.MultiDeviceIO | None" = None,
+    ) -> None:
+        self._cpu = cpu_stress.CPUStress(topology, policy=policy, cpus=cpus, pool=pool)
+        self._io  = io if io is not None else io_stress.IOStress()
         self._gpu_thread: threading.Thread | None = None
         self._started_at: float = 0.0
         self._duration: float = 0.0
 
+    def prepare(self) -> None:
+        """Preallocate the I/O side's files; start() does this itself if needed."""
+        self._io.prepare()
+
     def start(self, duration: float = 60) -> None:
+        # The I/O side preallocates its random and mmap files first, so that
+        # setup doesn't land inside the CPU window.
+        self.prepare()
         self._duration = duration
         self._started_at = time.perf_counter()
 
         self._cpu.start(duration=duration)
         self._io.start(duration=duration)
 
-        if gpu_available:
+        if gpu_available():
             self._gpu_thread = threading.Thread(
                 target=run_metal_particle,
                 args=(duration,),
@@ -60,11 +60,17 @@ class MixedLoad:
         return {
             "cpu": self._cpu.result(),
             "io":  self._io.result(),
-            "gpu": get_last_metal_result() if gpu_available else {"note": "gpu not available"},
+            "gpu": get_last_metal_result() if gpu_available() else {"note": "gpu not available"},
         }
 
+    def live_rates(self) -> dict[str, float]:
+        return self._cpu.live_rates()
+
+    def worker_profiles(self) -> list[dict]:
+        return self._cpu.worker_profiles()
+
     @property
     def current_subtest(self) -> str:
-        if gpu_available:
+        if gpu_available():
             return get_last_metal_result().get("current_test", "Mixed: CPU+GPU+I/O")
         return "Mixed: CPU+I/O"
@@ -0,0 +1,142 @@
+"""Worker placement: which logical CPU each stress process is pinned to.
+
+The topology comes from sysfs on Linux (package, physical core, L3
+domain per logical CPU). Elsewhere every CPU is treated as its own core
+on one package, and pinning is a no-op since os.sched_setaffinity only
+exists on Linux — the chosen plan is still recorded so results say what
+was asked for.
+
+Policies:
+
+  none      — no pinning; the scheduler places and migrates freely.
+  compact   — fill one L3 domain / socket before the next, SMT siblings
+              adjacent. Maximises sharing, minimises cross-socket traffic.
+  scatter   — alternate sockets first, then L3 domains within each
+              socket, then cores; first thread of each core before any
+              SMT sibling.
+  physical  — one worker per physical core (first hardware thread only).
+  explicit  — cycle through a caller-supplied list of CPU ids, all of
+              which must be in this process's affinity mask.
+"""
+
+import os
+from collections import deque
+from pathlib import Path
+
+POLICIES = ("none", "compact", "scatter", "physical", "explicit")
+
+_SYSFS_CPU = Path("/sys/devices/system/cpu")
+
+# (cpu, package, core, l3 domain, thread index within its core)
+CpuInfo = tuple[int, int, int, int, int]
+
+
+def _available_cpus() -> list[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _read_int(path: Path, default: int) -> int:
+    try:
+        return int(path.read_text().strip())
+    except (OSError, ValueError):
+        return default
+
+
+def _read_first_cpu(path: Path, default: int) -> int:
+    """First CPU of a sysfs cpulist like '0-3,8-11' — used as a domain id."""
+    try:
+        return int(path.read_text().strip().split(",")[0].split("-")[0])
+    except (OSError, ValueError):
+        return default
+
+
+def discover_topology() -> list[CpuInfo]:
+    cpus = _available_cpus()
+    infos: list[CpuInfo] = []
+    seen: dict[tuple[int, int], int] = {}
+
+    for cpu in cpus:
+        base    = _SYSFS_CPU / f"cpu{cpu}"
+        package = _read_int(base / "topology" / "physical_package_id", 0)
+        core    = _read_int(base / "topology" / "core_id", cpu)
+        l3      = _read_first_cpu(base / "cache" / "index3" / "shared_cpu_list", package)
+        thread  = seen.get((package, core), 0)
+        seen[(package, core)] = thread + 1
+        infos.append((cpu, package, core, l3, thread))
+
+    return infos
+
+
+def summarize(infos: list[CpuInfo]) -> dict:
+    return {
+        "logical_cpus":   len(infos),
+        "physical_cores": len({(pkg, core) for _, pkg, core, _, _ in infos}),
+        "packages":       len({pkg for _, pkg, _, _, _ in infos}),
+        "l3_domains":     len({(pkg, l3) for _, pkg, _, l3, _ in infos}),
+    }
+
+
+def _scatter_order(infos: list[CpuInfo]) -> list[int]:
+    packages: dict[int, dict[int, deque[int]]] = {}
+    for cpu, package, _, l3, _ in sorted(infos, key=lambda i: (i[4], i[1], i[3], i[2])):
+        packages.setdefault(package, {}).setdefault(l3, deque()).append(cpu)
+
+    # Each turn takes one CPU from every package; each package rotates
+    # through its own L3 domains. Within a domain first threads come before
+    # SMT siblings because of the sort above.
+    rings = [deque(domains.values()) for domains in packages.values()]
+    order: list[int] = []
+    while rings:
+        for ring in rings:
+            domain = ring.popleft()
+            order.append(domain.popleft())
+            if domain:
+                ring.append(domain)
+        rings = [ring for ring in rings if ring]
+    return order
+
+
+def plan(policy: str, workers: int, cpus: list[int] | None = None) -> list[int | None]:
+    """CPU to pin each of *workers* processes to (None = unpinned)."""
+    if policy not in POLICIES:
+        raise ValueError(f"unknown placement policy: {policy!r} (expected one of {POLICIES})")
+    if policy == "none":
+        return [None] * workers
+
+    if policy == "explicit":
+        if not cpus:
+            raise ValueError("explicit placement needs a non-empty cpu list")
+        available = set(_available_cpus())
+        outside = sorted(set(cpus) - available)
+        if outside:
+            raise ValueError(
+                f"cpus {outside} are not available to this process (allowed: {sorted(available)})"
+            )
+        order = list(cpus)
+    else:
+        infos = discover_topology()
+        if policy == "compact":
+            order = [i[0] for i in sorted(infos, key=lambda i: (i[1], i[3], i[2], i[4]))]
+        elif policy == "scatter":
+            order = _scatter_order(infos)
+        else:  # physical
+            order = [i[0] for i in sorted(infos, key=lambda i: (i[1], i[3], i[2])) if i[4] == 0]
+
+    return [order[i % len(order)] for i in range(workers)]
+
+
+def pin(cpu: int | None) -> None:
+    """Pin the calling process to *cpu*; no-op when unpinned or unsupported."""
+    if cpu is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {cpu})
+
+
+def describe(policy: str, assigned: list[int | None]) -> dict:
+    """What goes into the report: the policy, the per-worker CPUs, the machine."""
+    return {
+        "policy":   policy,
+        "cpus":     assigned,
+        "topology": summarize(discover_topology()),
+    }
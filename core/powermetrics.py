@@ -0,0 +1,164 @@
+"""powermetrics as one long-lived stream instead of a process per sample.
+
+``powermetrics -i <ms> -f plist`` prints one plist document per interval,
+each terminated by a NUL byte. PowermetricsStream starts it once for the
+whole run. A reader thread splits stdout on NUL, parses each document
+with plistlib and keeps the latest reading, so GPU/CPU power and
+temperatures arrive continuously and cost the benchmark nothing between
+intervals. Power times each sample's elapsed time is summed into
+cumulative CPU/GPU joules for energy metering (core.energy).
+
+With *replay* set to a file captured with
+
+    sudo powermetrics -i 1000 -f plist -n 30 > powermetrics.plist
+
+the same reader parses the recording instead, one document per interval,
+looping at the end. That is how the parser gets exercised on Linux.
+"""
+
+import plistlib
+import subprocess
+import threading
+import time
+
+INTERVAL_MS = 1000
+SAMPLERS    = "cpu_power,gpu_power,thermal,smc"
+
+_CHUNK = 64 * 1024
+
+
+def _first(d: dict, *keys: str):
+    for key in keys:
+        if d.get(key) is not None:
+            return d[key]
+    return None
+
+
+def parse_sample(sample: dict) -> dict:
+    """The telemetry fields in one powermetrics plist document.
+
+    Apple silicon reports power in mW under "processor". Intel reports
+    package watts there and die temperatures under "smc".
+    """
+    processor = sample.get("processor") or {}
+    gpu       = sample.get("gpu") or {}
+    smc       = sample.get("smc") or {}
+
+    cpu_mw = _first(processor, "cpu_power", "combined_power")
+    gpu_mw = _first(processor, "gpu_power") or _first(gpu, "gpu_power")
+    cpu_w  = cpu_mw / 1000 if cpu_mw is not None else _first(processor, "package_watts", "cpu_watts")
+    gpu_w  = gpu_mw / 1000 if gpu_mw is not None else _first(smc, "gpu_watts")
+    idle   = gpu.get("idle_ratio")
+    freq   = gpu.get("freq_hz")
+
+    return {
+        "cpu_power_w":      round(cpu_w, 2) if cpu_w is not None else None,
+        "gpu_power_w":      round(gpu_w, 2) if gpu_w is not None else None,
+        "gpu_percent":      round((1 - idle) * 100, 1) if idle is not None else None,
+        "gpu_freq":         round(freq) if freq is not None else None,
+        "cpu_temp":         smc.get("cpu_die"),
+        "gpu_temp":         smc.get("gpu_die"),
+        "thermal_pressure": sample.get("thermal_pressure"),
+    }
+
+
+class PowermetricsStream:
+    def __init__(self, interval_ms: int = INTERVAL_MS, replay: str | None = None, samplers: str = SAMPLERS) -> None:
+        self._interval_ms = interval_ms
+        self._replay = replay
+        self._samplers = samplers
+        self._lock = threading.Lock()
+        self._latest: dict = {}
+        self._samples = 0
+        self._energy: dict[str, float] = {}
+        self._proc: subprocess.Popen | None = None
+        self._thread: threading.Thread | None = None
+        self._halt = threading.Event()
+
+    def start(self) -> bool:
+        """Start streaming; False if powermetrics can't be started (no sudo, not macOS)."""
+        if self._replay is not None:
+            target = self._replay_loop
+        else:
+            try:
+                self._proc = subprocess.Popen(
+                    ["sudo", "-n", "powermetrics", "--samplers", self._samplers, "-i", str(self._interval_ms), "-f", "plist"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    stdin=subprocess.DEVNULL,
+                )
+            except OSError:
+                return False
+            target = self._read_loop
+        self._thread = threading.Thread(target=target, daemon=True)
+        self._thread.start()
+        return True
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _publish(self, document: bytes) -> None:
+        document = document.strip()
+        if not document:
+            return
+        try:
+            sample = plistlib.loads(document)
+            reading = parse_sample(sample)
+        except Exception:
+            return  # truncated or garbled document; the next one will do
+        elapsed = sample.get("elapsed_ns", self._interval_ms * 1_000_000) / 1e9
+        with self._lock:
+            self._latest = reading
+            self._samples += 1
+            for domain in ("cpu", "gpu"):
+                watts = reading[f"{domain}_power_w"]
+                if watts is not None:
+                    self._energy[domain] = self._energy.get(domain, 0.0) + watts * elapsed
+
+    def _read_loop(self) -> None:
+        out = self._proc.stdout
+        pending = b""
+        while not self._halt.is_set():
+            chunk = out.read1(_CHUNK)
+            if not chunk:
+                break  # powermetrics exited (sudo refused, or stopped)
+            *documents, pending = (pending + chunk).split(b"\0")
+            for document in documents:
+                self._publish(document)
+
+    def _replay_loop(self) -> None:
+        with open(self._replay, "rb") as f:
+            documents = [d for d in f.read().split(b"\0") if d.strip()]
+        if not documents:
+            return
+        i = 0
+        while not self._halt.is_set():
+            self._publish(documents[i % len(documents)])
+            i += 1
+            self._halt.wait(self._interval_ms / 1000)
+
+    def latest(self) -> dict:
+        with self._lock:
+            return dict(self._latest)
+
+    def energy_j(self) -> dict[str, float]:
+        """Cumulative joules per domain since the stream started."""
+        with self._lock:
+            return dict(self._energy)
+
+    @property
+    def samples(self) -> int:
+        return self._samples
+
+    def stop(self) -> None:
+        self._halt.set()
+        if self._proc is not None:
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+            self._proc = None
+        if self._thread is not None:
+            self._thread.join(timeout=2)
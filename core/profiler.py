@@ -0,0 +1,108 @@
+"""Sampling profiler: where a phase spent its time, parent and workers alike.
+
+A StackSampler thread wakes every *interval* seconds and reads every
+other thread's Python stack with sys._current_frames(). For each
+function it counts samples where the function was on top of the stack
+("self") and samples where it was anywhere on the stack ("total").
+A wake costs a few µs and nothing runs between wakes, so the sampler
+can stay on for a whole phase. Threads parked in threading, queue or
+an executor's worker loop (idle helpers blocked on an Event, a join or
+an empty work queue) are skipped, because that is not where the time
+goes.
+
+A profile is a plain dict of counters. Pool workers pickle theirs back
+over the pipe with their results; the parent merges them with merge()
+and ranks them with top().
+"""
+
+import os
+import sys
+import threading
+
+INTERVAL_S = 0.005
+TOP_N      = 20
+
+_IDLE_FILES = tuple(os.sep + name for name in ("threading.py", "selectors.py", "connection.py", "thread.py", "queue.py"))
+
+
+def _key(code) -> str:
+    path = code.co_filename
+    short = os.sep.join(path.split(os.sep)[-2:])
+    return f"{code.co_name} ({short}:{code.co_firstlineno})"
+
+
+def empty() -> dict:
+    return {"samples": 0, "self": {}, "total": {}}
+
+
+class StackSampler:
+    """Samples the other threads of this process until stop().
+
+    With *skip_main* the main thread is ignored too. Use it in the
+    parent, where the main thread only drives the UI and sleeps.
+    """
+
+    def __init__(self, interval: float = INTERVAL_S, skip_main: bool = False) -> None:
+        self._interval = interval
+        self._skip = {threading.main_thread().ident} if skip_main else set()
+        self._profile = empty()
+        self._halt = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        me = threading.get_ident()
+        own = self._profile
+        self_counts, total_counts = own["self"], own["total"]
+
+        while not self._halt.wait(self._interval):
+            for tid, frame in sys._current_frames().items():
+                if tid == me or tid in self._skip:
+                    continue
+                if frame.f_code.co_filename.endswith(_IDLE_FILES):
+                    continue
+                leaf = _key(frame.f_code)
+                self_counts[leaf] = self_counts.get(leaf, 0) + 1
+                seen = set()
+                while frame is not None:
+                    key = _key(frame.f_code)
+                    if key not in seen:
+                        seen.add(key)
+                        total_counts[key] = total_counts.get(key, 0) + 1
+                    frame = frame.f_back
+                own["samples"] += 1
+
+    def stop(self) -> dict:
+        self._halt.set()
+        if self._thread:
+            self._thread.join(timeout=1)
+        return self._profile
+
+
+def merge(profiles: list[dict]) -> dict:
+    out = empty()
+    for p in profiles:
+        out["samples"] += p.get("samples", 0)
+        for part in ("self", "total"):
+            into = out[part]
+            for key, n in p.get(part, {}).items():
+                into[key] = into.get(key, 0) + n
+    return out
+
+
+def top(profile: dict, n: int = TOP_N) -> list[dict]:
+    """The *n* functions with the most self samples, with self/total percentages."""
+    samples = max(profile["samples"], 1)
+    ranked = sorted(profile["self"].items(), key=lambda kv: kv[1], reverse=True)[:n]
+    return [
+        {
+            "function":  key,
+            "self":      count,
+            "self_pct":  round(count / samples * 100, 2),
+            "total_pct": round(profile["total"].get(key, count) / samples * 100, 2),
+        }
+        for key, count in ranked
+    ]
@@ -0,0 +1,141 @@
+"""Steady-state detection: decide when a phase's throughput has settled.
+
+A phase's work counter (ops, bytes) is sampled in fixed windows. Over the
+most recent windows the monitor computes the coefficient of variation and
+a 95% confidence interval of the mean windowed rate. Once both are inside
+their targets the phase is steady and can stop early; if it never gets
+there it runs on past its nominal length, up to a cap.
+
+Only the rolling tail is judged, so ramp-up windows (caches filling, turbo
+kicking in) age out on their own instead of needing a fixed warm-up.
+"""
+
+import math
+import threading
+import time
+from typing import Callable
+
+# Two-sided 95% Student-t critical values by degrees of freedom.
+_T95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+    8: 2.306, 9: 2.262, 10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 30: 2.042,
+}
+
+
+def _t95(df: int) -> float:
+    if df <= 0:
+        return math.inf
+    for k in sorted(_T95):
+        if df <= k:
+            return _T95[k]
+    return 1.96
+
+
+def interval(rates: list[float]) -> tuple[float, float, float]:
+    """(mean, 95% CI half-width, coefficient of variation) of *rates*."""
+    n = len(rates)
+    if n == 0:
+        return 0.0, 0.0, 0.0
+    mean = sum(rates) / n
+    if n < 2:
+        return mean, math.inf, math.inf
+    sd = math.sqrt(sum((r - mean) ** 2 for r in rates) / (n - 1))
+    half = _t95(n - 1) * sd / math.sqrt(n)
+    cv = sd / mean if mean > 0 else math.inf
+    return mean, half, cv
+
+
+class SteadyStateMonitor:
+    """Samples *counter* every *window_s* on a background thread.
+
+    finished becomes true once the last *rolling* windows have a CV at or
+    under *cv_target* and a CI half-width at or under *ci_target* of the
+    mean — or, failing that, once *cap_s* has elapsed. *on_finish* is
+    called once, from the sampling thread, when that happens.
+    """
+
+    def __init__(
+        self,
+        counter: Callable[[], float],
+        nominal_s: float,
+        cap_s: float,
+        on_finish: Callable[[], None] | None = None,
+        window_s: float = 1.0,
+        rolling: int = 5,
+        cv_target: float = 0.03,
+        ci_target: float = 0.03,
+    ) -> None:
+        self._counter = counter
+        self._nominal = nominal_s
+        self._cap = max(cap_s, nominal_s)
+        self._on_finish = on_finish
+        self._window = window_s
+        self._rolling = rolling
+        self._cv_target = cv_target
+        self._ci_target = ci_target
+        self._rates: list[float] = []
+        self._converged = False
+        self._finished = threading.Event()
+        self._halt = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started_at = 0.0
+        self._finished_at = 0.0
+
+    def start(self) -> None:
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _steady(self) -> bool:
+        tail = self._rates[-self._rolling:]
+        if len(tail) < self._rolling:
+            return False
+        mean, half, cv = interval(tail)
+        return mean > 0 and cv <= self._cv_target and half <= self._ci_target * mean
+
+    def _run(self) -> None:
+        last_total = self._counter()
+        last_t = time.perf_counter()
+
+        while not self._halt.wait(self._window):
+            total, now = self._counter(), time.perf_counter()
+            if now > last_t:
+                self._rates.append((total - last_total) / (now - last_t))
+            last_total, last_t = total, now
+
+            self._converged = self._steady()
+            if self._converged or now - self._started_at >= self._cap:
+                break
+
+        self._finished_at = time.perf_counter()
+        self._finished.set()
+        if self._on_finish is not None and not self._halt.is_set():
+            self._on_finish()
+
+    def stop(self) -> None:
+        self._halt.set()
+        if self._thread:
+            self._thread.join(timeout=self._window + 1)
+
+    @property
+    def finished(self) -> bool:
+        return self._finished.is_set()
+
+    def summary(self) -> dict:
+        tail = self._rates[-self._rolling:]
+        mean, half, cv = interval(tail)
+        ran = (self._finished_at or time.perf_counter()) - self._started_at
+        finite = math.isfinite(half) and math.isfinite(cv)
+        return {
+            "converged":    self._converged,
+            "windows":      len(self._rates),
+            "window_s":     self._window,
+            "ran_s":        round(ran, 2),
+            "nominal_s":    self._nominal,
+            "stopped_early": self._converged and ran < self._nominal,
+            "extended":     ran > self._nominal + self._window,
+            "mean_rate":    round(mean, 3),
+            "ci95_rate":    round(half, 3) if finite else None,
+            "ci95_pct":     round(half / mean * 100, 2) if finite and mean > 0 else None,
+            "cv":           round(cv, 4) if finite else None,
+        }
@@ -2,7 +2,15 @@
 """
 ChronosBench - Telemetry
 Samples CPU, GPU, memory, and I/O in the background at a fixed interval.
-macOS reads GPU stats via powermetrics (requires sudo) with ioreg fallback.
+macOS streams GPU/CPU power and temperatures from one long-lived
+powermetrics process (core.powermetrics, requires sudo) and falls back
+to ioreg for GPU power when that can't start. A recorded powermetrics
+capture can be replayed in its place on any platform.
+Linux reads temperatures, RAPL power, per-core frequency and utilisation
+from sysfs/procfs (core.linux_sensors) at *sensor_hz*, between the 1 s
+psutil samples for memory and disk I/O.
+Every sample is also appended to a TelemetrySeries (core.timeseries),
+so the whole run's history survives, not just the latest snapshot.
 """
 
 import re
@@ -13,26 +21,94 @@ import time
 
 import psutil
 
+from core.linux_sensors import LinuxSensors
+from core.powermetrics import PowermetricsStream
+from core.timeseries import CAPACITY, TelemetrySeries
+
+SENSOR_HZ = 20
+# ioreg fallback: only the GPU's accelerator entries (AGXAccelerator on
+# Apple silicon, the AMD/Intel drivers elsewhere all subclass it), re-read
+# at most this often.
+_IOREG_CLASS    = "IOAccelerator"
+_IOREG_INTERVAL = 5.0
+
 
 class TelemetryThread(threading.Thread):
-    def __init__(self, interval: float = 1.0) -> None:
+    def __init__(
+        self,
+        interval: float = 1.0,
+        sensor_hz: float = SENSOR_HZ,
+        sensor_root: str = "/",
+        powermetrics_replay: str | None = None,
+        series_capacity: int = CAPACITY,
+    ) -> None:
         super().__init__(daemon=True)
         self.interval = interval
-        self._stop = threading.Event()
+        self._halt = threading.Event()
         self._lock = threading.Lock()
 
         self._snapshot: dict = {}
+        self.series = TelemetrySeries(series_capacity)
+        self._sensors: LinuxSensors | None = None
+        if sys.platform.startswith("linux"):
+            sensors = LinuxSensors(sensor_root)
+            self._sensors = sensors if sensors.available else None
+        self._sensor_interval = 1 / sensor_hz
+        self._stream: PowermetricsStream | None = None
+        if sys.platform == "darwin" or powermetrics_replay is not None:
+            self._stream = PowermetricsStream(round(interval * 1000), replay=powermetrics_replay)
+        self._readings: dict = {}
+        self._ioreg_power: float | None = None
+        self._ioreg_at = float("-inf")
         self._last_io = psutil.disk_io_counters()
         self._last_time = time.perf_counter()
         self._mem_total_gb = psutil.virtual_memory().total / 1024 ** 3
 
+    @property
+    def backend(self) -> str:
+        if self._stream is not None and self._stream.samples:
+            return "powermetrics"
+        return "sysfs" if self._sensors is not None else "psutil"
+
     def run(self) -> None:
-        while not self._stop.is_set():
-            self._sample()
-            self._stop.wait(self.interval)
+        if self._stream is not None and not self._stream.start():
+            self._stream = None
+        try:
+            if self._sensors is None:
+                while not self._halt.is_set():
+                    self._sample()
+                    self.series.append(self.latest_snapshot())
+                    self._halt.wait(self.interval)
+                return
+
+            next_slow = time.perf_counter()
+            while not self._halt.is_set():
+                self._sample_sensors()
+                if time.perf_counter() >= next_slow:
+                    self._sample()
+                    next_slow += self.interval
+                self.series.append(self.latest_snapshot())
+                self._halt.wait(self._sensor_interval)
+        finally:
+            if self._sensors is not None:
+                self._sensors.close()
+            if self._stream is not None:
+                self._stream.stop()
 
     def stop(self) -> None:
-        self._stop.set()
+        self._halt.set()
+        self.series.end()
+
+    @property
+    def powermetrics(self) -> PowermetricsStream | None:
+        return self._stream
+
+    def mark_phase(self, phase: str) -> None:
+        self.series.mark(phase)
+
+    @property
+    def sample_hz(self) -> float:
+        return 1 / self._sensor_interval if self._sensors is not None else 1 / self.interval
 
     def latest_snapshot(self) -> dict:
         with self._lock:
@@ -55,15 +131,23 @@ class TelemetryThread(threading.Thread):
 
         snap["io_read_mb_s"], snap["io_write_mb_s"] = self._io_rates()
 
-        if sys.platform == "darwin":
-            gpu_usage, gpu_temp, gpu_power = self._gpu_mac()
-            snap["gpu_percent"] = gpu_usage
-            snap["gpu_temp"]    = gpu_temp
-            snap["gpu_power_w"] = gpu_power
+        stream = self._stream
+        if stream is not None and (stream.running or stream.samples):
+            snap.update({k: v for k, v in stream.latest().items() if v is not None})
+        elif sys.platform == "darwin":
+            snap["gpu_power_w"] = self._gpu_power_ioreg()
 
         with self._lock:
+            snap.update({k: v for k, v in self._readings.items() if v is not None and v != []})
             self._snapshot = snap
 
+    def _sample_sensors(self) -> None:
+        readings = self._sensors.sample()
+        with self._lock:
+            self._readings = readings
+            if self._snapshot:
+                self._snapshot.update({k: v for k, v in readings.items() if v is not None and v != []})
+
     def _cpu_freq(self) -> int | None:
         try:
             freq = psutil.cpu_freq()
@@ -89,29 +173,22 @@ class TelemetryThread(threading.Thread):
         except Exception:
             return 0.0, 0.0
 
-    def _gpu_mac(self) -> tuple[float | None, float | None, float | None]:
+    def _gpu_power_ioreg(self) -> float | None:
+        # Fallback when powermetrics can't run (no sudo) — power only.
+        # A full `ioreg -l` walks the whole registry, so query the GPU's
+        # class alone and reuse the value between refreshes.
+        now = time.perf_counter()
+        if now - self._ioreg_at < _IOREG_INTERVAL:
+            return self._ioreg_power
+        self._ioreg_at = now
         try:
             out = subprocess.check_output(
-                ["sudo", "powermetrics", "--samplers", "smc", "--show-gpu", "--show-power"],
-                stderr=subprocess.DEVNULL,
-                timeout=3,
+                ["ioreg", "-r", "-c", _IOREG_CLASS], stderr=subprocess.DEVNULL,
             ).decode("utf-8", errors="ignore")
-
-            usage = self._re_float(r"GPU Active residency:\s*([\d\.]+)%", out)
-            temp  = self._re_float(r"GPU die temperature:\s*([\d\.]+)",    out)
-            power = self._re_float(r"GPU Power:\s*([\d\.]+)\s*W",          out)
-            return usage, temp, power
-
-        except Exception:
-            pass
-
-        # ioreg fallback — power only
-        try:
-            out   = subprocess.check_output(["ioreg", "-l"], stderr=subprocess.DEVNULL).decode("utf-8", errors="ignore")
-            power = self._re_float(r"GPU Power.*?([\d\.]+)", out)
-            return None, None, power
+            self._ioreg_power = self._re_float(r"GPU Power.*?([\d\.]+)", out)
         except Exception:
-            return None, None, None
+            self._ioreg_power = None
+        return self._ioreg_power
 
     @staticmethod
     def _re_float(pattern: str, text: str) -> float | None:
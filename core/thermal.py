@@ -0,0 +1,233 @@
+"""Thermal analysis: throttling events, burst vs sustained, and the cutoff.
+
+ThermalGuard enforces the thermal cutoff. The phase runners poll it
+alongside their own finish check. Once the hottest CPU/GPU sensor in
+the latest telemetry snapshot reaches *cutoff_c*, the phase is stopped
+the normal way, and the trip (temperature and seconds into the phase)
+is recorded so the report can flag the result.
+
+analyse() runs after the run, over the telemetry series
+(core.timeseries) and each phase's throughput series. Per phase it
+finds:
+
+  frequency_drop      — cpu_freq below the phase's burst frequency
+                        (p95 of its first BURST_S) by FREQ_DROP or more
+  temperature_plateau — temperature pinned within PLATEAU_BAND_C over
+                        PLATEAU_S while at or above PLATEAU_FLOOR_C: the
+                        governor is holding the chip at its limit
+  power_cap           — package power within POWER_CAP_BAND of its phase
+                        peak while the frequency is dropped: the power
+                        limit, not temperature, is what bites
+
+Runs shorter than MIN_EVENT_S are ignored. The ratio of sustained
+(second half) to burst (first BURST_S) is reported for frequency and for
+every throughput series. The ops/s buckets are also correlated against
+frequency and temperature averaged over the same buckets, so a workload
+that slows in step with the clock shows up as a strong positive
+frequency correlation.
+"""
+
+from collections import deque
+
+import numpy as np
+
+CUTOFF_C        = 95.0
+BURST_S         = 2.0
+FREQ_DROP       = 0.10
+PLATEAU_S       = 2.0
+PLATEAU_BAND_C  = 1.0
+PLATEAU_FLOOR_C = 80.0
+POWER_CAP_BAND  = 0.03
+MIN_EVENT_S     = 0.5
+
+
+class ThermalGuard:
+    def __init__(self, tel, cutoff_c: float = CUTOFF_C) -> None:
+        self._tel = tel
+        self.cutoff_c = cutoff_c
+        self.trips: dict[str, dict] = {}
+
+    def hottest(self) -> float | None:
+        snap = self._tel.latest_snapshot()
+        temps = [t for t in (snap.get("cpu_temp"), snap.get("gpu_temp")) if isinstance(t, (int, float))]
+        return max(temps) if temps else None
+
+    def tripped(self, phase: str, elapsed_s: float) -> bool:
+        """True once *phase* has hit the cutoff; records the first trip."""
+        if phase in self.trips:
+            return True
+        temp = self.hottest()
+        if temp is None or temp < self.cutoff_c:
+            return False
+        self.trips[phase] = {"temp_c": round(temp, 1), "at_s": round(elapsed_s, 2)}
+        return True
+
+
+def _runs(flags: np.ndarray, t: np.ndarray, min_s: float) -> list[tuple[float, float]]:
+    """(start, end) of every run of True in *flags* lasting at least *min_s*."""
+    out = []
+    start = None
+    for i, flag in enumerate(flags):
+        if flag and start is None:
+            start = i
+        if start is not None and (not flag or i == len(flags) - 1):
+            end = i if flag else i - 1
+            if t[end] - t[start] >= min_s:
+                out.append((float(t[start]), float(t[end])))
+            start = None
+    return out
+
+
+def _finite_mean(values: np.ndarray) -> float | None:
+    values = values[np.isfinite(values)]
+    return float(values.mean()) if values.size else None
+
+
+def _ratio(series: np.ndarray, t: np.ndarray, span: float) -> dict | None:
+    """Burst (first BURST_S) vs sustained (second half) means of *series* over *t*."""
+    burst = _finite_mean(series[t < BURST_S])
+    sustained = _finite_mean(series[t >= span / 2])
+    if burst is None or sustained is None or burst <= 0:
+        return None
+    return {"burst": round(burst, 2), "sustained": round(sustained, 2), "sustained_burst": round(sustained / burst, 3)}
+
+
+def _correlate(a: np.ndarray, b: np.ndarray) -> float | None:
+    keep = np.isfinite(a) & np.isfinite(b)
+    if keep.sum() < 3 or np.std(a[keep]) == 0 or np.std(b[keep]) == 0:
+        return None
+    return round(float(np.corrcoef(a[keep], b[keep])[0, 1]), 3)
+
+
+def _bucket_means(values: np.ndarray, t: np.ndarray, interval_s: float, buckets: int) -> np.ndarray:
+    index = (t // interval_s).astype(int)
+    keep = np.isfinite(values) & (index >= 0) & (index < buckets)
+    sums = np.bincount(index[keep], weights=values[keep], minlength=buckets)
+    counts = np.bincount(index[keep], minlength=buckets)
+    out = np.full(buckets, np.nan)
+    np.divide(sums, counts, out=out, where=counts > 0)
+    return out
+
+
+def _plateaus(t: np.ndarray, temp: np.ndarray) -> np.ndarray:
+    """Per sample: is the PLATEAU_S ending there pinned within the band, at or above the floor?
+
+    Window edges come from searchsorted over the finite readings, and both
+    only move forward, so monotonic deques give every window's min and max
+    in one linear pass.
+    """
+    finite = np.isfinite(temp)
+    ft, fv = t[finite], temp[finite]
+    lo = np.searchsorted(ft, t - PLATEAU_S, side="left")
+    hi = np.searchsorted(ft, t, side="right")
+    low = np.full(t.size, np.nan)
+    high = np.full(t.size, np.nan)
+    mins: deque[int] = deque()
+    maxs: deque[int] = deque()
+    j = 0
+    for i in range(t.size):
+        while j < hi[i]:
+            while mins and fv[mins[-1]] >= fv[j]:
+                mins.pop()
+            while maxs and fv[maxs[-1]] <= fv[j]:
+                maxs.pop()
+            mins.append(j)
+            maxs.append(j)
+            j += 1
+        while mins and mins[0] < lo[i]:
+            mins.popleft()
+        while maxs and maxs[0] < lo[i]:
+            maxs.popleft()
+        if mins:
+            low[i], high[i] = fv[mins[0]], fv[maxs[0]]
+    with np.errstate(invalid="ignore"):
+        return (t >= PLATEAU_S) & (hi - lo > 1) & (low >= PLATEAU_FLOOR_C) & (high - low <= PLATEAU_BAND_C)
+
+
+def _events(t: np.ndarray, freq: np.ndarray, temp: np.ndarray, power: np.ndarray) -> tuple[list[dict], float | None]:
+    events: list[dict] = []
+    burst_freq = None
+    early = freq[(t < BURST_S) & np.isfinite(freq)]
+    if early.size:
+        burst_freq = float(np.percentile(early, 95))
+    dropped = freq < burst_freq * (1 - FREQ_DROP) if burst_freq else np.zeros(t.size, dtype=bool)
+
+    for start, end in _runs(dropped, t, MIN_EVENT_S):
+        window = (t >= start) & (t <= end)
+        events.append({
+            "type":     "frequency_drop",
+            "start_s":  round(start, 2),
+            "end_s":    round(end, 2),
+            "min_mhz":  round(float(np.nanmin(freq[window]))),
+            "from_mhz": round(burst_freq),
+        })
+
+    if np.isfinite(temp).any():
+        for start, end in _runs(_plateaus(t, temp), t, MIN_EVENT_S):
+            window = (t >= start) & (t <= end)
+            events.append({
+                "type":    "temperature_plateau",
+                "start_s": round(start - PLATEAU_S, 2),
+                "end_s":   round(end, 2),
+                "temp_c":  round(float(np.nanmean(temp[window])), 1),
+            })
+
+    if np.isfinite(power).any() and burst_freq:
+        peak = float(np.nanmax(power))
+        capped = (power >= peak * (1 - POWER_CAP_BAND)) & dropped
+        for start, end in _runs(capped, t, MIN_EVENT_S):
+            events.append({
+                "type":    "power_cap",
+                "start_s": round(start, 2),
+                "end_s":   round(end, 2),
+                "watts":   round(peak, 1),
+            })
+
+    events.sort(key=lambda e: e["start_s"])
+    return events, burst_freq
+
+
+def analyse(series: dict[str, np.ndarray], throughput: dict[str, dict], trips: dict[str, dict], cutoff_c: float) -> dict:
+    """Thermal report section from telemetry *series* (TelemetrySeries.arrays()).
+
+    *throughput* maps a phase to its {"interval_s", "ops_s": {kind: [...]}}
+    series where it has one; *trips* is ThermalGuard.trips.
+    """
+    phases: dict[str, dict] = {}
+    for name, start, end in zip(series["phase_names"], series["phase_start"], series["phase_end"]):
+        name = str(name)
+        window = (series["t"] >= start) & (series["t"] < end)
+        t = series["t"][window] - start
+        freq, temp, power = (series[c][window].astype(np.float64) for c in ("cpu_freq", "cpu_temp", "cpu_power_w"))
+        span = float(end - start)
+
+        events, burst_freq = _events(t, freq, temp, power)
+        entry: dict = {
+            "cutoff_hit": name in trips,
+            "events":     events,
+        }
+        if name in trips:
+            entry["cutoff"] = trips[name]
+        if burst_freq:
+            entry["frequency"] = _ratio(freq, t, span)
+
+        ts = throughput.get(name)
+        if ts and ts.get("ops_s"):
+            interval = ts["interval_s"]
+            correlations: dict[str, dict] = {}
+            for kind, ops in ts["ops_s"].items():
+                ops = np.asarray(ops, dtype=np.float64)
+                bucket_t = np.arange(ops.size) * interval
+                correlations[kind] = {
+                    **(_ratio(ops, bucket_t, span) or {}),
+                    "corr_freq": _correlate(ops, _bucket_means(freq, t, interval, ops.size)),
+                    "corr_temp": _correlate(ops, _bucket_means(temp, t, interval, ops.size)),
+                }
+            entry["throughput"] = correlations
+        phases[name] = entry
+
+    return {
+        "cutoff_c": cutoff_c,
+        "tripped":  sorted(trips),
+        "phases":   phases,
+    }
@@ -0,0 +1,128 @@
+"""Telemetry time series: every sample of the run in a columnar ring buffer.
+
+TelemetryThread used to keep only its latest snapshot. TelemetrySeries
+appends every sample to preallocated NumPy columns instead: float64
+timestamps (seconds since the series started), one float32 column per
+scalar metric with NaN where a source had nothing, and a 2-D column per
+per-core metric. Once *capacity* rows are filled the oldest are
+overwritten, so memory stays fixed however long the run.
+
+Phase markers record when each phase started and ended. summary() gives
+min / mean / max and percentiles of every metric per phase for the JSON
+report. arrays() gives the full-resolution columns and markers, ready
+for np.savez_compressed beside the report.
+"""
+
+import threading
+import time
+
+import numpy as np
+
+CAPACITY    = 1 << 16
+COLUMNS     = (
+    "cpu_percent", "cpu_freq", "cpu_temp", "cpu_power_w", "dram_power_w",
+    "gpu_percent", "gpu_freq", "gpu_temp", "gpu_power_w",
+    "mem_used_gb", "io_read_mb_s", "io_write_mb_s",
+)
+PER_CORE    = ("core_percent", "core_freq_mhz")
+PERCENTILES = (50, 95, 99)
+
+
+class TelemetrySeries:
+    def __init__(self, capacity: int = CAPACITY) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        self._capacity = capacity
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+        self._t = np.zeros(capacity, dtype=np.float64)
+        self._columns = {name: np.full(capacity, np.nan, dtype=np.float32) for name in COLUMNS}
+        self._cores: dict[str, np.ndarray] = {}
+        self._appended = 0
+        self._phases: list[list] = []  # [name, start_s, end_s | None]
+
+    def now(self) -> float:
+        return time.perf_counter() - self._t0
+
+    def append(self, snap: dict) -> None:
+        with self._lock:
+            i = self._appended % self._capacity
+            self._t[i] = self.now()
+            for name, column in self._columns.items():
+                value = snap.get(name)
+                column[i] = value if isinstance(value, (int, float)) else np.nan
+            for name in PER_CORE:
+                values = snap.get(name) or []
+                block = self._cores.get(name)
+                if block is None:
+                    if not values:
+                        continue
+                    block = self._cores[name] = np.full((self._capacity, len(values)), np.nan, dtype=np.float32)
+                width = min(len(values), block.shape[1])
+                block[i, :width] = values[:width]
+                block[i, width:] = np.nan
+            self._appended += 1
+
+    def mark(self, phase: str) -> None:
+        """Start *phase* here; the previous phase, if still open, ends here."""
+        with self._lock:
+            now = self.now()
+            self._close(now)
+            self._phases.append([phase, now, None])
+
+    def end(self) -> None:
+        with self._lock:
+            self._close(self.now())
+
+    def _close(self, now: float) -> None:
+        if self._phases and self._phases[-1][2] is None:
+            self._phases[-1][2] = now
+
+    @property
+    def samples(self) -> int:
+        return min(self._appended, self._capacity)
+
+    @property
+    def dropped(self) -> int:
+        return max(self._appended - self._capacity, 0)
+
+    def _order(self) -> np.ndarray:
+        n = self.samples
+        if self._appended <= self._capacity:
+            return np.arange(n)
+        return np.roll(np.arange(self._capacity), -(self._appended % self._capacity))
+
+    def arrays(self) -> dict[str, np.ndarray]:
+        with self._lock:
+            order = self._order()
+            out = {"t": self._t[order]}
+            out.update({name: column[order] for name, column in self._columns.items()})
+            out.update({name: block[order] for name, block in self._cores.items()})
+            phases = [(name, start, end if end is not None else self.now()) for name, start, end in self._phases]
+        out["phase_names"] = np.array([p[0] for p in phases], dtype=str)
+        out["phase_start"] = np.array([p[1] for p in phases], dtype=np.float64)
+        out["phase_end"]   = np.array([p[2] for p in phases], dtype=np.float64)
+        return out
+
+    def summary(self) -> dict:
+        """Per phase: sample count, duration and min/mean/max/percentiles of each metric with data."""
+        data = self.arrays()
+        t = data["t"]
+        out: dict[str, dict] = {}
+        for name, start, end in zip(data["phase_names"], data["phase_start"], data["phase_end"]):
+            window = (t >= start) & (t < end)
+            metrics: dict[str, dict] = {}
+            for column in COLUMNS:
+                values = data[column][window]
+                values = values[~np.isnan(values)]
+                if values.size == 0:
+                    continue
+                stats = {"min": float(values.min()), "mean": float(values.mean()), "max": float(values.max())}
+                stats.update({f"p{p}": float(v) for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES))})
+                metrics[column] = {k: round(v, 2) for k, v in stats.items()}
+            out[str(name)] = {
+                "samples":    int(window.sum()),
+                "duration_s": round(float(end - start), 2),
+                "metrics":    metrics,
+            }
+        return out
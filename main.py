@@ -1,29 +1,70 @@
 #!/usr/bin/env python3
-"""ChronosBench — CLI entry point."""
+"""ChronosBench — CLI entry point.
 
+With no arguments the run is interactive: rich prompts, then a Live view.
+``--headless`` (or ``--json``) takes every choice from the command line,
+logs progress to stderr and never imports rich.
+"""
+
+import argparse
+import json
+import os
 import platform
+import sys
 import time
 
-from rich import print
-from rich.layout import Layout
-from rich.live import Live
-from rich.panel import Panel
-from rich.prompt import Prompt
-from rich.table import Table
-from rich.console import Group
-
-from core.telemetry import TelemetryThread
-from core.cpu_stress import CPUStress
-from core.io_stress import IOStress
-from core.mixed_load import MixedLoad
+from core import placement, profiler
+from core.telemetry import SENSOR_HZ, TelemetryThread
+from core.thermal import CUTOFF_C, ThermalGuard, analyse
+from core.energy import FAKE_WATTS, EnergyMeter, FakeEnergy, PowermetricsEnergy, RaplEnergy, efficiency
+from core.cpu_stress import TOPOLOGIES, CPUScalingSweep, CPUStress, WorkerPool
+from core.io_engine import QUEUE_DEPTHS, QueueDepthMatrix
+from core.metadata import ENTRIES, FANOUT, THREADS, MetadataStress
+from core.io_stress import DEVICE_MODES, FLOOD_MODES, MSYNC_EVERY, IOStress, MultiDeviceIO
 from core.metal_compute import gpu_available
+from core.mixed_load import MixedLoad
 from utils.scoring import score_report
 from utils.report import save_report
 
 VERSION = "1.1.1"
 
+PHASES = ("cpu", "io", "mixed", "sweep", "qd", "meta")
+_DEFAULT_PHASES = ("cpu", "io", "mixed")
+
+# Share of the total duration each phase gets unless overridden.
+_PHASE_SHARES = {
+    "cpu":   1 / 2,
+    "io":    1 / 4,
+    "mixed": 1 / 4,
+    "sweep": 1 / 2,
+    "qd":    1 / 4,
+    "meta":  1 / 4,
+}
+
+_PHASE_NAMES = {
+    "cpu":   "CPU Stress",
+    "io":    "I/O Stress",
+    "mixed": "Mixed Thermal Sweep",
+    "sweep": "Core Scaling Sweep",
+    "qd":    "Queue Depth Matrix",
+    "meta":  "Metadata Engine",
+}
+
+_PHASE_KEYS = {name: key for key, name in _PHASE_NAMES.items()}
+
+# Report key for each phase's results, where it differs from the phase name.
+_RESULT_KEYS = {
+    "sweep": "scaling",
+    "qd":    "io_queue_depth",
+    "meta":  "metadata",
+}
+
 
 def choose_platform() -> int:
+    from rich import print
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+
     system = platform.system()
     options = {"1": "macOS (Metal/MPS)", "2": "Windows (CUDA/DirectML)", "3": "Linux (OpenCL/Vulkan)"}
     print(Panel.fit(f"[bold cyan]ChronosBench X v{VERSION}[/bold cyan]\nSelect platform:"))
@@ -34,17 +75,93 @@ def choose_platform() -> int:
 
 
 def choose_telemetry_level() -> int:
+    from rich import print
+    from rich.prompt import Prompt
+
     print("Telemetry detail level:\n1) Full (live temps, usage, power)\n2) Minimal (only scores)")
     return int(Prompt.ask("Telemetry level", choices=["1", "2"], default="1"))
 
 
 def choose_duration() -> int:
+    from rich import print
+    from rich.prompt import Prompt
+
     choices = {"1": 60, "2": 180, "3": 480}
     print("Select test intensity:\n1) Quick (~1 min)\n2) Standard (~3 min)\n3) Extended (~8 min)")
     return choices[Prompt.ask("Choose intensity", choices=list(choices.keys()), default="2")]
 
 
-def _make_layout() -> Layout:
+def choose_placement() -> tuple[str, list[int] | None]:
+    from rich import print
+    from rich.prompt import Prompt
+
+    options = {"1": "none", "2": "compact", "3": "scatter", "4": "physical", "5": "explicit"}
+    print("Worker placement:\n1) OS default\n2) Compact (fill one socket / L3 first)\n3) Scatter across sockets / L3 domains\n4) One per physical core\n5) Explicit core list")
+    policy = options[Prompt.ask("Placement", choices=list(options.keys()), default="1")]
+    cpus = None
+    while policy == "explicit":
+        cpus = [int(c) for c in Prompt.ask("Core ids (comma-separated)").split(",") if c.strip()]
+        try:
+            placement.plan(policy, 0, cpus)
+            break
+        except ValueError as e:
+            print(f"[red]{e}[/red]")
+    return policy, cpus
+
+
+def choose_topology() -> str:
+    from rich import print
+    from rich.prompt import Prompt
+
+    print("Arena topology (how workers share the coherency page):\n1) Shared line\n2) False sharing (own word, shared line)\n3) Padded (own line)\n4) NUMA (own page, node-local first touch)")
+    options = dict(zip(("1", "2", "3", "4"), TOPOLOGIES))
+    return options[Prompt.ask("Topology", choices=list(options.keys()), default="1")]
+
+
+def choose_run_length() -> bool:
+    from rich import print
+    from rich.prompt import Prompt
+
+    print("Run length:\n1) Fixed (each phase runs its full share)\n2) Adaptive (CPU / I/O stop once throughput is steady, extend up to 2x if not)")
+    return Prompt.ask("Run length", choices=["1", "2"], default="1") == "2"
+
+
+def choose_sweep() -> bool:
+    from rich import print
+    from rich.prompt import Prompt
+
+    print("Core-scaling sweep (each workload at 1, 2, 4, ... N processes; adds ~50% run time):\n1) Skip\n2) Run")
+    return Prompt.ask("Scaling sweep", choices=["1", "2"], default="1") == "2"
+
+
+def choose_queue_depth() -> bool:
+    from rich import print
+    from rich.prompt import Prompt
+
+    print("Queue-depth matrix (random/sequential 4 KB reads and writes at QD 1, 4, 32, 128; adds ~25% run time):\n1) Skip\n2) Run")
+    return Prompt.ask("Queue-depth matrix", choices=["1", "2"], default="1") == "2"
+
+
+def choose_metadata() -> bool:
+    from rich import print
+    from rich.prompt import Prompt
+
+    print("Metadata engine (directory trees, 100k-entry directory, stat/rename/readdir storms; adds ~25% run time):\n1) Skip\n2) Run")
+    return Prompt.ask("Metadata engine", choices=["1", "2"], default="1") == "2"
+
+
+def choose_profiling() -> float:
+    """Stack-sampling interval in seconds, or 0 for no profiling."""
+    from rich import print
+    from rich.prompt import Prompt
+
+    print("Stack profiler (where each phase spends its time, parent and workers):\n1) Off\n2) On")
+    return profiler.INTERVAL_S if Prompt.ask("Profiler", choices=["1", "2"], default="1") == "2" else 0.0
+
+
+def _make_layout() -> "Layout":
+    from rich.layout import Layout
+
     layout = Layout()
     layout.split_column(
         Layout(name="header", size=3),
@@ -55,7 +172,11 @@ def _make_layout() -> Layout:
     return layout
 
 
-def _render(snap: dict, phase: str, subtest: str, elapsed: float, total: float, phase_elapsed: int) -> Layout:
+def _render(snap: dict, phase: str, subtest: str, elapsed: float, total: float, phase_elapsed: int, rates: dict | None = None) -> "Layout":
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+
     layout = _make_layout()
 
     header = Panel(
@@ -65,7 +186,7 @@ def _render(snap: dict, phase: str, subtest: str, elapsed: float, total: float,
 
     left = Table.grid()
     left.add_column()
-    left.add_row(f"[bold]CPU:[/bold] {snap.get('cpu_percent', 'N/A')}% | {snap.get('cpu_temp', 'N/A')}°C | {snap.get('cpu_freq', 'N/A')} MHz")
+    left.add_row(f"[bold]CPU:[/bold] {snap.get('cpu_percent', 'N/A')}% | {snap.get('cpu_temp', 'N/A')}°C | {snap.get('cpu_freq', 'N/A')} MHz | {snap.get('cpu_power_w', 'N/A')} W")
     left.add_row(f"[bold]Memory:[/bold] {snap.get('mem_used_gb', 0):.2f} / {snap.get('mem_total_gb', 0):.2f} GB")
     left.add_row(f"[bold]Subtest:[/bold] {subtest}")
 
@@ -74,11 +195,20 @@ def _render(snap: dict, phase: str, subtest: str, elapsed: float, total: float,
     right.add_row(f"[bold]GPU:[/bold] {snap.get('gpu_percent', 'N/A')}% | {snap.get('gpu_temp', 'N/A')}°C | {snap.get('gpu_power_w', 'N/A')} W")
     right.add_row(f"[bold]I/O:[/bold] R: {snap.get('io_read_mb_s', 0):.2f} MB/s | W: {snap.get('io_write_mb_s', 0):.2f} MB/s")
 
-    footer = Panel("[bold]Ctrl+C to abort — thermal cutoff at 95°C[/bold]", style="red")
+    footer = Panel(f"[bold]Ctrl+C to abort — thermal cutoff at {CUTOFF_C:g}°C[/bold]", style="red")
 
     layout["header"].update(header)
     layout["body"]["left"].update(Group(Panel(left, title="System"), Panel(right, title="GPU / I/O")))
-    layout["body"]["right"].update(Panel(f"[bold green]{phase}[/bold green]\n{subtest}\nElapsed: {phase_elapsed}s"))
+    status = Table.grid(padding=(0, 2))
+    status.add_column()
+    status.add_column(justify="right")
+    status.add_row(f"[bold green]{phase}[/bold green]", "")
+    status.add_row(subtest, "")
+    status.add_row(f"Elapsed: {phase_elapsed}s", "")
+    for kind, rate in sorted((rates or {}).items()):
+        status.add_row(kind, f"{rate:,.1f} ops/s")
+
+    layout["body"]["right"].update(Panel(status, title="Throughput"))
     layout["footer"].update(footer)
     return layout
 
@@ -88,64 +218,509 @@ def _current_subtest(module, fallback: str) -> str:
     return sub() if callable(sub) else (sub or fallback)
 
 
-def run_phase(live: Live, tel: TelemetryThread, phase_name: str, module, phase_duration: int, total_duration: int, start_time: float) -> None:
+def _phase_finished(module, phase_start: float, phase_duration: int) -> bool:
+    # Adaptive modules decide for themselves (early stop / extension).
+    finished = getattr(module, "finished", None)
+    if finished is not None:
+        return finished
+    return time.perf_counter() - phase_start >= phase_duration
+
+
+def _live_rates(module) -> dict:
+    rates = getattr(module, "live_rates", None)
+    return rates() if callable(rates) else {}
+
+
+def _too_hot(guard: ThermalGuard | None, phase_name: str, phase_start: float) -> bool:
+    if guard is None:
+        return False
+    return guard.tripped(_PHASE_KEYS.get(phase_name, phase_name), time.perf_counter() - phase_start)
+
+
+def run_phase(
+    live: "Live",
+    tel: TelemetryThread,
+    phase_name: str,
+    module,
+    phase_duration: int,
+    total_duration: int,
+    start_time: float,
+    profile_interval: float = 0.0,
+    guard: ThermalGuard | None = None,
+    meter: EnergyMeter | None = None,
+) -> dict | None:
+    """Run one phase under the live display; see run_phase_headless for the rest."""
+    _prepare(module)
     phase_start = time.perf_counter()
+    tel.mark_phase(_PHASE_KEYS.get(phase_name, phase_name))
+    sampler = _start_sampler(profile_interval)
+    if meter is not None:
+        meter.begin(_PHASE_KEYS.get(phase_name, phase_name))
     module.start(duration=phase_duration)
 
-    while time.perf_counter() - phase_start < phase_duration:
+    while not _phase_finished(module, phase_start, phase_duration) and not _too_hot(guard, phase_name, phase_start):
         elapsed      = time.perf_counter() - start_time
         phase_elapsed = int(time.perf_counter() - phase_start)
         subtest      = _current_subtest(module, phase_name)
         snap         = tel.latest_snapshot()
-        live.update(_render(snap, phase_name, subtest, elapsed, total_duration, phase_elapsed))
+        live.update(_render(snap, phase_name, subtest, elapsed, total_duration, phase_elapsed, _live_rates(module)))
+        time.sleep(0.25)
+
+    module.stop()
+    if meter is not None:
+        meter.end()
+    return _phase_profile(sampler, module)
+
+
+def _prepare(module) -> None:
+    """Do the module's file setup now, so neither the phase clock nor the meter sees it."""
+    if hasattr(module, "prepare"):
+        module.prepare()
+
+
+def _start_sampler(interval: float) -> profiler.StackSampler | None:
+    if interval <= 0:
+        return None
+    sampler = profiler.StackSampler(interval, skip_main=True)
+    sampler.start()
+    return sampler
+
+
+def _phase_profile(sampler: profiler.StackSampler | None, module) -> dict | None:
+    """The parent's samples merged with the module's pool workers' profiles."""
+    if sampler is None:
+        return None
+    workers = module.worker_profiles() if hasattr(module, "worker_profiles") else []
+    return profiler.merge([sampler.stop(), *workers])
+
+
+def run_phase_headless(
+    phase_name: str,
+    module,
+    phase_duration: int,
+    profile_interval: float = 0.0,
+    guard: ThermalGuard | None = None,
+    meter: EnergyMeter | None = None,
+) -> dict | None:
+    """Run one phase; with a *profile_interval* (s), return its merged stack profile.
+
+    A *guard* whose cutoff is reached ends the phase early; a *meter*
+    records the phase's energy.
+    """
+    _log(f"{phase_name}: {phase_duration}s")
+    _prepare(module)
+    phase_start = time.perf_counter()
+    sampler = _start_sampler(profile_interval)
+    if meter is not None:
+        meter.begin(_PHASE_KEYS.get(phase_name, phase_name))
+    module.start(duration=phase_duration)
+
+    while not _phase_finished(module, phase_start, phase_duration):
+        if _too_hot(guard, phase_name, phase_start):
+            _log(f"{phase_name}: thermal cutoff ({guard.cutoff_c:g}°C) reached, stopping")
+            break
         time.sleep(0.25)
 
     module.stop()
+    if meter is not None:
+        meter.end()
+    _log(f"{phase_name}: done in {time.perf_counter() - phase_start:.1f}s")
+    return _phase_profile(sampler, module)
+
+
+def _profile_report(profiles: dict[str, dict], interval: float, top_n: int) -> dict:
+    return {
+        _RESULT_KEYS.get(key, key): {
+            "samples":     profile["samples"],
+            "interval_ms": round(interval * 1000, 3),
+            "top":         profiler.top(profile, top_n),
+        }
+        for key, profile in profiles.items()
+    }
+
+
+def _log(message: str) -> None:
+    print(message, file=sys.stderr, flush=True)
+
+
+def _throughput_series(result: dict) -> dict | None:
+    # CPU phases carry their ops/s series at the top, mixed under "cpu".
+    if "timeseries" in result:
+        return result["timeseries"]
+    cpu = result.get("cpu")
+    return cpu.get("timeseries") if isinstance(cpu, dict) else None
+
+
+def _energy_meter(kind: str, tel: TelemetryThread | None, fake_watts: float = FAKE_WATTS) -> EnergyMeter | None:
+    """Meter on the requested energy source; None when it isn't available here."""
+    if kind == "none":
+        return None
+    if kind == "fake":
+        return EnergyMeter(FakeEnergy(fake_watts))
+    candidates = []
+    if kind in ("auto", "rapl"):
+        candidates.append(RaplEnergy())
+    if kind in ("auto", "powermetrics") and tel is not None and tel.powermetrics is not None:
+        candidates.append(PowermetricsEnergy(tel.powermetrics))
+    source = next((c for c in candidates if c.available), None)
+    return EnergyMeter(source) if source is not None else None
+
+
+def _build_report(
+    modules: dict,
+    tel: TelemetryThread | None,
+    guard: ThermalGuard | None = None,
+    meter: EnergyMeter | None = None,
+) -> dict:
+    raw = {key: module.result() for key, module in modules.items()}
+    if guard is not None:
+        for key, trip in guard.trips.items():
+            if key in raw:
+                raw[key]["thermal_cutoff"] = trip
+    results = {_RESULT_KEYS.get(key, key): result for key, result in raw.items()}
+    if tel is not None:
+        results["telemetry"] = {**tel.latest_snapshot(), "backend": tel.backend}
+    report = {
+        "meta": {
+            "platform":  platform.system(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "version":   VERSION,
+        },
+        "results": results,
+    }
+    if tel is not None:
+        report["telemetry_series"] = {
+            "samples": tel.series.samples,
+            "dropped": tel.series.dropped,
+            "rate_hz": round(tel.sample_hz, 2),
+            "phases":  {_RESULT_KEYS.get(key, key): summary for key, summary in tel.series.summary().items()},
+        }
+        throughput = {key: _throughput_series(result) for key, result in raw.items()}
+        thermal = analyse(
+            tel.series.arrays(),
+            {key: ts for key, ts in throughput.items() if ts},
+            guard.trips if guard is not None else {},
+            guard.cutoff_c if guard is not None else CUTOFF_C,
+        )
+        thermal["tripped"] = [_RESULT_KEYS.get(key, key) for key in thermal["tripped"]]
+        thermal["phases"] = {_RESULT_KEYS.get(key, key): entry for key, entry in thermal["phases"].items()}
+        report["thermal"] = thermal
+    if meter is not None:
+        report["energy"] = {
+            "source":     meter.source.name,
+            "phases":     {_RESULT_KEYS.get(key, key): phase for key, phase in meter.phases.items()},
+            "efficiency": efficiency(raw, meter.phases),
+        }
+    return report
+
+
+def _series_capacity(seconds: float, hz: float) -> int:
+    # Room for adaptive phases running to 2x, plus the probes between phases.
+    return int((seconds * 2 + 120) * hz)
+
 
+def _csv(cast):
+    def parse(value: str) -> list:
+        try:
+            return [cast(v.strip()) for v in value.split(",") if v.strip()]
+        except ValueError as exc:
+            raise argparse.ArgumentTypeError(str(exc)) from exc
+    return parse
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="chronosbench",
+        description="CPU / I/O / GPU stress benchmark. Interactive unless --headless or --json is given.",
+    )
+    parser.add_argument("--headless", action="store_true", help="no prompts, no Live view; progress goes to stderr")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON on stdout (implies --headless)")
+    parser.add_argument("--phases", type=_csv(str), default=list(_DEFAULT_PHASES),
+                        help=f"comma-separated phases to run, from {','.join(PHASES)} (default: {','.join(_DEFAULT_PHASES)})")
+    parser.add_argument("--duration", type=int, default=180,
+                        help="total seconds, split cpu 1/2, io 1/4, mixed 1/4, sweep +1/2, qd +1/4, meta +1/4 (default: 180)")
+    for phase in PHASES:
+        parser.add_argument(f"--{phase}-duration", type=int, metavar="S", help=f"seconds for the {phase} phase")
+    parser.add_argument("--queue-depths", type=_csv(int), default=list(QUEUE_DEPTHS),
+                        help=f"queue depths for the qd phase (default: {','.join(map(str, QUEUE_DEPTHS))})")
+    parser.add_argument("--meta-threads", type=int, default=THREADS, metavar="N",
+                        help=f"parallel churner threads per process in the meta phase (default: {THREADS})")
+    parser.add_argument("--meta-processes", type=int, default=1, metavar="N", help="processes in the meta phase (default: 1)")
+    parser.add_argument("--meta-entries", type=int, default=ENTRIES, metavar="N",
+                        help=f"files in the large directory of the meta phase (default: {ENTRIES})")
+    parser.add_argument("--meta-fanout", type=_csv(int), default=list(FANOUT), metavar="WIDTH,DEPTH",
+                        help=f"directory tree shape for the meta phase (default: {FANOUT[0]},{FANOUT[1]})")
+    parser.add_argument("--workers", type=int, help="worker processes in the pool (default: one per logical CPU)")
+    parser.add_argument("--placement", choices=placement.POLICIES, default="none", help="worker placement policy")
+    parser.add_argument("--cpus", type=_csv(int), help="core ids for --placement explicit")
+    parser.add_argument("--topology", choices=TOPOLOGIES, default="shared",
+                        help="shared-arena layout for the CPU phases; the coherency probe prices it against padded")
+    parser.add_argument("--adaptive", action="store_true", help="stop CPU / I/O once throughput is steady, extend up to 2x if not")
+    parser.add_argument("--flood-mode", choices=FLOOD_MODES, default="buffered",
+                        help="sequential flood through the page cache or bypassing it (O_DIRECT where possible)")
+    parser.add_argument("--io-dir", action="append", metavar="DIR",
+                        help="run the I/O phases in DIR instead of the system temp dir; repeat for several volumes")
+    parser.add_argument("--io-dir-mode", choices=DEVICE_MODES, default="concurrent",
+                        help="with several --io-dir: run them at once or one after another (default: concurrent)")
+    parser.add_argument("--io-processes", type=int, default=1, metavar="N",
+                        help="run the I/O suite in N processes, each on its own files (default: 1)")
+    parser.add_argument("--msync-every", type=int, default=MSYNC_EVERY, metavar="PAGES",
+                        help=f"dirtied pages between msyncs in the mmap worker (default: {MSYNC_EVERY})")
+    parser.add_argument("--thermal-cutoff", type=float, default=CUTOFF_C, metavar="C",
+                        help=f"stop a phase once the hottest CPU/GPU sensor reaches C °C; needs telemetry (default: {CUTOFF_C:g})")
+    parser.add_argument("--energy-source", choices=("auto", "rapl", "powermetrics", "fake", "none"), default="auto",
+                        help="energy counters for per-phase joules and work per joule (default: auto)")
+    parser.add_argument("--fake-watts", type=float, default=FAKE_WATTS, metavar="W",
+                        help=f"constant draw of --energy-source fake (default: {FAKE_WATTS:g})")
+    parser.add_argument("--profile", action="store_true",
+                        help="stack-sample every phase (parent and pool workers) and add a hot-function table to the report")
+    parser.add_argument("--profile-interval", type=float, default=profiler.INTERVAL_S * 1000, metavar="MS",
+                        help=f"sampling interval for --profile (default: {profiler.INTERVAL_S * 1000:g})")
+    parser.add_argument("--profile-top", type=int, default=profiler.TOP_N, metavar="N",
+                        help=f"functions kept per phase for --profile (default: {profiler.TOP_N})")
+    parser.add_argument("--no-coherency", action="store_true", help="skip the cache-coherency probe")
+    parser.add_argument("--no-telemetry", action="store_true", help="skip background telemetry sampling")
+    parser.add_argument("--telemetry-hz", type=float, default=SENSOR_HZ, metavar="HZ",
+                        help=f"Linux sysfs/procfs sensor sampling rate, 1-100 (default: {SENSOR_HZ})")
+    parser.add_argument("--powermetrics-replay", metavar="FILE",
+                        help="replay a recorded `powermetrics -f plist` capture instead of running powermetrics")
+    parser.add_argument("--output", metavar="PATH", help="report JSON path; the .txt summary goes next to it (default: reports/)")
+    parser.add_argument("--no-save", action="store_true", help="don't write report files")
+
+    args = parser.parse_args(argv)
+    unknown = [p for p in args.phases if p not in PHASES]
+    if unknown or not args.phases:
+        parser.error(f"--phases: expected a subset of {','.join(PHASES)}, got {','.join(unknown) or 'nothing'}")
+    if args.placement == "explicit" and not args.cpus:
+        parser.error("--placement explicit needs --cpus")
+    try:
+        placement.plan(args.placement, 0, args.cpus)
+    except ValueError as e:
+        parser.error(f"--cpus: {e}")
+    if not args.queue_depths or min(args.queue_depths) < 1:
+        parser.error("--queue-depths must be positive integers")
+    missing = [d for d in args.io_dir or [] if not os.path.isdir(d)]
+    if missing:
+        parser.error(f"--io-dir: not a directory: {', '.join(missing)}")
+    if args.io_processes < 1:
+        parser.error("--io-processes must be at least 1")
+    if args.msync_every < 1:
+        parser.error("--msync-every must be at least 1")
+    if args.meta_threads < 1 or args.meta_processes < 1 or args.meta_entries < 1:
+        parser.error("--meta-threads, --meta-processes and --meta-entries must be at least 1")
+    if len(args.meta_fanout) != 2 or min(args.meta_fanout) < 1:
+        parser.error("--meta-fanout expects WIDTH,DEPTH, both at least 1")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.powermetrics_replay and not os.path.isfile(args.powermetrics_replay):
+        parser.error(f"--powermetrics-replay: no such file: {args.powermetrics_replay}")
+    if args.fake_watts <= 0:
+        parser.error("--fake-watts must be positive")
+    if args.thermal_cutoff <= 0:
+        parser.error("--thermal-cutoff must be positive")
+    if not 1 <= args.telemetry_hz <= 100:
+        parser.error("--telemetry-hz must be between 1 and 100")
+    if args.profile_interval <= 0 or args.profile_top < 1:
+        parser.error("--profile-interval must be positive and --profile-top at least 1")
+    args.headless = args.headless or args.json
+    return args
+
+
+def _phase_durations(args: argparse.Namespace) -> dict[str, int]:
+    durations = {}
+    for phase in PHASES:
+        if phase in args.phases:
+            override = getattr(args, f"{phase}_duration")
+            durations[phase] = override if override is not None else int(args.duration * _PHASE_SHARES[phase])
+    return durations
+
+
+def _io_module(args: argparse.Namespace, adaptive: bool | None = None):
+    options = {
+        "adaptive":    args.adaptive if adaptive is None else adaptive,
+        "flood_mode":  args.flood_mode,
+        "msync_every": args.msync_every,
+        "processes":   args.io_processes,
+    }
+    dirs = args.io_dir or []
+    if len(dirs) > 1:
+        return MultiDeviceIO(dirs, mode=args.io_dir_mode, **options)
+    return IOStress(directory=dirs[0] if dirs else None, **options)
+
+
+def run_headless(args: argparse.Namespace) -> int:
+    durations = _phase_durations(args)
+    profile_s = args.profile_interval / 1000 if args.profile else 0.0
+    pool = None
+    if {"cpu", "mixed", "sweep"} & durations.keys():
+        _log("Warming up worker pool...")
+        pool = WorkerPool(args.workers, policy=args.placement, cpus=args.cpus, profile_interval=profile_s)
+        pool.start()
+
+    modules: dict = {}
+    for phase in durations:
+        if phase == "cpu":
+            modules[phase] = CPUStress(args.topology, pool=pool, adaptive=args.adaptive)
+        elif phase == "io":
+            modules[phase] = _io_module(args)
+        elif phase == "mixed":
+            # Same volumes and I/O options as the io phase, but always the full share.
+            modules[phase] = MixedLoad(pool=pool, topology=args.topology, io=_io_module(args, adaptive=False))
+        elif phase == "sweep":
+            modules[phase] = CPUScalingSweep(args.topology, pool=pool)
+        elif phase == "qd":
+            modules[phase] = QueueDepthMatrix(depths=tuple(args.queue_depths), directory=(args.io_dir or [None])[0])
+        else:
+            modules[phase] = MetadataStress(
+                threads=args.meta_threads,
+                processes=args.meta_processes,
+                entries=args.meta_entries,
+                fanout=tuple(args.meta_fanout),
+                directory=(args.io_dir or [None])[0],
+            )
+
+    if "cpu" in modules and not args.no_coherency:
+        coherency = modules["cpu"].measure_coherency()
+        if coherency["coherency_cost_pct"] is None:
+            _log(f"Coherency cost: not measured ({coherency['note']})")
+        else:
+            _log(f"Coherency cost ({coherency['contended']}): {coherency['coherency_cost_pct']}% of padded throughput")
+
+    tel = None if args.no_telemetry else TelemetryThread(
+        sensor_hz=args.telemetry_hz,
+        powermetrics_replay=args.powermetrics_replay,
+        series_capacity=_series_capacity(sum(durations.values()), args.telemetry_hz),
+    )
+    guard = None
+    if tel is not None:
+        tel.start()
+        guard = ThermalGuard(tel, args.thermal_cutoff)
+    meter = _energy_meter(args.energy_source, tel, args.fake_watts)
+    if meter is None and args.energy_source not in ("auto", "none"):
+        _log(f"Energy source '{args.energy_source}' is not available; skipping energy metering")
+
+    status = 0
+    profiles: dict[str, dict] = {}
+    try:
+        for phase, module in modules.items():
+            if tel is not None:
+                tel.mark_phase(phase)
+            profile = run_phase_headless(_PHASE_NAMES[phase], module, durations[phase], profile_s, guard, meter)
+            if profile is not None:
+                profiles[phase] = profile
+    except KeyboardInterrupt:
+        _log("Aborted.")
+        status = 130
+    finally:
+        if tel is not None:
+            tel.stop()
+        report = _build_report(modules, tel, guard, meter)
+        if profiles:
+            report["profile"] = _profile_report(profiles, profile_s, args.profile_top)
+        if pool is not None:
+            pool.close()
+        report["scores"] = score_report(report)
+        if not args.no_save:
+            series = tel.series.arrays() if tel is not None else None
+            _log(f"Report saved → {save_report(report, args.output, series)}")
+        if args.json:
+            json.dump(report, sys.stdout, indent=2)
+            sys.stdout.write("\n")
+        _log(f"Composite score: {report['scores']['composite']} / 2000")
+    return status
+
+
+def run_interactive() -> None:
+    from rich import print
+    from rich.live import Live
+    from rich.panel import Panel
 
-def main() -> None:
     plat            = choose_platform()
     telemetry_level = choose_telemetry_level()
     duration        = choose_duration()
-
-    print(f"\nGPU available: [bold]{'yes' if gpu_available else 'no'}[/bold]  |  platform choice: {plat}\n")
-
-    tel   = TelemetryThread()
-    cpu   = CPUStress()
-    io    = IOStress()
-    mixed = MixedLoad()
+    policy, cpus    = choose_placement()
+    topology        = choose_topology()
+    adaptive        = choose_run_length()
+    sweep_enabled   = choose_sweep()
+    qd_enabled      = choose_queue_depth()
+    meta_enabled    = choose_metadata()
+    profile_s       = choose_profiling()
+
+    print(f"\nGPU available: [bold]{'yes' if gpu_available() else 'no'}[/bold]  |  platform choice: {plat}\n")
+
+    # One pool for every phase: workers spawn, import NumPy and allocate once.
+    print("Warming up worker pool...")
+    pool = WorkerPool(policy=policy, cpus=cpus, profile_interval=profile_s)
+    pool.start()
+
+    cpu   = CPUStress(topology, pool=pool, adaptive=adaptive)
+    io    = IOStress(adaptive=adaptive)
+    mixed = MixedLoad(pool=pool, topology=topology)
+    sweep = CPUScalingSweep(topology, pool=pool) if sweep_enabled else None
+    qd    = QueueDepthMatrix() if qd_enabled else None
+    meta  = MetadataStress() if meta_enabled else None
+    total = duration + (duration // 2 if sweep else 0) + (duration // 4 if qd else 0) + (duration // 4 if meta else 0)
+    tel   = TelemetryThread(series_capacity=_series_capacity(total, SENSOR_HZ))
+    guard = ThermalGuard(tel)
+
+    print("Pricing cache coherency (contended vs padded arena)...")
+    coherency = cpu.measure_coherency()
+    if coherency["coherency_cost_pct"] is None:
+        print(f"Coherency cost: not measured ({coherency['note']})\n")
+    else:
+        print(f"Coherency cost ({coherency['contended']}): [bold]{coherency['coherency_cost_pct']}%[/bold] of padded throughput\n")
 
     tel.start()
+    meter = _energy_meter("auto", tel)
     start = time.perf_counter()
+    phases = [
+        ("CPU Stress",          cpu,   duration // 2),
+        ("I/O Stress",          io,    duration // 4),
+        ("Mixed Thermal Sweep", mixed, duration // 4),
+    ]
+    if sweep:
+        phases.append(("Core Scaling Sweep", sweep, duration // 2))
+    if qd:
+        phases.append(("Queue Depth Matrix", qd, duration // 4))
+    if meta:
+        phases.append(("Metadata Engine", meta, duration // 4))
+    profiles: dict[str, dict] = {}
 
     try:
         with Live(refresh_per_second=4) as live:
-            run_phase(live, tel, "CPU Stress",          cpu,   duration // 2, duration, start)
-            run_phase(live, tel, "I/O Stress",          io,    duration // 4, duration, start)
-            run_phase(live, tel, "Mixed Thermal Sweep", mixed, duration // 4, duration, start)
+            for name, module, seconds in phases:
+                profile = run_phase(live, tel, name, module, seconds, total, start, profile_s, guard, meter)
+                if profile is not None:
+                    profiles[_PHASE_KEYS[name]] = profile
 
     except KeyboardInterrupt:
         print("\n[bold red]Aborted.[/bold red]")
 
     finally:
         tel.stop()
-        report = {
-            "meta": {
-                "platform":  platform.system(),
-                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                "version":   VERSION,
-            },
-            "results": {
-                "cpu":       cpu.result(),
-                "io":        io.result(),
-                "mixed":     mixed.result(),
-                "telemetry": tel.latest_snapshot(),
-            },
-        }
+        modules = {"cpu": cpu, "io": io, "mixed": mixed}
+        if sweep:
+            modules["sweep"] = sweep
+        if qd:
+            modules["qd"] = qd
+        if meta:
+            modules["meta"] = meta
+        report = _build_report(modules, tel, guard, meter)
+        if profiles:
+            report["profile"] = _profile_report(profiles, profile_s, profiler.TOP_N)
+        pool.close()
         report["scores"] = score_report(report)
-        save_report(report)
+        print(f"Report saved → {save_report(report, series=tel.series.arrays())}")
         print(Panel(f"Composite score: [bold]{report['scores']['composite']}[/bold] / 2000", title="Result", style="bold green"))
 
 
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    if args.headless:
+        return run_headless(args)
+    run_interactive()
+    return 0
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
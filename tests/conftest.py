@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The benchmark runs from the repository root (python main.py), so make its
+# packages importable however pytest was invoked.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
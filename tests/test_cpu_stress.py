@@ -0,0 +1,63 @@
+import random
+
+import numpy as np
+import pytest
+
+from core.cpu_stress import MANDEL_TILE, _Sieve, _SieveEngine, _Workload, _mandelbrot_frame, _segmented_sieve
+
+
+def test_workload_bases_are_abstract():
+    with pytest.raises(TypeError):
+        _Workload()
+    with pytest.raises(TypeError):
+        _Sieve()
+
+
+@pytest.mark.parametrize("low, high", [
+    (0, 1), (0, 2), (1, 1), (2, 2), (2, 3), (3, 3), (4, 4),
+    (0, 100), (1, 100), (2, 100), (9, 9), (25, 49), (97, 97), (100, 102),
+    (10 ** 7, 10 ** 7 + 2 * 1000 - 1),
+])
+def test_sieve_engine_edge_windows(low, high):
+    assert _SieveEngine(segment=1024).count(low, high) == _segmented_sieve(low, high)
+
+
+def test_sieve_engine_matches_interpreter_on_random_windows():
+    rng = random.Random(1234)
+    engine = _SieveEngine(segment=4096)  # one engine throughout, so the cached base primes grow
+    for _ in range(200):
+        low = rng.randrange(0, 2 * 10 ** 6)
+        high = low + rng.randrange(0, 2 * 4096)
+        assert engine.count(low, high) == _segmented_sieve(low, high), (low, high)
+
+
+def test_sieve_engine_rejects_oversized_window():
+    with pytest.raises(ValueError):
+        _SieveEngine(segment=16).count(0, 100)
+
+
+def _escape_counts(cx, cy, scale, width, height, max_iter):
+    """Reference: iterations each point survives with |z|² <= 4, one complex at a time."""
+    total = 0
+    for ci in np.linspace(cy, cy + scale, height).tolist():
+        for cr in np.linspace(cx, cx + scale, width).tolist():
+            zr = zi = 0.0
+            for _ in range(max_iter):
+                if zr * zr + zi * zi > 4.0:
+                    break
+                total += 1
+                zr, zi = zr * zr - zi * zi + cr, 2.0 * zr * zi + ci
+    return total
+
+
+@pytest.mark.parametrize("cx, cy, scale, width, height, max_iter", [
+    (-2.5, -1.25, 3.5, 150, 140, 40),     # whole set, partial edge tiles
+    (-0.75, 0.05, 0.05, 64, 48, 200),     # boundary zoom, most points slow to escape
+    (0.5, 0.5, 0.25, 20, 20, 30),         # everything escapes early
+    (-0.2, -0.1, 0.1, 16, 16, 25),        # everything inside: every point runs max_iter
+])
+def test_mandelbrot_frame_matches_reference_escape_counts(cx, cy, scale, width, height, max_iter):
+    points = MANDEL_TILE * MANDEL_TILE
+    scratch = (np.empty(points), np.empty(points), np.empty(points), np.empty(points, dtype=np.bool_))
+    got = _mandelbrot_frame(cx, cy, scale, width, height, max_iter, scratch)
+    assert got == _escape_counts(cx, cy, scale, width, height, max_iter)
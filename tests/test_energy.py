@@ -0,0 +1,77 @@
+import time
+
+import pytest
+
+from core.energy import EnergyMeter, FakeEnergy, RaplEnergy, efficiency
+from utils.scoring import score_report
+
+
+class _Scripted:
+    """An energy source that returns the given cumulative readings in turn."""
+
+    name = "scripted"
+    available = True
+
+    def __init__(self, *readings: dict) -> None:
+        self._readings = list(readings)
+
+    def read(self) -> dict:
+        return self._readings.pop(0)
+
+
+def test_meter_records_counter_deltas():
+    meter = EnergyMeter(_Scripted({"cpu": 100.0, "dram": 10.0}, {"cpu": 160.0, "dram": 12.5}))
+    meter.begin("cpu")
+    time.sleep(0.05)
+    meter.end()
+    phase = meter.phases["cpu"]
+    assert phase["joules"] == {"cpu": 60.0, "dram": 2.5}
+    assert phase["avg_w"]["cpu"] == pytest.approx(60.0 / phase["seconds"], rel=0.01)
+
+
+def test_meter_end_without_begin_is_a_no_op():
+    meter = EnergyMeter(FakeEnergy())
+    meter.end()
+    assert meter.phases == {}
+
+
+def test_fake_energy_is_constant_watts():
+    meter = EnergyMeter(FakeEnergy(watts=40.0, gpu_watts=10.0))
+    meter.begin("mixed")
+    time.sleep(0.1)
+    meter.end()
+    avg = meter.phases["mixed"]["avg_w"]
+    assert avg["cpu"] == pytest.approx(40.0, rel=0.05)
+    assert avg["gpu"] == pytest.approx(10.0, rel=0.05)
+
+
+def test_rapl_folds_wraparound(tmp_path):
+    zone = tmp_path / "sys/class/powercap/intel-rapl:0"
+    zone.mkdir(parents=True)
+    (zone / "name").write_text("package-0\n")
+    (zone / "max_energy_range_uj").write_text("1000000\n")
+    (zone / "energy_uj").write_text("900000\n")
+    source = RaplEnergy(root=str(tmp_path))
+    assert source.available
+    assert source.read() == {"cpu": 0.0}
+    (zone / "energy_uj").write_text("200000\n")   # wrapped past 1 J
+    assert source.read()["cpu"] == pytest.approx(0.3)
+
+
+def test_efficiency_charges_cpu_workloads_by_process_share():
+    results = {"cpu": {"total_ops": 1000, "breakdown": {"fft": 600, "sieve": 400}, "processes_per_type": {"fft": 3, "sieve": 1}}}
+    phases = {"cpu": {"joules": {"cpu": 100.0}}}
+    eff = efficiency(results, phases)["cpu"]
+    assert eff["ops_per_j"] == 10.0
+    assert eff["workloads"] == {"fft": 8.0, "sieve": 16.0}
+
+
+def test_fake_source_efficiency_stays_out_of_the_composite():
+    report = {
+        "results": {"cpu": {"total_ops": 5000}},
+        "energy":  {"source": "fake", "efficiency": {"cpu": {"ops_per_j": 1.0}}},
+    }
+    scores = score_report(report)
+    assert "efficiency" not in scores["scores"]
+    assert scores["synthetic"] == {"efficiency": 1000}
+    assert scores["composite"] == scores["scores"]["cpu"]
@@ -0,0 +1,66 @@
+import pickle
+import random
+
+import pytest
+
+from core.histogram import SUB_BUCKETS, LatencyHistogram
+
+
+def _exact(values: list[int], pct: float) -> int:
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def test_empty():
+    hist = LatencyHistogram()
+    assert hist.percentile(99) == 0.0
+    assert hist.summary() == {"count": 0}
+
+
+def test_small_values_are_exact():
+    hist = LatencyHistogram()
+    for ns in range(SUB_BUCKETS):
+        hist.record(ns)
+    assert hist.percentile(50) == 15
+    assert hist.percentile(100) == SUB_BUCKETS - 1
+
+
+@pytest.mark.parametrize("pct", [50.0, 90.0, 99.0, 99.9])
+def test_percentiles_within_bucket_error(pct):
+    rng = random.Random(7)
+    values = [int(rng.lognormvariate(11, 1.5)) for _ in range(20_000)]   # ~60 µs median, long tail
+    hist = LatencyHistogram()
+    for ns in values:
+        hist.record(ns)
+    assert hist.percentile(pct) == pytest.approx(_exact(values, pct), rel=1 / SUB_BUCKETS)
+
+
+def test_percentiles_stay_within_observed_range():
+    hist = LatencyHistogram()
+    for ns in (1_000_003, 1_000_007):
+        hist.record(ns)
+    assert hist.percentile(0.1) >= hist.min_ns == 1_000_003
+    assert hist.percentile(100) <= hist.max_ns == 1_000_007
+
+
+def test_merge_equals_recording_everything_once():
+    rng = random.Random(3)
+    a, b, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for i in range(5_000):
+        ns = rng.randrange(1, 10**9)
+        (a if i % 2 else b).record(ns)
+        both.record(ns)
+    a.merge(pickle.loads(pickle.dumps(b)))   # as merged across processes
+    assert a.counts == both.counts
+    assert (a.count, a.total_ns, a.min_ns, a.max_ns) == (both.count, both.total_ns, both.min_ns, both.max_ns)
+    assert a.summary() == both.summary()
+
+
+def test_summary_units():
+    hist = LatencyHistogram()
+    hist.record(2_000_000)
+    out = hist.summary(scale=1e-3, unit="us")
+    assert out["count"] == 1
+    assert out["mean_us"] == 2000.0
+    assert out["p999_us"] == out["max_us"] == 2000.0
@@ -0,0 +1,50 @@
+import time
+
+import pytest
+
+from core.io_engine import MIN_JOB_S, PATTERNS, QueueDepthMatrix, _fit
+
+
+def test_fit_keeps_a_matrix_that_fits():
+    assert _fit(PATTERNS, (1, 4, 32, 128), 16 * MIN_JOB_S) == (PATTERNS, (1, 4, 32, 128))
+
+
+def test_fit_drops_deepest_queue_depths_first():
+    assert _fit(PATTERNS, (1, 4, 32, 128), 8 * MIN_JOB_S) == (PATTERNS, (1, 4))
+    assert _fit(PATTERNS, (1, 4, 32, 128), 4 * MIN_JOB_S) == (PATTERNS, (1,))
+
+
+def test_fit_then_drops_trailing_patterns():
+    assert _fit(PATTERNS, (1, 4), 2 * MIN_JOB_S) == (("randread", "randwrite"), (1,))
+    # Never trims to nothing: one job remains however short the phase.
+    assert _fit(PATTERNS, (1, 4), 0.0) == (("randread",), (1,))
+
+
+def test_rejects_bad_configuration():
+    with pytest.raises(ValueError):
+        QueueDepthMatrix(patterns=("randread", "zigzag"))
+    with pytest.raises(ValueError):
+        QueueDepthMatrix(depths=(0, 4))
+
+
+def test_threads_backend_short_run(tmp_path):
+    engine = QueueDepthMatrix(depths=(1, 4, 32), patterns=("randread", "randwrite"), file_size_mb=4, directory=str(tmp_path))
+    engine.start(duration=2.0)
+    deadline = time.monotonic() + 10
+    while not engine.finished and time.monotonic() < deadline:
+        time.sleep(0.05)
+    engine.stop()
+    result = engine.result()
+
+    assert engine.finished
+    assert result["backend"] == "threads"
+    assert result["open_mode"] in ("direct", "nocache", "fadvise", "buffered")
+    # 2 s fits four 0.5 s jobs, so QD32 is trimmed and reported.
+    assert result["skipped"] == ["randread@qd32", "randwrite@qd32"]
+    for pattern in ("randread", "randwrite"):
+        assert set(result["jobs"][pattern]) == {"qd1", "qd4"}
+        for job in result["jobs"][pattern].values():
+            assert job["ops"] > 0 and job["iops"] > 0
+            assert job["latency"]["count"] == job["ops"]
+    assert engine.live_rates()
+    assert list(tmp_path.iterdir()) == []   # scratch directory removed
@@ -0,0 +1,107 @@
+import time
+
+import pytest
+
+from core.linux_sensors import LinuxSensors
+
+
+def _write(root, rel: str, value) -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"{value}\n")
+
+
+def _proc_stat(root, cpus: list[tuple[int, int]]) -> None:
+    """/proc/stat with (busy, idle) jiffies for the total line and each core."""
+    lines = []
+    for i, (busy, idle) in enumerate(cpus):
+        name = "cpu" if i == 0 else f"cpu{i - 1}"
+        lines.append(f"{name} {busy} 0 0 {idle} 0 0 0 0 0 0")
+    lines.append("intr 0")
+    _write(root, "proc/stat", "\n".join(lines))
+
+
+@pytest.fixture
+def sysfs(tmp_path):
+    hwmon = "sys/class/hwmon"
+    _write(tmp_path, f"{hwmon}/hwmon0/name", "coretemp")
+    _write(tmp_path, f"{hwmon}/hwmon0/temp1_label", "Core 0")
+    _write(tmp_path, f"{hwmon}/hwmon0/temp1_input", 90000)
+    _write(tmp_path, f"{hwmon}/hwmon0/temp2_label", "Package id 0")
+    _write(tmp_path, f"{hwmon}/hwmon0/temp2_input", 72000)
+    _write(tmp_path, f"{hwmon}/hwmon1/name", "amdgpu")
+    _write(tmp_path, f"{hwmon}/hwmon1/temp1_input", 55000)
+    _write(tmp_path, f"{hwmon}/hwmon1/power1_average", 120_500_000)
+    _write(tmp_path, f"{hwmon}/hwmon1/device/gpu_busy_percent", 40)
+
+    rapl = "sys/class/powercap"
+    _write(tmp_path, f"{rapl}/intel-rapl:0/name", "package-0")
+    _write(tmp_path, f"{rapl}/intel-rapl:0/energy_uj", 1_000_000)
+    _write(tmp_path, f"{rapl}/intel-rapl:0/max_energy_range_uj", 2_000_000)
+    _write(tmp_path, f"{rapl}/intel-rapl:0:0/name", "dram")
+    _write(tmp_path, f"{rapl}/intel-rapl:0:0/energy_uj", 500_000)
+    _write(tmp_path, f"{rapl}/intel-rapl:0:1/name", "core")     # neither package nor dram
+    _write(tmp_path, f"{rapl}/intel-rapl:0:1/energy_uj", 0)
+
+    for cpu, khz in enumerate((2_400_000, 3_600_000)):
+        _write(tmp_path, f"sys/devices/system/cpu/cpu{cpu}/cpufreq/scaling_cur_freq", khz)
+    _proc_stat(tmp_path, [(100, 100), (50, 50), (50, 50)])
+    return tmp_path
+
+
+def test_first_sample(sysfs):
+    sensors = LinuxSensors(root=str(sysfs))
+    try:
+        snap = sensors.sample()
+    finally:
+        sensors.close()
+    assert sensors.available is False  # close() released every fd
+    assert snap["cpu_temp"] == 72.0    # the package sensor wins over a hotter core
+    assert snap["cpu_freq"] == 3000
+    assert snap["core_freq_mhz"] == [2400, 3600]
+    assert snap["gpu_temp"] == 55.0
+    assert snap["gpu_power_w"] == 120.5
+    assert snap["gpu_percent"] == 40
+    # Utilisation and power are deltas, so the first sample has neither.
+    assert snap["cpu_percent"] is None and snap["core_percent"] == []
+    assert snap["cpu_power_w"] is None and snap["dram_power_w"] is None
+
+
+def test_deltas_rereads_open_files(sysfs):
+    sensors = LinuxSensors(root=str(sysfs))
+    try:
+        sensors.sample()
+        # Rewrite in place: the sensors re-read the fds they already hold.
+        _proc_stat(sysfs, [(175, 125), (100, 50), (75, 75)])
+        _write(sysfs, "sys/class/powercap/intel-rapl:0/energy_uj", 500_000)   # wrapped
+        _write(sysfs, "sys/class/powercap/intel-rapl:0:0/energy_uj", 600_000)
+        _write(sysfs, "sys/class/hwmon/hwmon0/temp2_input", 81500)
+        time.sleep(0.05)  # long enough that per-zone read skew doesn't matter
+        snap = sensors.sample()
+    finally:
+        sensors.close()
+    assert snap["cpu_percent"] == 75.0
+    assert snap["core_percent"] == [100.0, 50.0]
+    assert snap["cpu_temp"] == 81.5
+    assert snap["cpu_power_w"] > 0       # 1.5 J across the wrap, not negative
+    assert snap["dram_power_w"] > 0
+    assert snap["cpu_power_w"] == pytest.approx(snap["dram_power_w"] * 15, rel=0.05)
+
+
+def test_thermal_zone_fallback(tmp_path):
+    _write(tmp_path, "sys/class/thermal/thermal_zone0/type", "acpitz")
+    _write(tmp_path, "sys/class/thermal/thermal_zone0/temp", 30000)
+    _write(tmp_path, "sys/class/thermal/thermal_zone1/type", "x86_pkg_temp")
+    _write(tmp_path, "sys/class/thermal/thermal_zone1/temp", 64000)
+    sensors = LinuxSensors(root=str(tmp_path))
+    try:
+        assert sensors.sample()["cpu_temp"] == 64.0
+    finally:
+        sensors.close()
+
+
+def test_empty_tree(tmp_path):
+    sensors = LinuxSensors(root=str(tmp_path))
+    assert not sensors.available
+    snap = sensors.sample()
+    assert snap["cpu_temp"] is None and snap["cpu_freq"] is None and snap["gpu_power_w"] is None
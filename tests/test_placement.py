@@ -0,0 +1,70 @@
+import pytest
+
+from core import placement
+
+
+def _topology(packages: int = 2, l3_per_package: int = 2, cores_per_l3: int = 2, threads: int = 2):
+    """CpuInfo rows numbered Linux-style: every core's first thread, then the SMT siblings."""
+    cores = packages * l3_per_package * cores_per_l3
+    infos = []
+    for thread in range(threads):
+        for core in range(cores):
+            package, rest = divmod(core, l3_per_package * cores_per_l3)
+            l3 = core // cores_per_l3 * cores_per_l3   # first core of the domain, as in sysfs
+            infos.append((thread * cores + core, package, rest, l3, thread))
+    return infos
+
+
+@pytest.fixture
+def machine(monkeypatch):
+    infos = _topology()
+    monkeypatch.setattr(placement, "discover_topology", lambda: infos)
+    monkeypatch.setattr(placement, "_available_cpus", lambda: sorted(i[0] for i in infos))
+    return {i[0]: i for i in infos}
+
+
+def test_scatter_alternates_packages_then_l3_then_cores(machine):
+    order = placement._scatter_order(list(machine.values()))
+    domains = [(machine[cpu][1], machine[cpu][3]) for cpu in order[:4]]
+    assert domains == [(0, 0), (1, 4), (0, 2), (1, 6)]
+    # Every core's first thread before any SMT sibling, each CPU exactly once.
+    assert [machine[cpu][4] for cpu in order] == [0] * 8 + [1] * 8
+    assert sorted(order) == sorted(machine)
+
+
+def test_scatter_uneven_packages():
+    infos = [(0, 0, 0, 0, 0), (1, 0, 1, 0, 0), (2, 0, 2, 0, 0), (3, 1, 0, 3, 0)]
+    assert placement._scatter_order(infos) == [0, 3, 1, 2]
+
+
+def test_compact_fills_a_domain_with_siblings_adjacent(machine):
+    assert placement.plan("compact", 4) == [0, 8, 1, 9]
+
+
+def test_physical_skips_smt_siblings(machine):
+    cpus = placement.plan("physical", 10)
+    assert all(machine[cpu][4] == 0 for cpu in cpus)
+    assert cpus[8:] == cpus[:2]   # cycles once every core has a worker
+
+
+def test_none_and_explicit(machine):
+    assert placement.plan("none", 3) == [None, None, None]
+    assert placement.plan("explicit", 5, [3, 7]) == [3, 7, 3, 7, 3]
+
+
+def test_explicit_rejects_cpus_outside_affinity(machine):
+    with pytest.raises(ValueError, match=r"\[16, 99\]"):
+        placement.plan("explicit", 2, [0, 16, 99])
+    with pytest.raises(ValueError):
+        placement.plan("explicit", 2, [])
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError, match="unknown placement policy"):
+        placement.plan("spread", 1)
+
+
+def test_summarize(machine):
+    assert placement.summarize(list(machine.values())) == {
+        "logical_cpus": 16, "physical_cores": 8, "packages": 2, "l3_domains": 4,
+    }
@@ -0,0 +1,82 @@
+import plistlib
+import time
+
+import pytest
+
+from core.powermetrics import PowermetricsStream, parse_sample
+
+
+def _document(cpu_mw: float, gpu_mw: float, elapsed_ns: int = 1_000_000_000) -> bytes:
+    return plistlib.dumps({
+        "elapsed_ns":       elapsed_ns,
+        "thermal_pressure": "Nominal",
+        "processor":        {"cpu_power": cpu_mw, "gpu_power": gpu_mw},
+        "gpu":              {"idle_ratio": 0.25, "freq_hz": 1296.0},
+        "smc":              {"cpu_die": 61.5, "gpu_die": 48.0},
+    })
+
+
+@pytest.fixture
+def recording(tmp_path):
+    """A capture like `powermetrics -f plist`: NUL-terminated plist documents."""
+    path = tmp_path / "powermetrics.plist"
+    docs = [_document(4000.0 + 1000 * i, 1500.0, elapsed_ns=500_000_000) for i in range(3)]
+    path.write_bytes(b"\0".join(docs) + b"\0")
+    return path
+
+
+def _wait_for(stream: PowermetricsStream, samples: int, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while stream.samples < samples and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_parse_apple_silicon_milliwatts():
+    reading = parse_sample(plistlib.loads(_document(4200.0, 1500.0)))
+    assert reading["cpu_power_w"] == 4.2
+    assert reading["gpu_power_w"] == 1.5
+    assert reading["gpu_percent"] == 75.0
+    assert reading["gpu_freq"] == 1296
+    assert reading["cpu_temp"] == 61.5
+    assert reading["gpu_temp"] == 48.0
+    assert reading["thermal_pressure"] == "Nominal"
+
+
+def test_parse_intel_package_watts():
+    reading = parse_sample({"processor": {"package_watts": 28.5}, "smc": {"gpu_watts": 3.25, "cpu_die": 90.0}})
+    assert reading["cpu_power_w"] == 28.5
+    assert reading["gpu_power_w"] == 3.25
+    assert reading["cpu_temp"] == 90.0
+
+
+def test_parse_missing_sections():
+    reading = parse_sample({})
+    assert all(value is None for value in reading.values())
+
+
+def test_replay_parses_every_document(recording):
+    stream = PowermetricsStream(interval_ms=5, replay=str(recording))
+    assert stream.start()
+    try:
+        _wait_for(stream, 3)
+    finally:
+        stream.stop()
+    assert stream.samples >= 3
+    assert stream.latest()["gpu_power_w"] == 1.5
+    # The documents are 4, 5 and 6 W for 0.5 s each, replayed in a loop.
+    energy = stream.energy_j()
+    assert energy["cpu"] == pytest.approx(sum((2.0, 2.5, 3.0)[i % 3] for i in range(stream.samples)))
+    assert energy["gpu"] == pytest.approx(0.75 * stream.samples)
+
+
+def test_replay_skips_garbled_documents(tmp_path):
+    path = tmp_path / "garbled.plist"
+    path.write_bytes(b"<?xml not a plist\0" + _document(2000.0, 500.0) + b"\0")
+    stream = PowermetricsStream(interval_ms=5, replay=str(path))
+    stream.start()
+    try:
+        _wait_for(stream, 1)
+    finally:
+        stream.stop()
+    assert stream.latest()["cpu_power_w"] == 2.0
+    assert not stream.running
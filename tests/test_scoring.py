@@ -0,0 +1,8 @@
+from utils.scoring import score_report
+
+
+def test_scaling_needs_two_measured_counts():
+    one = {"results": {"scaling": {"measured_counts": [1], "mean_efficiency": None}}}
+    assert "scaling" not in score_report(one)["scores"]
+    two = {"results": {"scaling": {"measured_counts": [1, 2], "mean_efficiency": 0.9}}}
+    assert score_report(two)["scores"]["scaling"] > 0
@@ -0,0 +1,87 @@
+import itertools
+import math
+import time
+
+import pytest
+
+from core.steady_state import SteadyStateMonitor, interval
+
+
+def test_interval_uses_student_t():
+    mean, half, cv = interval([10.0, 12.0, 14.0])   # sd 2, df 2
+    assert mean == 12.0
+    assert half == pytest.approx(4.303 * 2 / math.sqrt(3))
+    assert cv == pytest.approx(2 / 12)
+
+
+def test_interval_between_table_rows_takes_the_next_smaller_df():
+    rates = [1.0, 3.0] * 6                       # n 12, df 11 → the df 12 value
+    sd = math.sqrt(12 / 11)
+    assert interval(rates)[1] == pytest.approx(2.179 * sd / math.sqrt(12))
+
+
+def test_interval_beyond_the_table_is_normal():
+    rates = [1.0, 3.0] * 20                      # df 39
+    sd = math.sqrt(40 / 39)
+    assert interval(rates)[1] == pytest.approx(1.96 * sd / math.sqrt(40))
+
+
+def test_interval_degenerate_inputs():
+    assert interval([]) == (0.0, 0.0, 0.0)
+    assert interval([5.0]) == (5.0, math.inf, math.inf)
+    assert interval([0.0, 0.0])[2] == math.inf
+
+
+def _wait(monitor: SteadyStateMonitor, timeout: float) -> None:
+    deadline = time.perf_counter() + timeout
+    while not monitor.finished and time.perf_counter() < deadline:
+        time.sleep(0.01)
+
+
+def test_steady_counter_stops_early():
+    calls = []
+    t0 = time.perf_counter()
+    monitor = SteadyStateMonitor(
+        lambda: (time.perf_counter() - t0) * 1000,  # exactly 1000/s
+        nominal_s=10.0, cap_s=20.0, on_finish=lambda: calls.append(1), window_s=0.05,
+    )
+    monitor.start()
+    _wait(monitor, 5.0)
+    monitor.stop()
+    summary = monitor.summary()
+    assert summary["converged"] and summary["stopped_early"] and not summary["extended"]
+    assert summary["windows"] >= 5   # the rolling tail fills first
+    assert summary["mean_rate"] == pytest.approx(1000.0, rel=0.01)
+    assert summary["cv"] <= 0.03
+    assert calls == [1]
+
+
+def test_noisy_counter_runs_to_the_cap():
+    steps = itertools.cycle([1, 100])
+    total = [0]
+
+    def counter() -> float:
+        total[0] += next(steps)
+        return total[0]
+
+    calls = []
+    monitor = SteadyStateMonitor(counter, nominal_s=0.2, cap_s=0.5, on_finish=lambda: calls.append(1), window_s=0.05)
+    monitor.start()
+    _wait(monitor, 5.0)
+    monitor.stop()
+    summary = monitor.summary()
+    assert not summary["converged"] and not summary["stopped_early"]
+    assert summary["extended"]
+    assert 0.5 <= summary["ran_s"] < 1.0
+    assert calls == [1]
+
+
+def test_stop_before_finishing_skips_on_finish():
+    calls = []
+    monitor = SteadyStateMonitor(lambda: 0.0, nominal_s=10.0, cap_s=10.0, on_finish=lambda: calls.append(1), window_s=0.05)
+    monitor.start()
+    time.sleep(0.12)
+    monitor.stop()
+    assert monitor.finished
+    assert not monitor.summary()["converged"]
+    assert calls == []
@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from core import thermal
+from core.thermal import ThermalGuard, analyse
+
+DT = 0.1
+
+
+def _t(seconds: float) -> np.ndarray:
+    return np.arange(0.0, seconds, DT)
+
+
+def test_plateau_at_the_limit_is_an_event():
+    t = _t(10.0)
+    temp = np.where(t < 3.0, 60.0 + 10.0 * t, 90.0 + 0.3 * np.sin(t * 7))
+    freq = np.full(t.size, 3000.0)
+    events, _ = thermal._events(t, freq, temp, np.full(t.size, np.nan))
+    assert [e["type"] for e in events] == ["temperature_plateau"]
+    plateau = events[0]
+    assert plateau["start_s"] == pytest.approx(3.0, abs=0.2)
+    assert plateau["end_s"] == pytest.approx(t[-1])
+    assert plateau["temp_c"] == pytest.approx(90.0, abs=0.5)
+
+
+def test_plateau_below_the_floor_is_not_an_event():
+    t = _t(10.0)
+    events, _ = thermal._events(t, np.full(t.size, 3000.0), np.full(t.size, 60.0), np.full(t.size, np.nan))
+    assert events == []
+
+
+def test_throttle_is_a_frequency_drop_and_a_power_cap():
+    t = _t(10.0)
+    freq = np.where(t < 4.0, 3000.0, 2400.0)
+    power = np.where(t < 4.0, 40.0, 45.0)   # pinned at its peak once the clock drops
+    events, burst = thermal._events(t, freq, np.full(t.size, 70.0), power)
+    assert burst == 3000.0
+    drop, cap = events
+    assert drop == {"type": "frequency_drop", "start_s": 4.0, "end_s": 9.9, "min_mhz": 2400, "from_mhz": 3000}
+    assert cap == {"type": "power_cap", "start_s": 4.0, "end_s": 9.9, "watts": 45.0}
+
+
+def test_short_series_and_short_dips_are_ignored():
+    t = _t(1.5)   # shorter than PLATEAU_S, and hot enough to plateau if it were longer
+    events, _ = thermal._events(t, np.full(t.size, 3000.0), np.full(t.size, 95.0), np.full(t.size, np.nan))
+    assert events == []
+
+    t = _t(10.0)
+    freq = np.where((t >= 5.0) & (t < 5.3), 2000.0, 3000.0)   # under MIN_EVENT_S
+    events, _ = thermal._events(t, freq, np.full(t.size, 60.0), np.full(t.size, np.nan))
+    assert events == []
+
+
+def test_analyse_reports_each_phase():
+    t = _t(20.0)
+    freq = np.where(t < 14.0, 3000.0, 2400.0)   # the second phase throttles 4 s in
+    series = {
+        "t":           t,
+        "cpu_freq":    freq,
+        "cpu_temp":    np.full(t.size, 70.0),
+        "cpu_power_w": np.full(t.size, np.nan),
+        "phase_names": np.array(["cpu", "io"]),
+        "phase_start": np.array([0.0, 10.0]),
+        "phase_end":   np.array([10.0, 20.0]),
+    }
+    ops = [100.0] * 4 + [80.0] * 6   # one bucket per second, slowing with the clock
+    throughput = {"io": {"interval_s": 1.0, "ops_s": {"fft": ops}}}
+    trips = {"io": {"temp_c": 96.0, "at_s": 8.0}}
+
+    out = analyse(series, throughput, trips, cutoff_c=95.0)
+    assert out["cutoff_c"] == 95.0
+    assert out["tripped"] == ["io"]
+
+    cpu = out["phases"]["cpu"]
+    assert cpu["events"] == []
+    assert not cpu["cutoff_hit"]
+    assert cpu["frequency"]["sustained_burst"] == 1.0
+    assert "throughput" not in cpu
+
+    io = out["phases"]["io"]
+    assert io["cutoff_hit"] and io["cutoff"] == trips["io"]
+    assert [e["type"] for e in io["events"]] == ["frequency_drop"]
+    assert io["events"][0]["start_s"] == pytest.approx(4.0)
+    assert io["frequency"]["sustained_burst"] == 0.8
+    fft = io["throughput"]["fft"]
+    assert fft["sustained_burst"] == 0.8
+    assert fft["corr_freq"] == pytest.approx(1.0)
+    assert fft["corr_temp"] is None   # constant temperature says nothing
+
+
+class _Telemetry:
+    def __init__(self, **snapshot) -> None:
+        self.snapshot = snapshot
+
+    def latest_snapshot(self) -> dict:
+        return dict(self.snapshot)
+
+
+def test_guard_trips_on_the_hottest_sensor_and_records_the_first_trip():
+    tel = _Telemetry(cpu_temp=80.0, gpu_temp=None)
+    guard = ThermalGuard(tel, cutoff_c=90.0)
+    assert not guard.tripped("cpu", 1.0)
+    tel.snapshot = {"cpu_temp": 85.0, "gpu_temp": 91.5}
+    assert guard.tripped("cpu", 2.0)
+    tel.snapshot = {"cpu_temp": 99.0}
+    assert guard.tripped("cpu", 3.0)
+    assert guard.trips == {"cpu": {"temp_c": 91.5, "at_s": 2.0}}
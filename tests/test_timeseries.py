@@ -0,0 +1,94 @@
+import json
+
+import numpy as np
+import pytest
+
+from core.timeseries import TelemetrySeries
+from utils.report import save_report
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.t = 0.0
+
+    def __call__(self) -> float:
+        return self.t
+
+
+@pytest.fixture
+def series():
+    s = TelemetrySeries(capacity=4)
+    s.now = _Clock()
+    return s
+
+
+def _feed(series: TelemetrySeries, *temps: float, step: float = 1.0) -> None:
+    for temp in temps:
+        series.append({"cpu_temp": temp, "cpu_percent": None, "core_percent": [temp, temp + 1]})
+        series.now.t += step
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        TelemetrySeries(capacity=0)
+
+
+def test_ring_buffer_keeps_the_newest_rows_in_order(series):
+    _feed(series, 10, 11, 12)
+    assert series.arrays()["cpu_temp"].tolist() == [10, 11, 12]
+
+    _feed(series, 13, 14, 15)
+    data = series.arrays()
+    assert series.samples == 4 and series.dropped == 2
+    assert data["t"].tolist() == [2.0, 3.0, 4.0, 5.0]
+    assert data["cpu_temp"].tolist() == [12, 13, 14, 15]
+    assert data["core_percent"][:, 1].tolist() == [13, 14, 15, 16]
+    assert np.isnan(data["cpu_percent"]).all()   # None and missing become NaN
+
+
+def test_phase_markers_close_the_previous_phase(series):
+    series.mark("cpu")
+    series.now.t = 5.0
+    series.mark("io")
+    series.now.t = 8.0
+    data = series.arrays()   # the open phase ends "now"
+    assert data["phase_names"].tolist() == ["cpu", "io"]
+    assert data["phase_start"].tolist() == [0.0, 5.0]
+    assert data["phase_end"].tolist() == [5.0, 8.0]
+
+    series.end()
+    series.now.t = 20.0
+    assert series.arrays()["phase_end"].tolist() == [5.0, 8.0]
+
+
+def test_npz_round_trip(series, tmp_path):
+    series.mark("cpu")
+    _feed(series, 70, 71, 72, 73, 74)
+    series.end()
+    arrays = series.arrays()
+
+    path = save_report({"results": {}}, tmp_path / "run.json", series=arrays)
+    assert json.loads(path.read_text())["telemetry_series"]["file"] == "run.npz"
+    with np.load(tmp_path / "run.npz") as loaded:
+        assert set(loaded.files) == set(arrays)
+        for name, column in arrays.items():
+            np.testing.assert_array_equal(loaded[name], column)
+            assert loaded[name].dtype == column.dtype
+
+
+def test_summary_per_phase():
+    series = TelemetrySeries(capacity=64)
+    series.now = _Clock()
+    series.mark("cpu")
+    _feed(series, *range(60, 70))   # t 0..9
+    series.mark("io")
+    _feed(series, 50, 50)           # t 10, 11
+    series.end()
+
+    summary = series.summary()
+    cpu = summary["cpu"]
+    assert cpu["samples"] == 10 and cpu["duration_s"] == 10.0
+    assert list(cpu["metrics"]) == ["cpu_temp"]   # columns without data are left out
+    assert cpu["metrics"]["cpu_temp"] == {"min": 60.0, "mean": 64.5, "max": 69.0, "p50": 64.5, "p95": 68.55, "p99": 68.91}
+    assert summary["io"]["samples"] == 2
+    assert summary["io"]["metrics"]["cpu_temp"]["max"] == 50.0
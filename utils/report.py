@@ -5,16 +5,30 @@ import os
 import time
 from pathlib import Path
 
+import numpy as np
+
 _REPORTS_DIR = Path("reports")
 _VERSION     = "1.1.1"
 
 
-def save_report(report: dict) -> Path:
-    _REPORTS_DIR.mkdir(exist_ok=True)
-    ts    = time.strftime("%Y-%m-%d_%H-%M-%S")
-    base  = _REPORTS_DIR / f"chronosbenchx_{ts}"
-    json_path = base.with_suffix(".json")
-    txt_path  = base.with_suffix(".txt")
+def save_report(report: dict, path: str | Path | None = None, series: dict[str, np.ndarray] | None = None) -> Path:
+    """Write *report* as JSON plus a .txt summary beside it; returns the JSON path.
+
+    Without *path* both land in reports/ under a timestamped name. *series*
+    (telemetry columns) goes to a compressed .npz beside them, and the
+    report's telemetry_series section records its file name.
+    """
+    if path is None:
+        ts   = time.strftime("%Y-%m-%d_%H-%M-%S")
+        path = _REPORTS_DIR / f"chronosbenchx_{ts}.json"
+    json_path = Path(path)
+    txt_path  = json_path.with_suffix(".txt")
+    json_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if series is not None:
+        npz_path = json_path.with_suffix(".npz")
+        np.savez_compressed(npz_path, **series)
+        report.setdefault("telemetry_series", {})["file"] = npz_path.name
 
     with json_path.open("w", encoding="utf-8") as f:
         json.dump(report, f, indent=2)
@@ -22,7 +36,6 @@ def save_report(report: dict) -> Path:
     with txt_path.open("w", encoding="utf-8") as f:
         f.write(_format(report))
 
-    print(f"Report saved → {json_path}")
     return json_path
 
 
@@ -44,6 +57,9 @@ def _format(report: dict) -> str:
     for name, value in component_scores.items():
         lines.append(f"  {name:<12} {value:>5} / 2000")
 
+    for name, value in scores.get("synthetic", {}).items():
+        lines.append(f"  {name:<12} {value:>5} / 2000  (synthetic, not in composite)")
+
     lines += [
         "",
         f"  {'composite':<12} {scores.get('composite', 0):>5} / 2000",
@@ -4,19 +4,57 @@ Each subsystem contributes one component score, also capped at 2000.
 The composite is a weighted average, not a flat mean, so a slow GPU
 on a machine that has one doesn't tank the whole result.
 
-CPU  — total_ops across all workers, normalised against a baseline
-IO   — combined read+write throughput (MB/s)
+CPU  — total_ops across all workers, normalised against a baseline, plus
+       a bonus for primes/s from each sieve engine
+IO   — combined read+write throughput (MB/s), plus an fsync bonus, minus
+       a penalty for p99.9 latency above baseline per operation type; a
+       multi-device run scores each volume and takes the mean
 GPU  — passes per second from the metal/cuda worker
 MIXED— combined cpu+io ops from the mixed phase, rewards sustained
        performance under thermal pressure
+SCALING— mean parallel efficiency at full core count from the optional
+       core-scaling sweep, scored apart from raw throughput; excluded
+       when the sweep measured fewer than two process counts
+EFFICIENCY— work per joule (CPU ops/J, I/O MB/J, GPU passes/J) from the
+       energy section; excluded when no energy source was available. With
+       the fake source the joules are synthetic (constant watts × time),
+       so the score is reported under "synthetic" and left out of the
+       composite
 """
 
 from __future__ import annotations
 
-_CPU_BASELINE  = 5_000    # total_ops a mid-range machine should hit
+# total_ops a mid-range machine should hit. Kept when sieve primes left
+# total_ops for their own bonus, so CPU scores break there (see README).
+_CPU_BASELINE  = 5_000
 _IO_BASELINE   = 500.0    # MB/s read+write combined, modern SSD ballpark
 _GPU_BASELINE  = 20.0     # passes/s on MPS M1; CUDA will exceed this
 _MIXED_BASELINE = 3_000   # total_ops under combined thermal load
+_SCALING_BASELINE = 0.75  # mean parallel efficiency at all logical cores
+
+# work per joule of package (or GPU) energy
+_EFFICIENCY_BASELINES = {
+    "cpu": 1.0,   # ops/J
+    "io":  8.0,   # MB/J
+    "gpu": 1.0,   # passes/J
+}
+
+# p99.9 latency (µs) per I/O op type before the tail penalty kicks in
+_IO_TAIL_BASELINES_US = {
+    "random_read":  1_000.0,
+    "random_write": 1_000.0,
+    "fsync":        5_000.0,
+    "create":       1_000.0,
+    "unlink":       1_000.0,
+}
+_IO_TAIL_PENALTY_PER_OP = 100   # max points lost to one op type
+_IO_TAIL_PENALTY_MAX    = 300   # max points lost to tail latency overall
+
+# primes/s summed across processes, per sieve engine
+_SIEVE_BASELINES = {
+    "sieve_race":        5_000_000.0,  # NumPy odd-only segmented engine
+    "sieve_interpreter":   200_000.0,  # pure-Python kernel
+}
 
 _MAX = 2000
 
@@ -27,7 +65,13 @@ def _clamp(value: float) -> int:
 
 def _cpu_score(cpu: dict) -> int:
     total_ops = cpu.get("total_ops", 0)
-    return _clamp((total_ops / _CPU_BASELINE) * 1000)
+    # Bonus for sieve throughput — each engine is scored on its own baseline
+    sieve = cpu.get("sieve") or {}
+    sieve_bonus = sum(
+        min(sieve.get(kind, {}).get("primes_per_s", 0.0) / baseline * 100, 100)
+        for kind, baseline in _SIEVE_BASELINES.items()
+    )
+    return _clamp((total_ops / _CPU_BASELINE) * 1000 + sieve_bonus)
 
 
 def _io_score(io: dict) -> int:
@@ -37,7 +81,18 @@ def _io_score(io: dict) -> int:
     # Bonus for fsync throughput — rewards drives with low write latency
     fsyncs      = io.get("fsyncs", 0)
     fsync_bonus = min(fsyncs / 500, 200)
-    return _clamp((combined / _IO_BASELINE) * 1000 + fsync_bonus)
+    return _clamp((combined / _IO_BASELINE) * 1000 + fsync_bonus - _io_tail_penalty(io))
+
+
+def _io_tail_penalty(io: dict) -> float:
+    # 50 points per multiple of the baseline p99.9, capped per op and overall
+    latency = io.get("latency") or {}
+    penalty = 0.0
+    for op, baseline in _IO_TAIL_BASELINES_US.items():
+        p999 = latency.get(op, {}).get("p999_us")
+        if p999 and p999 > baseline:
+            penalty += min((p999 / baseline - 1) * 50, _IO_TAIL_PENALTY_PER_OP)
+    return min(penalty, _IO_TAIL_PENALTY_MAX)
 
 
 def _gpu_score(gpu: dict) -> int | None:
@@ -60,6 +115,37 @@ def _mixed_score(mixed: dict) -> int:
     return _clamp(((cpu_norm + io_norm) / 2) * 1000)
 
 
+def _scaling_score(scaling: dict) -> int | None:
+    # None when fewer than two process counts were measured (one CPU, or a
+    # pool of one): efficiency is then 1.0 by definition and says nothing.
+    efficiency = scaling.get("mean_efficiency")
+    if efficiency is None:
+        return None
+    return _clamp((efficiency / _SCALING_BASELINE) * 1000)
+
+
+def _efficiency_score(eff: dict) -> int | None:
+    # Mean of each available metric against its baseline
+    values = {
+        "cpu": (eff.get("cpu") or {}).get("ops_per_j"),
+        "io":  (eff.get("io")  or {}).get("mb_per_j"),
+        "gpu": (eff.get("gpu") or {}).get("passes_per_j"),
+    }
+    norms = [v / _EFFICIENCY_BASELINES[k] for k, v in values.items() if v]
+    if not norms:
+        return None
+    return _clamp(sum(norms) / len(norms) * 1000)
+
+
+def _interval(score: int, section: dict) -> dict | None:
+    """95% interval on a score that scales with the phase's mean throughput."""
+    pct = (section.get("steady_state") or {}).get("ci95_pct")
+    if pct is None:
+        return None
+    spread = score * pct / 100
+    return {"low": _clamp(score - spread), "high": _clamp(score + spread), "ci95_pct": pct}
+
+
 def score_report(report: dict) -> dict:
     results = report.get("results", {})
     scores: dict[str, int] = {}
@@ -67,8 +153,14 @@ def score_report(report: dict) -> dict:
     if "cpu" in results:
         scores["cpu"] = _cpu_score(results["cpu"])
 
+    device_scores: dict[str, int] = {}
     if "io" in results:
-        scores["io"] = _io_score(results["io"])
+        devices = results["io"].get("devices")
+        if devices:
+            device_scores = {path: _io_score(io) for path, io in devices.items()}
+            scores["io"] = _clamp(sum(device_scores.values()) / len(device_scores))
+        else:
+            scores["io"] = _io_score(results["io"])
 
     if "mixed" in results:
         gpu_raw = results["mixed"].get("gpu", {})
@@ -77,9 +169,37 @@ def score_report(report: dict) -> dict:
             scores["gpu"] = gpu
         scores["mixed"] = _mixed_score(results["mixed"])
 
-    weights = {"cpu": 2.0, "io": 1.0, "gpu": 1.5, "mixed": 1.5}
+    if "scaling" in results:
+        scaling = _scaling_score(results["scaling"])
+        if scaling is not None:
+            scores["scaling"] = scaling
+
+    energy     = report.get("energy") or {}
+    efficiency = _efficiency_score(energy.get("efficiency") or {})
+    synthetic: dict[str, int] = {}
+    if efficiency is not None:
+        if energy.get("source") == "fake":
+            synthetic["efficiency"] = efficiency
+        else:
+            scores["efficiency"] = efficiency
+
+    intervals: dict[str, dict] = {}
+    for key in ("cpu", "io"):
+        if key in scores:
+            ci = _interval(scores[key], results[key])
+            if ci is not None:
+                intervals[key] = ci
+
+    weights = {"cpu": 2.0, "io": 1.0, "gpu": 1.5, "mixed": 1.5, "scaling": 1.0, "efficiency": 1.0}
     total_weight = sum(weights[k] for k in scores if k in weights)
     weighted_sum = sum(scores[k] * weights.get(k, 1.0) for k in scores)
     composite    = _clamp(weighted_sum / total_weight) if total_weight > 0 else 0
 
-    return {"scores": scores, "composite": composite}
+    out = {"scores": scores, "composite": composite}
+    if intervals:
+        out["intervals"] = intervals
+    if device_scores:
+        out["io_devices"] = device_scores
+    if synthetic:
+        out["synthetic"] = synthetic
+    return out